@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
 from hwtest_core.types.streaming import StreamData, StreamSchema
 
@@ -160,6 +160,40 @@ class NatsStreamPublisher:
         await self._connection.jetstream.publish(subject, payload)
         logger.debug("Published %d samples to %s", data.sample_count, subject)
 
+    async def publish_many(self, batch: Sequence[StreamData]) -> None:
+        """Publish several data messages, awaiting their acknowledgements together.
+
+        Messages are sent in order; only the JetStream acks are awaited
+        concurrently, so a batch costs roughly one round trip instead of one
+        per message.
+
+        Args:
+            batch: The data messages to publish. Each schema_id must match
+                   this publisher's schema.
+
+        Raises:
+            NatsConnectionError: If not connected to NATS.
+            ValueError: If any schema_id doesn't match the publisher's schema.
+        """
+        if not self._running:
+            raise NatsConnectionError("Publisher is not running")
+
+        schema_id = self._schema.schema_id
+        for data in batch:
+            if data.schema_id != schema_id:
+                raise ValueError(
+                    f"Schema ID mismatch: data has {data.schema_id:#x}, " f"expected {schema_id:#x}"
+                )
+
+        if self._connection is None:
+            raise NatsConnectionError("Not connected to NATS")
+
+        subject = self._config.get_data_subject(self._schema.source_id)
+        js = self._connection.jetstream
+
+        await asyncio.gather(*(js.publish(subject, data.to_bytes(self._schema)) for data in batch))
+        logger.debug("Published batch of %d messages to %s", len(batch), subject)
+
     async def _publish_schema(self) -> None:
         """Publish a schema message."""
         if self._connection is None:
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING, Any, AsyncIterator
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable
 
 from hwtest_core.types.common import SourceId
 from hwtest_core.types.streaming import MSG_TYPE_DATA, MSG_TYPE_SCHEMA, StreamData, StreamSchema
@@ -67,6 +67,11 @@ class NatsStreamSubscriber:
         self._subscription: Any = None
         self._data_queue: asyncio.Queue[StreamData] = asyncio.Queue()
         self._receive_task: asyncio.Task[None] | None = None
+        # Message handlers keyed by the message type byte
+        self._handlers: dict[int, Callable[[bytes], Awaitable[None]]] = {
+            MSG_TYPE_SCHEMA: self._handle_schema_message,
+            MSG_TYPE_DATA: self._handle_data_message,
+        }
 
     @property
     def schema(self) -> StreamSchema | None:
@@ -220,15 +225,12 @@ class NatsStreamSubscriber:
         if not data:
             return
 
-        # Determine message type from first byte
-        msg_type = data[0]
-
-        if msg_type == MSG_TYPE_SCHEMA:
-            await self._handle_schema_message(data)
-        elif msg_type == MSG_TYPE_DATA:
-            await self._handle_data_message(data)
+        # Dispatch on message type from first byte
+        handler = self._handlers.get(data[0])
+        if handler is not None:
+            await handler(data)
         else:
-            logger.warning("Unknown message type: %d", msg_type)
+            logger.warning("Unknown message type: %d", data[0])
 
         # Acknowledge the message
         try:
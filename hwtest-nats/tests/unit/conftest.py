@@ -0,0 +1,36 @@
+"""Shared fixtures for hwtest-nats unit tests."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from hwtest_nats.connection import NatsConnection
+
+
+def _create_mock_connection() -> MagicMock:
+    """Create a mock NATS connection usable by publishers and subscribers."""
+    conn = MagicMock(spec=NatsConnection)
+    conn.is_connected = True
+    conn.connect = AsyncMock()
+    conn.disconnect = AsyncMock()
+    conn.ensure_stream = AsyncMock()
+
+    mock_sub = MagicMock()
+    mock_sub.unsubscribe = AsyncMock()
+
+    mock_js = MagicMock()
+    mock_js.publish = AsyncMock()
+    mock_js.subscribe = AsyncMock(return_value=mock_sub)
+    conn.jetstream = mock_js
+
+    return conn
+
+
+@pytest.fixture
+def mock_connection() -> MagicMock:
+    """Fresh mock NATS connection for each test.
+
+    Not shared between tests, so return values, side effects and replaced
+    attributes set up by one test cannot leak into another.
+    """
+    return _create_mock_connection()
@@ -1,6 +1,6 @@
 """Unit tests for telemetry monitor."""
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -11,7 +11,6 @@ from hwtest_core.types.telemetry import TelemetryValue, ValueQuality
 from hwtest_core.types.threshold import StateThresholds, Threshold, ThresholdBound
 
 from hwtest_nats.config import NatsConfig
-from hwtest_nats.connection import NatsConnection
 from hwtest_nats.monitor import TelemetryMonitor
 
 
@@ -23,22 +22,6 @@ class TestTelemetryMonitor:
         """Create a test configuration."""
         return NatsConfig(servers=("nats://localhost:4222",))
 
-    @pytest.fixture
-    def mock_connection(self) -> MagicMock:
-        """Create a mock NATS connection."""
-        conn = MagicMock(spec=NatsConnection)
-        conn.is_connected = True
-        conn.connect = AsyncMock()
-        conn.disconnect = AsyncMock()
-        conn.ensure_stream = AsyncMock()
-
-        mock_js = MagicMock()
-        mock_js.publish = AsyncMock()
-        mock_js.subscribe = AsyncMock()
-        conn.jetstream = mock_js
-
-        return conn
-
     @pytest.fixture
     def ambient_state(self) -> EnvironmentalState:
         """Create an ambient state."""
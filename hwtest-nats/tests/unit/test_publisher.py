@@ -10,7 +10,7 @@ from hwtest_core.types.streaming import StreamData, StreamField, StreamSchema
 # DataType uses F64 not FLOAT64
 
 from hwtest_nats.config import NatsConfig
-from hwtest_nats.connection import NatsConnection, NatsConnectionError
+from hwtest_nats.connection import NatsConnectionError
 from hwtest_nats.publisher import NatsStreamPublisher
 
 
@@ -46,20 +46,6 @@ class TestNatsStreamPublisher:
             samples=((3.3, 0.1), (3.31, 0.11)),
         )
 
-    @pytest.fixture
-    def mock_connection(self) -> MagicMock:
-        """Create a mock NATS connection."""
-        conn = MagicMock(spec=NatsConnection)
-        conn.is_connected = True
-        conn.ensure_stream = AsyncMock()
-        conn.disconnect = AsyncMock()
-
-        mock_js = MagicMock()
-        mock_js.publish = AsyncMock()
-        conn.jetstream = mock_js
-
-        return conn
-
     def test_schema_property(self, config: NatsConfig, schema: StreamSchema) -> None:
         """Test schema property."""
         publisher = NatsStreamPublisher(config, schema)
@@ -187,6 +173,66 @@ class TestNatsStreamPublisher:
 
         await publisher.stop()
 
+    async def test_publish_many(
+        self,
+        config: NatsConfig,
+        schema: StreamSchema,
+        sample_data: StreamData,
+        mock_connection: MagicMock,
+    ) -> None:
+        """Test publishing a batch of data messages in order."""
+        publisher = NatsStreamPublisher(config, schema, connection=mock_connection)
+        await publisher.start()
+        mock_connection.jetstream.publish.reset_mock()  # Ignore the initial schema broadcast
+
+        later_data = StreamData(
+            schema_id=schema.schema_id,
+            timestamp_ns=2000000000,
+            period_ns=1000000,
+            samples=((3.4, 0.2),),
+        )
+        await publisher.publish_many([sample_data, later_data])
+
+        calls = mock_connection.jetstream.publish.call_args_list
+        data_calls = [c for c in calls if c[0][0] == "telemetry.test_sensor.data"]
+        assert [c[0][1] for c in data_calls] == [
+            sample_data.to_bytes(schema),
+            later_data.to_bytes(schema),
+        ]
+
+        await publisher.stop()
+
+    async def test_publish_many_schema_mismatch(
+        self,
+        config: NatsConfig,
+        schema: StreamSchema,
+        sample_data: StreamData,
+        mock_connection: MagicMock,
+    ) -> None:
+        """Test a batch with a mismatched schema publishes nothing."""
+        publisher = NatsStreamPublisher(config, schema, connection=mock_connection)
+        await publisher.start()
+        mock_connection.jetstream.publish.reset_mock()
+
+        wrong_data = StreamData(
+            schema_id=0xDEADBEEF,
+            timestamp_ns=1000000000,
+            period_ns=1000000,
+            samples=((1.0,),),
+        )
+
+        with pytest.raises(ValueError, match="Schema ID mismatch"):
+            await publisher.publish_many([sample_data, wrong_data])
+
+        data_calls = [
+            c
+            for c in mock_connection.jetstream.publish.call_args_list
+            if c[0][0] == "telemetry.test_sensor.data"
+        ]
+        assert not data_calls
+
+        await publisher.stop()
+
     async def test_context_manager(
         self, config: NatsConfig, schema: StreamSchema, mock_connection: MagicMock
     ) -> None:
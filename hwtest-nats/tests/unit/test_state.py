@@ -1,40 +1,38 @@
 """Unit tests for NATS state management."""
 
 import asyncio
+from collections.abc import AsyncIterator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from hwtest_core.types.common import StateId
-from hwtest_core.types.state import EnvironmentalState
+from hwtest_core.types.common import StateId, Timestamp
+from hwtest_core.types.state import EnvironmentalState, StateTransition
 
 from hwtest_nats.config import NatsConfig
-from hwtest_nats.connection import NatsConnection, NatsConnectionError
+from hwtest_nats.connection import NatsConnectionError
 from hwtest_nats.state import NatsStatePublisher, NatsStateSubscriber, StateError
 
 
-class TestNatsStatePublisher:
-    """Tests for NatsStatePublisher."""
+@pytest.fixture
+def config() -> NatsConfig:
+    """Create a test configuration."""
+    return NatsConfig(servers=("nats://localhost:4222",))
 
-    @pytest.fixture
-    def config(self) -> NatsConfig:
-        """Create a test configuration."""
-        return NatsConfig(servers=("nats://localhost:4222",))
 
-    @pytest.fixture
-    def mock_connection(self) -> MagicMock:
-        """Create a mock NATS connection."""
-        conn = MagicMock(spec=NatsConnection)
-        conn.is_connected = True
-        conn.connect = AsyncMock()
-        conn.disconnect = AsyncMock()
-        conn.ensure_stream = AsyncMock()
+@pytest.mark.parametrize("cls", [NatsStatePublisher, NatsStateSubscriber])
+async def test_context_manager(
+    cls: type[NatsStatePublisher] | type[NatsStateSubscriber],
+    config: NatsConfig,
+    mock_connection: MagicMock,
+) -> None:
+    """Test async context manager for both publisher and subscriber."""
+    async with cls(config, connection=mock_connection) as client:
+        assert client.is_connected
 
-        mock_js = MagicMock()
-        mock_js.publish = AsyncMock()
-        conn.jetstream = mock_js
 
-        return conn
+class TestNatsStatePublisher:
+    """Tests for NatsStatePublisher."""
 
     @pytest.fixture
     def ambient_state(self) -> EnvironmentalState:
@@ -134,8 +132,9 @@ class TestNatsStatePublisher:
         """Test set_state raises when not connected."""
         publisher = NatsStatePublisher(config)
 
-        with pytest.raises(NatsConnectionError, match="Not connected"):
+        with pytest.raises(NatsConnectionError) as exc_info:
             await publisher.set_state(ambient_state)
+        assert "Not connected" in str(exc_info.value)
 
     async def test_get_current_state(
         self,
@@ -158,40 +157,14 @@ class TestNatsStatePublisher:
         publisher = NatsStatePublisher(config, connection=mock_connection)
         await publisher.connect()
 
-        with pytest.raises(StateError, match="No state has been set"):
+        with pytest.raises(StateError) as exc_info:
             await publisher.get_current_state()
-
-    async def test_context_manager(self, config: NatsConfig, mock_connection: MagicMock) -> None:
-        """Test async context manager."""
-        async with NatsStatePublisher(config, connection=mock_connection) as publisher:
-            assert publisher.is_connected
+        assert "No state has been set" in str(exc_info.value)
 
 
 class TestNatsStateSubscriber:
     """Tests for NatsStateSubscriber."""
 
-    @pytest.fixture
-    def config(self) -> NatsConfig:
-        """Create a test configuration."""
-        return NatsConfig(servers=("nats://localhost:4222",))
-
-    @pytest.fixture
-    def mock_connection(self) -> MagicMock:
-        """Create a mock NATS connection."""
-        conn = MagicMock(spec=NatsConnection)
-        conn.is_connected = True
-        conn.connect = AsyncMock()
-        conn.disconnect = AsyncMock()
-
-        mock_sub = MagicMock()
-        mock_sub.unsubscribe = AsyncMock()
-
-        mock_js = MagicMock()
-        mock_js.subscribe = AsyncMock(return_value=mock_sub)
-        conn.jetstream = mock_js
-
-        return conn
-
     @pytest.fixture
     def ambient_state(self) -> EnvironmentalState:
         """Create an ambient state."""
@@ -201,6 +174,17 @@ class TestNatsStateSubscriber:
             description="Ambient temperature",
         )
 
+    @pytest.fixture
+    async def connected_subscriber(
+        self, config: NatsConfig, mock_connection: MagicMock
+    ) -> AsyncIterator[NatsStateSubscriber]:
+        """Create a subscriber that is connected and subscribed."""
+        subscriber = NatsStateSubscriber(config, connection=mock_connection)
+        await subscriber.connect()
+        await subscriber.subscribe()
+        yield subscriber
+        await subscriber.unsubscribe()
+
     def test_initial_state(self, config: NatsConfig) -> None:
         """Test initial subscriber state."""
         subscriber = NatsStateSubscriber(config)
@@ -213,12 +197,10 @@ class TestNatsStateSubscriber:
 
         assert subscriber.is_connected
 
-    async def test_subscribe(self, config: NatsConfig, mock_connection: MagicMock) -> None:
+    async def test_subscribe(
+        self, connected_subscriber: NatsStateSubscriber, mock_connection: MagicMock
+    ) -> None:
         """Test subscribing to state changes."""
-        subscriber = NatsStateSubscriber(config, connection=mock_connection)
-        await subscriber.connect()
-        await subscriber.subscribe()
-
         mock_connection.jetstream.subscribe.assert_called_once()
         call_args = mock_connection.jetstream.subscribe.call_args
         assert call_args[0][0] == "telemetry.state"
@@ -227,29 +209,31 @@ class TestNatsStateSubscriber:
         """Test subscribe raises when not connected."""
         subscriber = NatsStateSubscriber(config)
 
-        with pytest.raises(NatsConnectionError, match="Not connected"):
+        with pytest.raises(NatsConnectionError) as exc_info:
             await subscriber.subscribe()
-
-    async def test_subscribe_idempotent(
-        self, config: NatsConfig, mock_connection: MagicMock
+        assert "Not connected" in str(exc_info.value)
+
+    @pytest.mark.parametrize(
+        ("unsubscribe_first", "expected_calls"),
+        [
+            (False, 1),  # Second subscribe is a no-op
+            (True, 2),  # Can subscribe again after unsubscribe
+        ],
+        ids=["idempotent", "after_unsubscribe"],
+    )
+    async def test_resubscribe(
+        self,
+        connected_subscriber: NatsStateSubscriber,
+        mock_connection: MagicMock,
+        unsubscribe_first: bool,
+        expected_calls: int,
     ) -> None:
-        """Test subscribe is idempotent."""
-        subscriber = NatsStateSubscriber(config, connection=mock_connection)
-        await subscriber.connect()
-        await subscriber.subscribe()
-        await subscriber.subscribe()  # Second call should be no-op
+        """Test subscribing twice, with and without an unsubscribe in between."""
+        if unsubscribe_first:
+            await connected_subscriber.unsubscribe()
+        await connected_subscriber.subscribe()
 
-        mock_connection.jetstream.subscribe.assert_called_once()
-
-    async def test_unsubscribe(self, config: NatsConfig, mock_connection: MagicMock) -> None:
-        """Test unsubscribing."""
-        subscriber = NatsStateSubscriber(config, connection=mock_connection)
-        await subscriber.connect()
-        await subscriber.subscribe()
-        await subscriber.unsubscribe()
-
-        # Can subscribe again after unsubscribe
-        await subscriber.subscribe()
+        assert mock_connection.jetstream.subscribe.call_count == expected_calls
 
     async def test_get_current_state_not_received(
         self, config: NatsConfig, mock_connection: MagicMock
@@ -258,8 +242,9 @@ class TestNatsStateSubscriber:
         subscriber = NatsStateSubscriber(config, connection=mock_connection)
         await subscriber.connect()
 
-        with pytest.raises(StateError, match="No state has been received"):
+        with pytest.raises(StateError) as exc_info:
             await subscriber.get_current_state()
+        assert "No state has been received" in str(exc_info.value)
 
     async def test_register_and_get_state(
         self,
@@ -281,9 +266,6 @@ class TestNatsStateSubscriber:
         ambient_state: EnvironmentalState,
     ) -> None:
         """Test message handler processes transitions."""
-        from hwtest_core.types.common import Timestamp
-        from hwtest_core.types.state import StateTransition
-
         subscriber = NatsStateSubscriber(config, connection=mock_connection)
         subscriber.register_state(ambient_state)
 
@@ -317,9 +299,6 @@ class TestNatsStateSubscriber:
         self, config: NatsConfig, mock_connection: MagicMock
     ) -> None:
         """Test transitions async iterator."""
-        from hwtest_core.types.common import Timestamp
-        from hwtest_core.types.state import StateTransition
-
         subscriber = NatsStateSubscriber(config, connection=mock_connection)
 
         # Add a transition to the queue
@@ -342,8 +321,3 @@ class TestNatsStateSubscriber:
         await asyncio.wait_for(collect(), timeout=1.0)
         assert len(collected) == 1
         assert collected[0] == transition
-
-    async def test_context_manager(self, config: NatsConfig, mock_connection: MagicMock) -> None:
-        """Test async context manager."""
-        async with NatsStateSubscriber(config, connection=mock_connection) as subscriber:
-            assert subscriber.is_connected
@@ -11,7 +11,7 @@ from hwtest_core.types.streaming import StreamData, StreamField, StreamSchema
 # DataType uses F64 not FLOAT64
 
 from hwtest_nats.config import NatsConfig
-from hwtest_nats.connection import NatsConnection, NatsConnectionError
+from hwtest_nats.connection import NatsConnectionError
 from hwtest_nats.subscriber import NatsStreamSubscriber
 
 
@@ -34,22 +34,6 @@ class TestNatsStreamSubscriber:
             ),
         )
 
-    @pytest.fixture
-    def mock_connection(self) -> MagicMock:
-        """Create a mock NATS connection."""
-        conn = MagicMock(spec=NatsConnection)
-        conn.is_connected = True
-        conn.connect = AsyncMock()
-        conn.disconnect = AsyncMock()
-
-        mock_js = MagicMock()
-        mock_subscription = MagicMock()
-        mock_subscription.unsubscribe = AsyncMock()
-        mock_js.subscribe = AsyncMock(return_value=mock_subscription)
-        conn.jetstream = mock_js
-
-        return conn
-
     def test_initial_state(self, config: NatsConfig) -> None:
         """Test initial subscriber state."""
         subscriber = NatsStreamSubscriber(config)
@@ -97,8 +81,9 @@ class TestNatsStreamSubscriber:
         """Test subscribing when not connected raises error."""
         subscriber = NatsStreamSubscriber(config)
 
-        with pytest.raises(NatsConnectionError, match="Not connected"):
+        with pytest.raises(NatsConnectionError) as exc_info:
             await subscriber.subscribe("test_sensor")
+        assert "Not connected" in str(exc_info.value)
 
     async def test_subscribe_already_subscribed(
         self, config: NatsConfig, mock_connection: MagicMock
@@ -107,8 +92,9 @@ class TestNatsStreamSubscriber:
         subscriber = NatsStreamSubscriber(config, connection=mock_connection)
         await subscriber.subscribe("test_sensor")
 
-        with pytest.raises(RuntimeError, match="Already subscribed"):
+        with pytest.raises(RuntimeError) as exc_info:
             await subscriber.subscribe("other_sensor")
+        assert "Already subscribed" in str(exc_info.value)
 
         await subscriber.unsubscribe()
 
@@ -116,16 +102,18 @@ class TestNatsStreamSubscriber:
         """Test get_schema when not subscribed raises error."""
         subscriber = NatsStreamSubscriber(config)
 
-        with pytest.raises(RuntimeError, match="Not subscribed"):
+        with pytest.raises(RuntimeError) as exc_info:
             await subscriber.get_schema()
+        assert "Not subscribed" in str(exc_info.value)
 
     async def test_get_schema_timeout(self, config: NatsConfig, mock_connection: MagicMock) -> None:
         """Test get_schema times out when no schema received."""
         subscriber = NatsStreamSubscriber(config, connection=mock_connection)
         await subscriber.subscribe("test_sensor")
 
-        with pytest.raises(TimeoutError, match="Timed out waiting"):
+        with pytest.raises(TimeoutError) as exc_info:
             await subscriber.get_schema(timeout=0.01)
+        assert "Timed out waiting" in str(exc_info.value)
 
         await subscriber.unsubscribe()
 
@@ -146,21 +134,18 @@ class TestNatsStreamSubscriber:
 
         await subscriber.unsubscribe()
 
-    async def test_unsubscribe(self, config: NatsConfig, mock_connection: MagicMock) -> None:
-        """Test unsubscribing."""
-        subscriber = NatsStreamSubscriber(config, connection=mock_connection)
-        await subscriber.subscribe("test_sensor")
-        await subscriber.unsubscribe()
-
-        assert subscriber.schema is None
-
-    async def test_unsubscribe_not_subscribed(
-        self, config: NatsConfig, mock_connection: MagicMock
+    @pytest.mark.parametrize("subscribed", [True, False], ids=["subscribed", "not_subscribed"])
+    async def test_unsubscribe(
+        self, config: NatsConfig, mock_connection: MagicMock, subscribed: bool
     ) -> None:
-        """Test unsubscribe when not subscribed does nothing."""
+        """Test unsubscribing, which is a no-op when not subscribed."""
         subscriber = NatsStreamSubscriber(config, connection=mock_connection)
+        if subscribed:
+            await subscriber.subscribe("test_sensor")
         await subscriber.unsubscribe()  # Should not raise
 
+        assert subscriber.schema is None
+
     async def test_handle_schema_message(
         self, config: NatsConfig, schema: StreamSchema, mock_connection: MagicMock
     ) -> None:
@@ -267,50 +252,44 @@ class TestNatsStreamSubscriber:
             async with NatsStreamSubscriber(config) as subscriber:
                 assert subscriber.is_connected
 
+    @pytest.mark.parametrize(
+        ("message_type", "with_schema"),
+        [("schema", False), ("data", True), ("unknown", True)],
+    )
     async def test_message_handler(
-        self, config: NatsConfig, schema: StreamSchema, mock_connection: MagicMock
+        self,
+        config: NatsConfig,
+        schema: StreamSchema,
+        mock_connection: MagicMock,
+        message_type: str,
+        with_schema: bool,
     ) -> None:
-        """Test the unified message handler."""
+        """Test the unified message handler dispatches on message type."""
         subscriber = NatsStreamSubscriber(config, connection=mock_connection)
         await subscriber.subscribe("test_sensor")
+        if with_schema:
+            await subscriber._handle_schema_message(schema.to_bytes())
 
-        # Create mock message
-        mock_msg = MagicMock()
-        mock_msg.ack = AsyncMock()
-
-        # Test schema message
-        mock_msg.data = schema.to_bytes()
-        await subscriber._message_handler(mock_msg)
-        assert subscriber.schema == schema
-        mock_msg.ack.assert_called()
-
-        # Test data message
         data = StreamData(
             schema_id=schema.schema_id,
             timestamp_ns=1000000000,
             period_ns=1000000,
             samples=((3.3, 0.1),),
         )
-        mock_msg.data = data.to_bytes(schema)
-        mock_msg.ack.reset_mock()
-        await subscriber._message_handler(mock_msg)
-        mock_msg.ack.assert_called()
-        assert not subscriber._data_queue.empty()
-
-        await subscriber.unsubscribe()
-
-    async def test_message_handler_unknown_type(
-        self, config: NatsConfig, mock_connection: MagicMock
-    ) -> None:
-        """Test message handler ignores unknown message types."""
-        subscriber = NatsStreamSubscriber(config, connection=mock_connection)
-        await subscriber.subscribe("test_sensor")
+        payloads = {
+            "schema": schema.to_bytes(),
+            "data": data.to_bytes(schema),
+            "unknown": b"\x99\x00\x00\x00",
+        }
 
         mock_msg = MagicMock()
-        mock_msg.data = b"\x99\x00\x00\x00"  # Unknown message type
+        mock_msg.data = payloads[message_type]
         mock_msg.ack = AsyncMock()
 
         await subscriber._message_handler(mock_msg)
-        mock_msg.ack.assert_called()  # Should still ack
+
+        mock_msg.ack.assert_called_once()  # Always acked, even if unknown
+        assert subscriber.schema == schema
+        assert subscriber._data_queue.empty() == (message_type != "data")
 
         await subscriber.unsubscribe()
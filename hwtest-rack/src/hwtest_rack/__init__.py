@@ -34,6 +34,7 @@ from hwtest_rack.config import (
     ExpectedIdentity,
     InstrumentConfig,
     RackConfig,
+    clear_config_cache,
     load_config,
 )
 from hwtest_rack.instance import (
@@ -54,6 +55,7 @@ __all__ = [
     "ExpectedIdentity",
     "InstrumentConfig",
     "RackConfig",
+    "clear_config_cache",
     "load_config",
     "load_driver",
     # Instance (rack unit)
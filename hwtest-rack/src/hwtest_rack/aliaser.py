@@ -20,6 +20,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import operator
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -28,6 +30,12 @@ from hwtest_core.types.streaming import StreamData, StreamField, StreamSchema
 
 logger = logging.getLogger(__name__)
 
+#: Selects the logical columns from one physical sample
+FieldSelector = Callable[[Sequence[int | float]], tuple[int | float, ...]]
+
+#: Converts one physical data message into its logical message (None = drop)
+AliasTransform = Callable[[StreamData], StreamData | None]
+
 
 @dataclass
 class AliasMapping:
@@ -38,12 +46,27 @@ class AliasMapping:
         logical_name: Logical name to republish under.
         field_filter: Optional list of field names to include (None = all fields).
         field_mapping: Optional field renaming (physical name -> logical name).
+        batch_max: Maximum number of messages republished in one batch.
+        batch_max_us: Maximum time (microseconds) a message waits for its batch
+            to fill before the batch is flushed.
     """
 
     physical_source: str
     logical_name: str
     field_filter: list[str] | None = None
     field_mapping: dict[str, str] | None = None
+    batch_max: int = 64
+    batch_max_us: int = 500
+    _filter_set: frozenset[str] | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Freeze the field filter into a set for O(1) membership tests."""
+        self._filter_set = frozenset(self.field_filter) if self.field_filter is not None else None
+
+    @property
+    def filter_set(self) -> frozenset[str] | None:
+        """Field filter as a frozen set (None = all fields)."""
+        return self._filter_set
 
 
 @dataclass
@@ -56,12 +79,25 @@ class ActiveAlias:
     Attributes:
         mapping: The alias mapping configuration.
         logical_schema: The schema for the logical stream (derived from physical).
-        task: Background asyncio task handling the republishing loop.
+        task: Background asyncio task handling the republishing loop. Once
+            the alias is active this task supervises the reader and writer.
+        writer_task: Background asyncio task that transforms and publishes
+            the data queued by the reader.
+        field_indices: Indices of the physical fields kept by the field filter,
+            computed once the physical schema is known (None = all fields).
+        is_identity: True when the logical samples equal the physical samples,
+            so republishing only needs to swap the schema_id.
+        transform: Precompiled physical-to-logical data transform, built
+            once the physical schema is known.
     """
 
     mapping: AliasMapping
     logical_schema: StreamSchema
     task: asyncio.Task[None] | None = None
+    writer_task: asyncio.Task[None] | None = None
+    field_indices: tuple[int, ...] | None = None
+    is_identity: bool = False
+    transform: AliasTransform | None = None
 
 
 class StreamAliaser:
@@ -87,19 +123,30 @@ class StreamAliaser:
     Note:
         This class requires hwtest-nats to be installed. If not available,
         a stub implementation is provided that logs warnings.
+
+        The aliaser runs on whatever event loop is current when it starts, so
+        the loop cannot be swapped from here. For lower per-message overhead,
+        install the ``uvloop`` extra: uvicorn then selects uvloop for the rack
+        server automatically, and standalone callers should call
+        ``uvloop.install()`` before ``asyncio.run``.
     """
 
-    def __init__(self, nats_config: Any | None = None) -> None:
+    def __init__(self, nats_config: Any | None = None, *, queue_maxsize: int = 1024) -> None:
         """Initialize the aliaser.
 
         Args:
             nats_config: NatsConfig for NATS connection. If None, aliaser
                          operates in offline mode (no-op).
+            queue_maxsize: Maximum messages buffered per alias between the
+                physical reader and the logical publisher. When full, the
+                reader waits, backpressuring the physical subscription.
         """
         self._config = nats_config
+        self._queue_maxsize = queue_maxsize
         self._aliases: dict[str, ActiveAlias] = {}
         self._running = False
         self._connection: Any = None  # NatsConnection when hwtest-nats available
+        self._queue_full_count = 0
 
     @property
     def is_running(self) -> bool:
@@ -110,6 +157,15 @@ class StreamAliaser:
         """
         return self._running
 
+    @property
+    def queue_full_count(self) -> int:
+        """Number of times a reader found its alias queue full and had to wait.
+
+        Returns:
+            The count across all aliases since the aliaser was created.
+        """
+        return self._queue_full_count
+
     async def start(self) -> None:
         """Start the aliaser and connect to NATS.
 
@@ -136,7 +192,10 @@ class StreamAliaser:
             await self._connection.connect()
             await self._connection.ensure_stream()
             self._running = True
-            logger.info("StreamAliaser started with NATS connection")
+            logger.info(
+                "StreamAliaser started with NATS connection on %s",
+                type(asyncio.get_running_loop()).__module__,
+            )
 
         except ImportError:
             logger.warning("hwtest-nats not installed, StreamAliaser running in offline mode")
@@ -153,12 +212,7 @@ class StreamAliaser:
 
         # Cancel all alias tasks
         for alias in self._aliases.values():
-            if alias.task is not None:
-                alias.task.cancel()
-                try:
-                    await alias.task
-                except asyncio.CancelledError:
-                    pass
+            await self._cancel_alias_tasks(alias)
 
         self._aliases.clear()
 
@@ -176,6 +230,8 @@ class StreamAliaser:
         logical_name: str,
         field_filter: list[str] | None = None,
         field_mapping: dict[str, str] | None = None,
+        batch_max: int = 64,
+        batch_max_us: int = 500,
     ) -> None:
         """Add an alias to republish a physical stream under a logical name.
 
@@ -184,6 +240,8 @@ class StreamAliaser:
             logical_name: Logical name to republish under.
             field_filter: Optional list of field names to include (None = all).
             field_mapping: Optional field renaming (physical -> logical).
+            batch_max: Maximum number of messages republished in one batch.
+            batch_max_us: Maximum batching delay in microseconds.
 
         Raises:
             ValueError: If logical_name is already registered.
@@ -200,6 +258,8 @@ class StreamAliaser:
             logical_name=logical_name,
             field_filter=field_filter,
             field_mapping=field_mapping,
+            batch_max=batch_max,
+            batch_max_us=batch_max_us,
         )
 
         # In offline mode, just store the mapping
@@ -220,22 +280,20 @@ class StreamAliaser:
             )
             return
 
-        # Start the alias task
-        task = asyncio.create_task(
-            self._alias_loop(mapping),
-            name=f"alias_{logical_name}",
-        )
-
         # Placeholder until we receive the physical schema
         placeholder_schema = StreamSchema(
             source_id=SourceId(logical_name),
             fields=(StreamField("pending", DataType.F64, ""),),
         )
 
-        self._aliases[logical_name] = ActiveAlias(
-            mapping=mapping,
-            logical_schema=placeholder_schema,
-            task=task,
+        alias = ActiveAlias(mapping=mapping, logical_schema=placeholder_schema)
+        self._aliases[logical_name] = alias
+
+        # Start the alias task; it holds the alias directly rather than
+        # looking it up in the registry, so removal cannot race with it
+        alias.task = asyncio.create_task(
+            self._alias_loop(alias),
+            name=f"alias_{logical_name}",
         )
 
         logger.info(
@@ -255,15 +313,28 @@ class StreamAliaser:
         if alias is None:
             return
 
-        if alias.task is not None:
-            alias.task.cancel()
-            try:
-                await alias.task
-            except asyncio.CancelledError:
-                pass
+        await self._cancel_alias_tasks(alias)
 
         logger.info("Removed alias: %s", logical_name)
 
+    @staticmethod
+    async def _cancel_alias_tasks(alias: ActiveAlias) -> None:
+        """Cancel and await the reader and writer tasks of an alias.
+
+        Tasks that already finished are skipped; their errors were handled
+        by the alias loop.
+
+        Args:
+            alias: The alias whose tasks to cancel.
+        """
+        for task in (alias.writer_task, alias.task):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
     def list_aliases(self) -> list[str]:
         """List all registered logical names.
 
@@ -286,7 +357,7 @@ class StreamAliaser:
             return None
         return alias.mapping
 
-    async def _alias_loop(self, mapping: AliasMapping) -> None:
+    async def _alias_loop(self, alias: ActiveAlias) -> None:
         """Background task that subscribes to physical stream and republishes.
 
         Subscribes to the physical source stream, waits for its schema,
@@ -294,8 +365,9 @@ class StreamAliaser:
         and continuously republishes received data.
 
         Args:
-            mapping: The alias mapping configuration.
+            alias: The alias to run. Its schema state is updated in place.
         """
+        mapping = alias.mapping
         try:
             from hwtest_nats import (  # type: ignore[import-not-found]
                 NatsStreamPublisher,
@@ -324,12 +396,8 @@ class StreamAliaser:
                 len(physical_schema.fields),
             )
 
-            # Build logical schema
-            logical_schema = self._build_logical_schema(physical_schema, mapping)
-
-            # Update the stored schema
-            if mapping.logical_name in self._aliases:
-                self._aliases[mapping.logical_name].logical_schema = logical_schema
+            # Build logical schema and cache the field indices
+            logical_schema = self._apply_physical_schema(physical_schema, alias)
 
             # Create publisher for logical stream
             publisher = NatsStreamPublisher(
@@ -346,11 +414,7 @@ class StreamAliaser:
                 len(logical_schema.fields),
             )
 
-            # Republish data
-            async for data in subscriber.data():
-                logical_data = self._transform_data(data, physical_schema, mapping)
-                if logical_data is not None:
-                    await publisher.publish(logical_data)
+            await self._republish(subscriber, publisher, alias)
 
         except asyncio.CancelledError:
             logger.debug("Alias task cancelled: %s", mapping.logical_name)
@@ -364,6 +428,199 @@ class StreamAliaser:
             if subscriber is not None:
                 await subscriber.disconnect()
 
+    async def _republish(self, subscriber: Any, publisher: Any, alias: ActiveAlias) -> None:
+        """Republish a physical stream through a reader and a writer task.
+
+        A reader task drains the subscriber into a bounded queue while a
+        long-lived writer task transforms and publishes in batches. The writer
+        therefore keeps building batches while the reader keeps receiving.
+        If either task fails, the other is cancelled and the error is
+        re-raised, so a dead writer cannot leave the reader blocked on a full
+        queue.
+
+        Args:
+            subscriber: Subscriber for the physical stream.
+            publisher: Publisher for the logical stream.
+            alias: The alias being republished.
+        """
+        mapping = alias.mapping
+        queue: asyncio.Queue[StreamData | None] = asyncio.Queue(maxsize=self._queue_maxsize)
+        writer = asyncio.create_task(
+            self._writer_loop(queue, publisher, alias),
+            name=f"alias_{mapping.logical_name}_writer",
+        )
+        alias.writer_task = writer
+        reader = asyncio.create_task(
+            self._reader_loop(subscriber, queue),
+            name=f"alias_{mapping.logical_name}_reader",
+        )
+        tasks = (reader, writer)
+
+        try:
+            # Once the stream ends the writer flushes whatever is left, so
+            # this returns when both finish or as soon as one of them fails
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in tasks:
+                if task.done():
+                    task.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                    try:
+                        await task
+                    except asyncio.CancelledError:
+                        pass
+
+    async def _reader_loop(self, subscriber: Any, queue: asyncio.Queue[StreamData | None]) -> None:
+        """Move physical stream data into the writer queue.
+
+        Nothing is dropped: when the writer falls behind and the queue is
+        full, the reader waits for space. Puts None on the queue when the
+        stream ends.
+
+        Args:
+            subscriber: Subscriber for the physical stream.
+            queue: Queue consumed by :meth:`_writer_loop`.
+        """
+        async for data in subscriber.data():
+            try:
+                queue.put_nowait(data)
+            except asyncio.QueueFull:
+                self._queue_full_count += 1
+                await queue.put(data)
+        await queue.put(None)
+
+    async def _writer_loop(
+        self,
+        queue: asyncio.Queue[StreamData | None],
+        publisher: Any,
+        alias: ActiveAlias,
+    ) -> None:
+        """Transform queued data and republish it in batches.
+
+        A batch is flushed when it reaches ``batch_max`` messages or when its
+        oldest message has waited ``batch_max_us``, so batching
+        never adds more than that delay. Returns after flushing once the reader
+        signals the end of the stream.
+
+        Args:
+            queue: Queue filled by :meth:`_reader_loop`.
+            publisher: Publisher for the logical stream.
+            alias: The alias being republished.
+        """
+        loop = asyncio.get_running_loop()
+        batch_max = alias.mapping.batch_max
+        batch_delay = alias.mapping.batch_max_us / 1_000_000
+
+        # Bind the negotiated transform once for the hot loop
+        transform = alias.transform
+        if transform is None:
+            raise RuntimeError(f"Alias {alias.mapping.logical_name} has no physical schema")
+
+        finished = False
+        while not finished:
+            item = await queue.get()
+            deadline = loop.time() + batch_delay
+            batch: list[StreamData] = []
+
+            while True:
+                if item is None:
+                    finished = True
+                    break
+                logical_data = transform(item)
+                if logical_data is not None:
+                    batch.append(logical_data)
+                    if len(batch) >= batch_max:
+                        break
+
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+
+            if batch:
+                await publisher.publish_many(batch)
+
+    def _apply_physical_schema(
+        self,
+        physical_schema: StreamSchema,
+        alias: ActiveAlias,
+    ) -> StreamSchema:
+        """Derive and store the logical schema and field indices for an alias.
+
+        Called once when the physical schema is received so that the per-message
+        transform does not need to rescan the physical fields.
+
+        Args:
+            physical_schema: The physical instrument schema.
+            alias: The alias to update.
+
+        Returns:
+            The logical schema.
+        """
+        logical_schema = self._build_logical_schema(physical_schema, alias.mapping)
+        field_indices = self._compute_field_indices(physical_schema, alias.mapping)
+
+        alias.logical_schema = logical_schema
+        alias.field_indices = field_indices
+        # Renames only affect the schema; samples are untouched unless the
+        # filter drops or reorders fields
+        alias.is_identity = field_indices is None or field_indices == tuple(
+            range(len(physical_schema.fields))
+        )
+        alias.transform = self._make_transform(
+            field_indices, logical_schema.schema_id, alias.is_identity
+        )
+
+        return logical_schema
+
+    @staticmethod
+    def _compute_field_indices(
+        physical_schema: StreamSchema,
+        mapping: AliasMapping,
+    ) -> tuple[int, ...] | None:
+        """Compute the indices of the physical fields kept by the field filter.
+
+        Args:
+            physical_schema: The physical instrument schema.
+            mapping: The alias mapping configuration.
+
+        Returns:
+            Tuple of field indices, or None if the mapping has no filter.
+        """
+        field_filter = mapping.filter_set
+        if field_filter is None:
+            return None
+        return tuple(
+            i for i, field in enumerate(physical_schema.fields) if field.name in field_filter
+        )
+
+    @staticmethod
+    def _make_field_selector(field_indices: tuple[int, ...]) -> FieldSelector:
+        """Build a selector that picks the given columns out of a sample.
+
+        ``operator.itemgetter`` extracts all columns in C; with a single index
+        it returns a bare value, so that case is wrapped back into a tuple.
+
+        Args:
+            field_indices: Physical field indices to keep (non-empty).
+
+        Returns:
+            Callable mapping a physical sample to its logical sample.
+        """
+        if len(field_indices) == 1:
+            index = field_indices[0]
+            return lambda sample: (sample[index],)
+        getter: FieldSelector = operator.itemgetter(*field_indices)
+        return getter
+
     def _build_logical_schema(
         self,
         physical_schema: StreamSchema,
@@ -379,11 +636,12 @@ class StreamAliaser:
             A new schema with the logical source_id and optionally filtered/renamed fields.
         """
         fields: list[StreamField] = []
+        field_filter = mapping.filter_set
 
         for field in physical_schema.fields:
             # Apply field filter
-            if mapping.field_filter is not None:
-                if field.name not in mapping.field_filter:
+            if field_filter is not None:
+                if field.name not in field_filter:
                     continue
 
             # Apply field mapping (rename)
@@ -398,54 +656,61 @@ class StreamAliaser:
             fields=tuple(fields),
         )
 
-    def _transform_data(
-        self,
-        data: StreamData,
-        physical_schema: StreamSchema,
-        mapping: AliasMapping,
-    ) -> StreamData | None:
-        """Transform physical data for the logical stream.
+    @staticmethod
+    def _make_transform(
+        field_indices: tuple[int, ...] | None,
+        schema_id: int,
+        is_identity: bool,
+    ) -> AliasTransform:
+        """Build the per-message transform from physical to logical data.
+
+        Filtering and repacking are fused into one closure so the hot loop
+        makes a single call per message, with the column selector and
+        logical schema_id already bound.
+
+        Filtering has to happen here rather than in the broker: JetStream
+        subject transforms only rewrite subjects, and the samples are packed
+        binary rows that the server cannot project column by column.
 
         Args:
-            data: The physical stream data.
-            physical_schema: The physical schema.
-            mapping: The alias mapping.
+            field_indices: Physical field indices to keep, as cached by
+                :meth:`_apply_physical_schema` (None = all fields).
+            schema_id: Schema ID of the logical stream.
+            is_identity: True if the samples pass through unchanged.
 
         Returns:
-            Transformed StreamData, or None if no fields match filter.
+            Callable returning the logical StreamData, or None if no fields
+            match the filter.
         """
-        # If no filter, use data as-is (just need new schema_id)
-        if mapping.field_filter is None:
-            logical_schema = self._aliases[mapping.logical_name].logical_schema
+        if is_identity or field_indices is None:
+
+            def rebrand(data: StreamData) -> StreamData | None:
+                # Only the schema_id changes; the samples tuple is shared, not
+                # copied. Calling the constructor directly measures faster than
+                # dataclasses.replace(), which introspects the fields per call.
+                return StreamData(
+                    schema_id=schema_id,
+                    timestamp_ns=data.timestamp_ns,
+                    period_ns=data.period_ns,
+                    samples=data.samples,
+                )
+
+            return rebrand
+
+        if not field_indices:
+            return lambda data: None
+
+        select = StreamAliaser._make_field_selector(field_indices)
+
+        def filter_fields(data: StreamData) -> StreamData | None:
             return StreamData(
-                schema_id=logical_schema.schema_id,
+                schema_id=schema_id,
                 timestamp_ns=data.timestamp_ns,
                 period_ns=data.period_ns,
-                samples=data.samples,
+                samples=tuple(map(select, data.samples)),
             )
 
-        # Build field indices for filtering
-        field_indices: list[int] = []
-        for i, field in enumerate(physical_schema.fields):
-            if field.name in mapping.field_filter:
-                field_indices.append(i)
-
-        if not field_indices:
-            return None
-
-        # Filter samples
-        filtered_samples: list[tuple[int | float, ...]] = []
-        for sample in data.samples:
-            filtered_sample = tuple(sample[i] for i in field_indices)
-            filtered_samples.append(filtered_sample)
-
-        logical_schema = self._aliases[mapping.logical_name].logical_schema
-        return StreamData(
-            schema_id=logical_schema.schema_id,
-            timestamp_ns=data.timestamp_ns,
-            period_ns=data.period_ns,
-            samples=tuple(filtered_samples),
-        )
+        return filter_fields
 
     async def __aenter__(self) -> StreamAliaser:
         """Enter async context.
@@ -6,8 +6,8 @@ to calculate and store calibration factors for a rack instance.
 Calibration Procedure (MCC 118 using MCC 152 DAC reference):
     1. Output known voltages from MCC 152 DAC (0-5V range)
     2. Read back on MCC 118 ADC
-    3. Calculate scale factor: output_voltage / measured_voltage
-    4. Average across multiple reference points
+    3. Calculate per-point scale factors: output_voltage / measured_voltage
+    4. Fit a single scale factor across all reference points (least squares)
     5. Store in rack instance configuration
 
 Usage:
@@ -30,13 +30,21 @@ Usage:
 from __future__ import annotations
 
 import logging
+import math
+import operator
 import time
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import cached_property
+from statistics import fmean
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Default MCC 118 scan rate for calibration reads (samples/s)
+DEFAULT_SCAN_RATE = 1000.0
+
 
 @dataclass
 class CalibrationPoint:
@@ -53,12 +61,12 @@ class CalibrationPoint:
     scale_factor: float
 
 
-@dataclass
+@dataclass(frozen=True)
 class CalibrationResult:
     """Result of a calibration procedure.
 
     Attributes:
-        scale_factor: The calculated scale factor (average across points).
+        scale_factor: The calculated scale factor (least-squares fit across points).
         points: Individual calibration point measurements.
         reference_instrument: Instrument used as reference.
         timestamp: When calibration was performed.
@@ -73,15 +81,102 @@ class CalibrationResult:
     success: bool = True
     error: str = ""
 
-    @property
+    @cached_property
     def notes(self) -> str:
-        """Generate calibration notes from points."""
+        """Calibration notes generated from points (computed once)."""
         if not self.points:
             return "No calibration points"
         voltages = ", ".join(f"{p.reference_voltage}V" for p in self.points)
         return f"Calibrated using {voltages} reference points"
 
 
+def _failed_result(reference_instrument: str, timestamp: str, error: str) -> CalibrationResult:
+    """Build the result returned when calibration cannot run.
+
+    Args:
+        reference_instrument: Instrument that would have been the reference.
+        timestamp: When calibration was attempted.
+        error: Reason for the failure.
+
+    Returns:
+        A failed CalibrationResult with unity scale factor.
+    """
+    return CalibrationResult(
+        scale_factor=1.0,
+        points=(),
+        reference_instrument=reference_instrument,
+        timestamp=timestamp,
+        success=False,
+        error=error,
+    )
+
+
+def _scan_channel(
+    mcc118: Any, channel: int, samples: int, sample_rate: float, options: int
+) -> list[float]:
+    """Acquire a hardware-paced block of samples from one MCC 118 channel.
+
+    Args:
+        mcc118: Open daqhats mcc118 board.
+        channel: Analog input channel (0-7).
+        samples: Number of samples to acquire.
+        sample_rate: Scan rate in samples per second.
+        options: daqhats scan option flags.
+
+    Returns:
+        The acquired voltages.
+
+    Raises:
+        RuntimeError: If the scan returned no samples.
+    """
+    timeout = samples / sample_rate + 1.0
+    mcc118.a_in_scan_start(1 << channel, samples, sample_rate, options)
+    try:
+        result = mcc118.a_in_scan_read(samples, timeout)
+    finally:
+        mcc118.a_in_scan_cleanup()
+
+    if not result.data:
+        raise RuntimeError(f"MCC 118 scan on channel {channel} returned no samples")
+    return list(result.data)
+
+
+def _point_scale(reference: float, measured: float) -> float:
+    """Scale factor for a single reference point.
+
+    Args:
+        reference: The known reference voltage (V).
+        measured: The averaged measured voltage (V).
+
+    Returns:
+        ``reference / measured``, or 1.0 if the reading is near zero.
+    """
+    if measured > 0.001:  # Avoid division by near-zero
+        return reference / measured
+    return 1.0
+
+
+def _fit_scale_factor(references: Sequence[float], measured: Sequence[float]) -> float:
+    """Fit a single scale factor through all calibration points.
+
+    Uses the closed-form least-squares slope through the origin,
+    ``sum(m * r) / sum(m * m)``, which weights every point equally instead of
+    averaging per-point ratios (biased and noisier at low readings).
+
+    Args:
+        references: Known reference voltages (V).
+        measured: Averaged measured voltages, one per reference (V).
+
+    Returns:
+        The fitted scale factor, or 1.0 if the readings are all near zero.
+    """
+    denominator = math.fsum(map(operator.mul, measured, measured))
+    if denominator < 1e-6:  # Avoid division by near-zero
+        return 1.0
+    numerator = math.fsum(map(operator.mul, measured, references))
+    return numerator / denominator
+
+
 def calibrate_mcc118(
     mcc152_address: int = 0,
     mcc152_channel: int = 0,
@@ -90,6 +185,7 @@ def calibrate_mcc118(
     reference_voltages: list[float] | None = None,
     settling_time: float = 0.1,
     samples_per_point: int = 10,
+    sample_rate: float = DEFAULT_SCAN_RATE,
 ) -> CalibrationResult:
     """Calibrate MCC 118 ADC using MCC 152 DAC as reference.
 
@@ -105,6 +201,8 @@ def calibrate_mcc118(
             Default: [1.0, 2.5, 4.0] covering the useful range.
         settling_time: Time to wait after setting voltage (seconds).
         samples_per_point: Number of samples to average per point.
+        sample_rate: MCC 118 scan rate while sampling (samples/s). Lower it
+            to average over a longer window.
 
     Returns:
         CalibrationResult with calculated scale factor.
@@ -118,67 +216,47 @@ def calibrate_mcc118(
     try:
         import daqhats  # type: ignore[import-not-found]
     except ImportError:
-        return CalibrationResult(
-            scale_factor=1.0,
-            points=(),
-            reference_instrument="mcc152",
-            timestamp=timestamp,
-            success=False,
-            error="daqhats library not installed",
-        )
+        return _failed_result("mcc152", timestamp, "daqhats library not installed")
 
     # Initialize HATs
     try:
         mcc152 = daqhats.mcc152(mcc152_address)
         mcc118 = daqhats.mcc118(mcc118_address)
     except Exception as exc:
-        return CalibrationResult(
-            scale_factor=1.0,
-            points=(),
-            reference_instrument="mcc152",
-            timestamp=timestamp,
-            success=False,
-            error=f"Failed to initialize HATs: {exc}",
-        )
+        return _failed_result("mcc152", timestamp, f"Failed to initialize HATs: {exc}")
 
-    points: list[CalibrationPoint] = []
+    # Only the averaged readings are kept while sampling; the points are
+    # built once at the end
+    measured_voltages = [0.0] * len(reference_voltages)
 
     try:
-        for ref_voltage in reference_voltages:
-            logger.info(f"Calibrating at {ref_voltage}V...")
+        for i, ref_voltage in enumerate(reference_voltages):
+            logger.info("Calibrating at %sV...", ref_voltage)
 
             # Set reference voltage
             mcc152.a_out_write(mcc152_channel, ref_voltage)
             time.sleep(settling_time)
 
-            # Take multiple samples and average
-            samples: list[float] = []
-            for _ in range(samples_per_point):
-                reading = mcc118.a_in_read(mcc118_channel)
-                samples.append(reading)
-                time.sleep(0.01)  # 10ms between samples
+            # Take a block of samples and average
+            samples = _scan_channel(
+                mcc118,
+                mcc118_channel,
+                samples_per_point,
+                sample_rate,
+                daqhats.OptionFlags.DEFAULT,
+            )
 
-            measured = sum(samples) / len(samples)
+            measured = fmean(samples)
+            measured_voltages[i] = measured
 
-            # Calculate scale factor for this point
-            if measured > 0.001:  # Avoid division by near-zero
-                point_scale = ref_voltage / measured
-            else:
-                logger.warning(f"Very low reading at {ref_voltage}V: {measured}V")
-                point_scale = 1.0
+            if measured <= 0.001:
+                logger.warning("Very low reading at %sV: %sV", ref_voltage, measured)
 
             logger.info(
-                f"  Reference: {ref_voltage:.3f}V, "
-                f"Measured: {measured:.3f}V, "
-                f"Scale: {point_scale:.4f}"
-            )
-
-            points.append(
-                CalibrationPoint(
-                    reference_voltage=ref_voltage,
-                    measured_voltage=measured,
-                    scale_factor=point_scale,
-                )
+                "  Reference: %.3fV, Measured: %.3fV, Scale: %.4f",
+                ref_voltage,
+                measured,
+                _point_scale(ref_voltage, measured),
             )
 
     finally:
@@ -188,17 +266,22 @@ def calibrate_mcc118(
         except Exception:
             pass
 
-    # Calculate average scale factor
-    if points:
-        avg_scale = sum(p.scale_factor for p in points) / len(points)
-    else:
-        avg_scale = 1.0
+    scale = _fit_scale_factor(reference_voltages, measured_voltages)
+
+    logger.info("Calibration complete. Fitted scale factor: %.4f", scale)
 
-    logger.info(f"Calibration complete. Average scale factor: {avg_scale:.4f}")
+    points = tuple(
+        CalibrationPoint(
+            reference_voltage=ref_voltage,
+            measured_voltage=measured,
+            scale_factor=_point_scale(ref_voltage, measured),
+        )
+        for ref_voltage, measured in zip(reference_voltages, measured_voltages)
+    )
 
     return CalibrationResult(
-        scale_factor=avg_scale,
-        points=tuple(points),
+        scale_factor=scale,
+        points=points,
         reference_instrument="mcc152",
         timestamp=timestamp,
         success=True,
@@ -210,6 +293,7 @@ def calibrate_with_external_reference(
     mcc118_channel: int = 0,
     reference_voltage: float = 2.5,
     samples: int = 100,
+    sample_rate: float = DEFAULT_SCAN_RATE,
 ) -> CalibrationResult:
     """Calibrate MCC 118 using an external known voltage reference.
 
@@ -221,6 +305,7 @@ def calibrate_with_external_reference(
         mcc118_channel: MCC 118 analog input channel (0-7).
         reference_voltage: The known voltage being applied (V).
         samples: Number of samples to average.
+        sample_rate: MCC 118 scan rate while sampling (samples/s).
 
     Returns:
         CalibrationResult with calculated scale factor.
@@ -230,40 +315,20 @@ def calibrate_with_external_reference(
     try:
         import daqhats  # type: ignore[import-not-found]
     except ImportError:
-        return CalibrationResult(
-            scale_factor=1.0,
-            points=(),
-            reference_instrument="external",
-            timestamp=timestamp,
-            success=False,
-            error="daqhats library not installed",
-        )
+        return _failed_result("external", timestamp, "daqhats library not installed")
 
     try:
         mcc118 = daqhats.mcc118(mcc118_address)
     except Exception as exc:
-        return CalibrationResult(
-            scale_factor=1.0,
-            points=(),
-            reference_instrument="external",
-            timestamp=timestamp,
-            success=False,
-            error=f"Failed to initialize MCC 118: {exc}",
-        )
-
-    # Take samples
-    readings: list[float] = []
-    for _ in range(samples):
-        reading = mcc118.a_in_read(mcc118_channel)
-        readings.append(reading)
-        time.sleep(0.01)
+        return _failed_result("external", timestamp, f"Failed to initialize MCC 118: {exc}")
 
-    measured = sum(readings) / len(readings)
+    # Take a block of samples
+    readings = _scan_channel(
+        mcc118, mcc118_channel, samples, sample_rate, daqhats.OptionFlags.DEFAULT
+    )
 
-    if measured > 0.001:
-        scale_factor = reference_voltage / measured
-    else:
-        scale_factor = 1.0
+    measured = fmean(readings)
+    scale_factor = _point_scale(reference_voltage, measured)
 
     point = CalibrationPoint(
         reference_voltage=reference_voltage,
@@ -272,8 +337,10 @@ def calibrate_with_external_reference(
     )
 
     logger.info(
-        f"External calibration: Reference={reference_voltage:.3f}V, "
-        f"Measured={measured:.3f}V, Scale={scale_factor:.4f}"
+        "External calibration: Reference=%.3fV, Measured=%.3fV, Scale=%.4f",
+        reference_voltage,
+        measured,
+        scale_factor,
     )
 
     return CalibrationResult(
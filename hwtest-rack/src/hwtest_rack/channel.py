@@ -32,6 +32,8 @@ Example test code usage:
 from __future__ import annotations
 
 import logging
+import sys
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -57,8 +59,15 @@ class ChannelType(Enum):
     DAQ_DIGITAL = "daq_digital"  # DAQ digital I/O
 
 
-@dataclass(frozen=True)
-class LogicalChannel:
+class _HashSlot:
+    """Slot for a cached hash, kept out of the dataclass fields."""
+
+    __slots__ = ("_hash",)
+    _hash: int
+
+
+@dataclass(frozen=True, slots=True)
+class LogicalChannel(_HashSlot):
     """Maps a logical name to a physical instrument channel.
 
     Args:
@@ -75,13 +84,37 @@ class LogicalChannel:
     channel_type: ChannelType
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        """Cache the hash; the channel is frozen so it never changes."""
+        object.__setattr__(self, "_hash", hash(self.logical_name))
+
     def __hash__(self) -> int:
         """Hash based on logical name only.
 
         Returns:
             Hash of the logical_name string.
         """
-        return hash(self.logical_name)
+        return self._hash
+
+    def __reduce__(self) -> tuple[type[LogicalChannel], tuple[Any, ...]]:
+        """Pickle through the constructor so the hash is recomputed.
+
+        String hashes differ between processes, so the cached hash must not
+        be carried across in the pickled state.
+
+        Returns:
+            The class and its constructor arguments.
+        """
+        return (
+            LogicalChannel,
+            (
+                self.logical_name,
+                self.instrument_name,
+                self.channel_id,
+                self.channel_type,
+                self.metadata,
+            ),
+        )
 
 
 @dataclass
@@ -104,39 +137,123 @@ class ChannelRegistry:
         # Later, in test code:
         channel = registry.get("main_battery")
         instrument = rack.get_instrument(channel.instrument_name)
+
+    Note:
+        :meth:`get_by_instrument`, :meth:`get_by_type` and :meth:`list_all`
+        return tuples rather than lists. Each tuple is built on first use and
+        shared by later calls until a channel it covers is registered, so
+        callers that want to modify the result must copy it.
     """
 
     _channels: dict[str, LogicalChannel] = field(default_factory=dict)
     _by_instrument: dict[str, list[LogicalChannel]] = field(default_factory=dict)
+    _by_type: dict[ChannelType, list[LogicalChannel]] = field(default_factory=dict)
+    _instrument_views: dict[str, tuple[LogicalChannel, ...]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    _type_views: dict[ChannelType, tuple[LogicalChannel, ...]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    _all: tuple[LogicalChannel, ...] | None = field(default=None, repr=False, compare=False)
 
     def register(self, channel: LogicalChannel) -> None:
         """Register a logical channel.
 
+        Logical and instrument names are interned so that repeated lookups
+        with the same names hash and compare by identity.
+
         Args:
             channel: The logical channel mapping.
 
         Raises:
             ValueError: If the logical name is already registered.
         """
-        if channel.logical_name in self._channels:
-            existing = self._channels[channel.logical_name]
-            raise ValueError(
-                f"Logical name '{channel.logical_name}' already registered "
-                f"(instrument={existing.instrument_name}, channel={existing.channel_id})"
+        name = sys.intern(channel.logical_name)
+        existing = self._channels.get(name)
+        if existing is not None:
+            raise self._duplicate_error(name, existing)
+
+        self._channels[name] = channel
+
+        # Index by instrument and type, dropping the tuples built from the
+        # indexes this channel extends
+        instrument_name = sys.intern(channel.instrument_name)
+        self._by_instrument.setdefault(instrument_name, []).append(channel)
+        self._by_type.setdefault(channel.channel_type, []).append(channel)
+        self._invalidate_views((instrument_name,), (channel.channel_type,))
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Registered logical channel '%s' -> %s.channel[%d]",
+                channel.logical_name,
+                channel.instrument_name,
+                channel.channel_id,
             )
 
-        self._channels[channel.logical_name] = channel
+    def register_all(self, channels: Iterable[LogicalChannel]) -> None:
+        """Register several logical channels at once.
+
+        Equivalent to calling :meth:`register` for each channel in order, but
+        the indexes are built in a single pass. If any logical name is a
+        duplicate, nothing is registered.
 
-        # Index by instrument for reverse lookup
-        if channel.instrument_name not in self._by_instrument:
-            self._by_instrument[channel.instrument_name] = []
-        self._by_instrument[channel.instrument_name].append(channel)
+        Args:
+            channels: The logical channel mappings.
+
+        Raises:
+            ValueError: If a logical name is already registered or repeated.
+        """
+        new_channels: dict[str, LogicalChannel] = {}
+        by_instrument: dict[str, list[LogicalChannel]] = {}
+        by_type: dict[ChannelType, list[LogicalChannel]] = {}
+
+        for channel in channels:
+            name = sys.intern(channel.logical_name)
+            existing = new_channels.get(name) or self._channels.get(name)
+            if existing is not None:
+                raise self._duplicate_error(name, existing)
+            new_channels[name] = channel
+            by_instrument.setdefault(sys.intern(channel.instrument_name), []).append(channel)
+            by_type.setdefault(channel.channel_type, []).append(channel)
+
+        self._channels.update(new_channels)
+        for instrument_name, added in by_instrument.items():
+            self._by_instrument.setdefault(instrument_name, []).extend(added)
+        for channel_type, added in by_type.items():
+            self._by_type.setdefault(channel_type, []).extend(added)
+        self._invalidate_views(by_instrument, by_type)
+
+        logger.debug("Registered %d logical channels", len(new_channels))
+
+    def _invalidate_views(
+        self, instrument_names: Iterable[str], channel_types: Iterable[ChannelType]
+    ) -> None:
+        """Drop the cached tuples for indexes that gained channels.
+
+        Args:
+            instrument_names: Instruments whose channel lists changed.
+            channel_types: Channel types whose channel lists changed.
+        """
+        self._all = None
+        for instrument_name in instrument_names:
+            self._instrument_views.pop(instrument_name, None)
+        for channel_type in channel_types:
+            self._type_views.pop(channel_type, None)
 
-        logger.debug(
-            "Registered logical channel '%s' -> %s.channel[%d]",
-            channel.logical_name,
-            channel.instrument_name,
-            channel.channel_id,
+    @staticmethod
+    def _duplicate_error(name: str, existing: LogicalChannel) -> ValueError:
+        """Build the error raised when a logical name is registered twice.
+
+        Args:
+            name: The duplicated logical name.
+            existing: The channel already registered under that name.
+
+        Returns:
+            The ValueError to raise.
+        """
+        return ValueError(
+            f"Logical name '{name}' already registered "
+            f"(instrument={existing.instrument_name}, channel={existing.channel_id})"
         )
 
     def get(self, logical_name: str) -> LogicalChannel | None:
@@ -164,35 +281,50 @@ class ChannelRegistry:
             return None
         return (channel.instrument_name, channel.channel_id)
 
-    def get_by_instrument(self, instrument_name: str) -> list[LogicalChannel]:
+    def get_by_instrument(self, instrument_name: str) -> tuple[LogicalChannel, ...]:
         """Get all logical channels for an instrument.
 
         Args:
             instrument_name: The physical instrument name.
 
         Returns:
-            List of LogicalChannel mappings for this instrument.
+            Tuple of LogicalChannel mappings for this instrument, in
+            registration order.
         """
-        return self._by_instrument.get(instrument_name, [])
+        view = self._instrument_views.get(instrument_name)
+        if view is None:
+            view = tuple(self._by_instrument.get(instrument_name, ()))
+            self._instrument_views[instrument_name] = view
+        return view
 
-    def get_by_type(self, channel_type: ChannelType) -> list[LogicalChannel]:
+    def get_by_type(self, channel_type: ChannelType) -> tuple[LogicalChannel, ...]:
         """Get all logical channels of a specific type.
 
         Args:
             channel_type: The channel type to filter by.
 
         Returns:
-            List of LogicalChannel mappings of this type.
+            Tuple of LogicalChannel mappings of this type, in registration
+            order.
         """
-        return [ch for ch in self._channels.values() if ch.channel_type == channel_type]
+        view = self._type_views.get(channel_type)
+        if view is None:
+            view = tuple(self._by_type.get(channel_type, ()))
+            self._type_views[channel_type] = view
+        return view
 
-    def list_all(self) -> list[LogicalChannel]:
+    def list_all(self) -> tuple[LogicalChannel, ...]:
         """List all registered logical channels.
 
+        The tuple is built on first use and shared until another channel is
+        registered.
+
         Returns:
-            List of all LogicalChannel mappings.
+            Tuple of all LogicalChannel mappings, in registration order.
         """
-        return list(self._channels.values())
+        if self._all is None:
+            self._all = tuple(self._channels.values())
+        return self._all
 
     def __contains__(self, logical_name: str) -> bool:
         """Check if a logical name is registered.
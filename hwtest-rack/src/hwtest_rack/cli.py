@@ -156,19 +156,24 @@ def cmd_info(args: argparse.Namespace) -> int:
         print(f"Error: {exc}")
         return 1
 
-    print(f"Rack Instance: {config.instance.rack_class} #{config.instance.serial_number}")
-    print(f"  Description: {config.instance.description or '(none)'}")
-    print(f"  Config file: {config.source_path}")
-    print()
-    print("Calibration:")
-    for name, value in sorted(config.calibration.items()):
-        print(f"  {name}: {value}")
-    print()
-    print("Calibration Metadata:")
-    print(f"  Calibrated at: {config.metadata.calibrated_at or '(unknown)'}")
-    print(f"  Calibrated by: {config.metadata.calibrated_by or '(unknown)'}")
-    print(f"  Reference: {config.metadata.reference_instrument or '(unknown)'}")
-    print(f"  Notes: {config.metadata.notes or '(none)'}")
+    # Build the report first and write it in one call
+    lines = [
+        f"Rack Instance: {config.instance.rack_class} #{config.instance.serial_number}",
+        f"  Description: {config.instance.description or '(none)'}",
+        f"  Config file: {config.source_path}",
+        "",
+        "Calibration:",
+    ]
+    lines.extend(f"  {name}: {value}" for name, value in sorted(config.calibration.items()))
+    lines += [
+        "",
+        "Calibration Metadata:",
+        f"  Calibrated at: {config.metadata.calibrated_at or '(unknown)'}",
+        f"  Calibrated by: {config.metadata.calibrated_by or '(unknown)'}",
+        f"  Reference: {config.metadata.reference_instrument or '(unknown)'}",
+        f"  Notes: {config.metadata.notes or '(none)'}",
+    ]
+    print("\n".join(lines))
 
     return 0
 
@@ -210,7 +215,8 @@ def cmd_list(args: argparse.Namespace) -> int:
 
 def parse_voltages(value: str) -> list[float]:
     """Parse comma-separated voltage values."""
-    return [float(v.strip()) for v in value.split(",")]
+    # float() already ignores surrounding whitespace
+    return list(map(float, value.split(",")))
 
 
 def main() -> int:
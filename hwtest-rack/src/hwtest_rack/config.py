@@ -8,6 +8,7 @@ Example YAML configuration:
     rack:
       id: "orange-pi-5-integration"
       description: "Integration test rack"
+      max_init_concurrency: 8
 
     instruments:
       dc_psu_slot_3:
@@ -24,16 +25,52 @@ Example YAML configuration:
 
 from __future__ import annotations
 
+import copy
+import dataclasses
+import functools
+import hashlib
+import importlib
+import json
+import logging
+import os
+import sys
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-import yaml
-
+from hwtest_rack import channel as _channel_module
 from hwtest_rack.channel import ChannelRegistry, ChannelType, LogicalChannel
 
+logger = logging.getLogger(__name__)
+
+# Parsed configs are stored as JSON in the user cache directory
+# ($XDG_CACHE_HOME/hwtest-rack, one file per config path) so a fresh process
+# can skip the YAML parse without writing into the config tree
+_SIDECAR_DIR = "hwtest-rack"
+_SIDECAR_SCHEMA = 2
+
+# Channel keys that are not copied into the channel metadata. The MCC 152
+# lists keep "type", since their channel type is fixed by the list itself.
+_STD_EXCLUDE = frozenset({"id", "logical_name", "name", "type"})
+_MCC152_EXCLUDE = frozenset({"id", "logical_name", "name"})
+
+# Instrument kwargs that hold channel lists: (key, forced type, excluded keys).
+# "channels" is the standard list (PSU, MCC 118, MCC 134, etc.) whose type is
+# inferred; the MCC 152 lists fix the type per list.
+_CHANNEL_SOURCES: tuple[tuple[str, ChannelType | None, frozenset[str]], ...] = (
+    ("channels", None, _STD_EXCLUDE),
+    ("dio_channels", ChannelType.DAQ_DIGITAL, _MCC152_EXCLUDE),
+    ("analog_channels", ChannelType.DAQ_ANALOG, _MCC152_EXCLUDE),
+)
 
-@dataclass(frozen=True)
+# Explicit channel "type" values, by their lower-case string
+_CHANNEL_TYPE_BY_STR = {channel_type.value: channel_type for channel_type in ChannelType}
+
+
+@dataclass(frozen=True, slots=True)
 class ExpectedIdentity:
     """Expected instrument identity for verification.
 
@@ -50,7 +87,7 @@ class ExpectedIdentity:
     model: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChannelConfig:
     """Configuration for a logical channel on an instrument.
 
@@ -70,7 +107,7 @@ class ChannelConfig:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstrumentConfig:
     """Configuration for a single instrument in the rack.
 
@@ -84,17 +121,19 @@ class InstrumentConfig:
             (e.g., "hwtest_bkprecision.psu:create_instrument").
         identity: Expected identity for verification at initialization.
         kwargs: Additional keyword arguments passed to the driver factory.
+            Loaded configs hold a read-only view, so they can be passed to
+            the factory without a defensive copy.
         channels: Logical channel configurations (extracted from kwargs).
     """
 
     name: str
     driver: str
     identity: ExpectedIdentity
-    kwargs: dict[str, Any] = field(default_factory=dict)
+    kwargs: Mapping[str, Any] = field(default_factory=dict)
     channels: tuple[ChannelConfig, ...] = field(default_factory=tuple)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CalibrationConfig:
     """Calibration factors for hardware.
 
@@ -120,7 +159,7 @@ class CalibrationConfig:
         return self.factors.get(name, default)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RackConfig:
     """Configuration for a test rack.
 
@@ -135,6 +174,9 @@ class RackConfig:
         calibration: Hardware calibration factors.
         channel_registry: Registry of logical channel names populated from
             instrument channel configurations.
+        max_init_concurrency: Maximum number of instruments initialized at
+            the same time. Lower it for backends that serialize access
+            anyway, such as some VISA and USB stacks.
     """
 
     rack_id: str
@@ -142,6 +184,35 @@ class RackConfig:
     instruments: tuple[InstrumentConfig, ...]
     calibration: CalibrationConfig = field(default_factory=CalibrationConfig)
     channel_registry: ChannelRegistry = field(default_factory=ChannelRegistry)
+    max_init_concurrency: int = 8
+
+    def preload_drivers(self) -> None:
+        """Import the driver modules of all instruments ahead of use.
+
+        Distinct modules are imported concurrently so their file reads and
+        module bodies overlap, and later driver loads find them already in
+        ``sys.modules``. Import failures are only logged here; they are
+        reported per instrument when the driver is loaded.
+        """
+        unique = dict.fromkeys(inst.driver.partition(":")[0] for inst in self.instruments)
+        modules = [module_path for module_path in unique if module_path not in sys.modules]
+        if not modules:
+            return
+        # Leaving the block waits for every import to finish.
+        with ThreadPoolExecutor(max_workers=min(8, len(modules))) as pool:
+            pool.map(_preload_module, modules)
+
+
+def _preload_module(module_path: str) -> None:
+    """Import a driver module, logging instead of raising on failure.
+
+    Args:
+        module_path: Dotted module path.
+    """
+    try:
+        importlib.import_module(module_path)
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        logger.debug("Could not preload driver module %s: %s", module_path, exc)
 
 
 def _infer_channel_type(driver: str, channel_data: dict[str, Any]) -> ChannelType:
@@ -156,13 +227,34 @@ def _infer_channel_type(driver: str, channel_data: dict[str, Any]) -> ChannelTyp
     """
     # Check for explicit type in channel data
     if "type" in channel_data:
-        type_str = channel_data["type"].lower()
-        try:
-            return ChannelType(type_str)
-        except ValueError:
-            pass
+        explicit_type = _CHANNEL_TYPE_BY_STR.get(channel_data["type"].lower())
+        if explicit_type is not None:
+            return explicit_type
 
     # Infer from driver path
+    channel_type = _infer_from_driver(driver)
+    if channel_type is not None:
+        return channel_type
+
+    # MCC 152 channels with a direction are digital I/O
+    if channel_data.get("direction"):
+        return ChannelType.DAQ_DIGITAL
+    return ChannelType.DAQ_ANALOG
+
+
+@functools.lru_cache(maxsize=256)
+def _infer_from_driver(driver: str) -> ChannelType | None:
+    """Infer the channel type from the driver path alone.
+
+    Cached because every channel of an instrument shares its driver.
+
+    Args:
+        driver: Driver path (module:function format).
+
+    Returns:
+        Inferred ChannelType, or None for MCC 152 drivers, whose channel type
+        depends on the channel's direction.
+    """
     driver_lower = driver.lower()
     if "psu" in driver_lower or "power" in driver_lower:
         return ChannelType.PSU
@@ -170,15 +262,74 @@ def _infer_channel_type(driver: str, channel_data: dict[str, Any]) -> ChannelTyp
         return ChannelType.LOAD
     if "mcc118" in driver_lower or "mcc134" in driver_lower or "ads" in driver_lower:
         return ChannelType.DAQ_ANALOG
-    if "mcc152" in driver_lower and channel_data.get("direction"):
-        return ChannelType.DAQ_DIGITAL
-    if "dac" in driver_lower or "adc" in driver_lower:
-        return ChannelType.DAQ_ANALOG
+    if "mcc152" in driver_lower:
+        return None
 
-    # Default to analog DAQ
+    # DAC/ADC drivers and anything unrecognized default to analog DAQ
     return ChannelType.DAQ_ANALOG
 
 
+def _intern(value: Any) -> Any:
+    """Intern a string read from a config file; other values pass through.
+
+    Driver paths, manufacturers, models and names repeat across instruments
+    and are used as dict keys, so sharing one object per value saves memory
+    and lets equality checks short-circuit on identity.
+
+    Args:
+        value: Parsed config value.
+
+    Returns:
+        The interned string, or ``value`` unchanged if it is not a string.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _extract_channels(
+    channel_list: Any,
+    driver: str,
+    forced_type: ChannelType | None,
+    exclude: frozenset[str],
+) -> list[ChannelConfig]:
+    """Extract channel configurations from one channel list in the kwargs.
+
+    Args:
+        channel_list: The list of channel mappings from the YAML.
+        driver: Driver path, used to infer the type when none is forced.
+        forced_type: Channel type for every entry, or None to infer it.
+        exclude: Keys that are not copied into the channel metadata.
+
+    Returns:
+        ChannelConfig objects for the valid entries.
+    """
+    channels: list[ChannelConfig] = []
+    for ch_data in channel_list:
+        if not isinstance(ch_data, dict):
+            continue
+
+        ch_id = ch_data.get("id")
+        logical_name = ch_data.get("logical_name") or ch_data.get("name")
+
+        if ch_id is None or logical_name is None:
+            continue
+        logical_name = _intern(logical_name)
+
+        channel_type = forced_type or _infer_channel_type(driver, ch_data)
+
+        # Extract metadata (everything not excluded), preserving key order
+        metadata = {k: v for k, v in ch_data.items() if k not in exclude}
+
+        channels.append(
+            ChannelConfig(
+                id=ch_id,
+                logical_name=logical_name,
+                channel_type=channel_type,
+                metadata=metadata,
+            )
+        )
+    return channels
+
+
 def _parse_channels(
     instrument_name: str,
     driver: str,
@@ -198,113 +349,286 @@ def _parse_channels(
         Tuple of ChannelConfig objects.
     """
     channels: list[ChannelConfig] = []
+    for key, forced_type, exclude in _CHANNEL_SOURCES:
+        if key in kwargs:
+            channels += _extract_channels(kwargs[key], driver, forced_type, exclude)
+    return tuple(channels)
+
 
-    # Standard channels list (PSU, MCC 118, MCC 134, etc.)
-    if "channels" in kwargs:
-        for ch_data in kwargs["channels"]:
-            if not isinstance(ch_data, dict):
-                continue
+def _build_channel_registry(
+    instruments: list[InstrumentConfig],
+) -> ChannelRegistry:
+    """Build a channel registry from instrument configurations.
 
-            ch_id = ch_data.get("id")
-            logical_name = ch_data.get("logical_name") or ch_data.get("name")
+    Args:
+        instruments: List of instrument configurations.
 
-            if ch_id is None or logical_name is None:
-                continue
+    Returns:
+        Populated ChannelRegistry.
+    """
+    registry = ChannelRegistry()
+    registry.register_all(
+        LogicalChannel(
+            logical_name=ch_config.logical_name,
+            instrument_name=inst.name,
+            channel_id=ch_config.id,
+            channel_type=ch_config.channel_type,
+            metadata=ch_config.metadata,
+        )
+        for inst in instruments
+        for ch_config in inst.channels
+    )
+    return registry
 
-            channel_type = _infer_channel_type(driver, ch_data)
 
-            # Extract metadata (everything except id/name/type)
-            metadata = {
-                k: v for k, v in ch_data.items() if k not in ("id", "logical_name", "name", "type")
-            }
+def clear_config_cache() -> None:
+    """Discard all rack configurations cached by :func:`load_config`."""
+    _load_config_cached.cache_clear()
 
-            channels.append(
-                ChannelConfig(
-                    id=ch_id,
-                    logical_name=logical_name,
-                    channel_type=channel_type,
-                    metadata=metadata,
-                )
-            )
 
-    # MCC 152 dio_channels
-    if "dio_channels" in kwargs:
-        for ch_data in kwargs["dio_channels"]:
-            if not isinstance(ch_data, dict):
-                continue
+def load_config(path: str | Path) -> RackConfig:
+    """Load rack configuration from a YAML file.
 
-            ch_id = ch_data.get("id")
-            logical_name = ch_data.get("logical_name") or ch_data.get("name")
+    The most recently used configurations are cached and reused until the
+    file's modification time, size, or inode changes. Each call returns its
+    own copy of the cached config, so changes to one result (registering
+    channels, editing kwargs or metadata) never reach later loads.
 
-            if ch_id is None or logical_name is None:
-                continue
+    Args:
+        path: Path to the YAML configuration file.
 
-            metadata = {k: v for k, v in ch_data.items() if k not in ("id", "logical_name", "name")}
+    Returns:
+        Parsed rack configuration.
 
-            channels.append(
-                ChannelConfig(
-                    id=ch_id,
-                    logical_name=logical_name,
-                    channel_type=ChannelType.DAQ_DIGITAL,
-                    metadata=metadata,
-                )
-            )
+    Raises:
+        FileNotFoundError: If the config file doesn't exist.
+        ValueError: If the config is invalid or missing required fields.
+    """
+    path = Path(path).resolve()
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {path}") from None
+    return _copy_config(_load_config_cached(path, st.st_mtime_ns, st.st_size, st.st_ino))
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(  # pylint: disable=unused-argument
+    path: Path, mtime_ns: int, size: int, inode: int
+) -> RackConfig:
+    """Parse a config file, memoized on its path and file signature.
+
+    Args:
+        path: Resolved path to the YAML configuration file.
+        mtime_ns: File modification time, part of the cache key.
+        size: File size, part of the cache key.
+        inode: File inode, part of the cache key.
+
+    Returns:
+        Parsed rack configuration.
+    """
+    return _parse_config(path)
 
-    # MCC 152 analog_channels
-    if "analog_channels" in kwargs:
-        for ch_data in kwargs["analog_channels"]:
-            if not isinstance(ch_data, dict):
-                continue
 
-            ch_id = ch_data.get("id")
-            logical_name = ch_data.get("logical_name") or ch_data.get("name")
+def _copy_config(config: RackConfig) -> RackConfig:
+    """Copy a rack configuration so that it shares no mutable state.
 
-            if ch_id is None or logical_name is None:
-                continue
+    The instrument kwargs, channel metadata, and calibration factors are
+    deep-copied, and the channel registry is rebuilt from the copies.
 
-            metadata = {k: v for k, v in ch_data.items() if k not in ("id", "logical_name", "name")}
+    Args:
+        config: The rack configuration to copy.
 
-            channels.append(
+    Returns:
+        An independent copy of ``config``.
+    """
+    instruments = [
+        dataclasses.replace(
+            inst,
+            kwargs=MappingProxyType(copy.deepcopy(dict(inst.kwargs))),
+            channels=tuple(
+                dataclasses.replace(ch, metadata=copy.deepcopy(ch.metadata)) for ch in inst.channels
+            ),
+        )
+        for inst in config.instruments
+    ]
+    return dataclasses.replace(
+        config,
+        instruments=tuple(instruments),
+        calibration=CalibrationConfig(factors=dict(config.calibration.factors)),
+        channel_registry=_build_channel_registry(instruments),
+    )
+
+
+def _config_to_json(config: RackConfig) -> dict[str, Any]:
+    """Convert a rack configuration to JSON-compatible data.
+
+    Args:
+        config: The rack configuration.
+
+    Returns:
+        Plain data that :func:`_config_from_json` turns back into the config.
+    """
+    return {
+        "rack_id": config.rack_id,
+        "description": config.description,
+        "instruments": [
+            {
+                "name": inst.name,
+                "driver": inst.driver,
+                "identity": [inst.identity.manufacturer, inst.identity.model],
+                "kwargs": dict(inst.kwargs),
+                "channels": [
+                    [ch.id, ch.logical_name, ch.channel_type.value, ch.metadata]
+                    for ch in inst.channels
+                ],
+            }
+            for inst in config.instruments
+        ],
+        "calibration": config.calibration.factors,
+        "max_init_concurrency": config.max_init_concurrency,
+    }
+
+
+def _config_from_json(data: dict[str, Any]) -> RackConfig:
+    """Rebuild a rack configuration from :func:`_config_to_json` data.
+
+    Args:
+        data: Data previously produced by :func:`_config_to_json`.
+
+    Returns:
+        The rack configuration.
+    """
+    instruments = [
+        InstrumentConfig(
+            name=_intern(inst["name"]),
+            driver=_intern(inst["driver"]),
+            identity=ExpectedIdentity(*map(_intern, inst["identity"])),
+            kwargs=MappingProxyType(inst["kwargs"]),
+            channels=tuple(
                 ChannelConfig(
                     id=ch_id,
-                    logical_name=logical_name,
-                    channel_type=ChannelType.DAQ_ANALOG,
+                    logical_name=_intern(logical_name),
+                    channel_type=ChannelType(type_value),
                     metadata=metadata,
                 )
-            )
+                for ch_id, logical_name, type_value, metadata in inst["channels"]
+            ),
+        )
+        for inst in data["instruments"]
+    ]
+    return RackConfig(
+        rack_id=data["rack_id"],
+        description=data["description"],
+        instruments=tuple(instruments),
+        calibration=CalibrationConfig(factors=data["calibration"]),
+        channel_registry=_build_channel_registry(instruments),
+        max_init_concurrency=data["max_init_concurrency"],
+    )
 
-    return tuple(channels)
 
+def _read_sidecar(sidecar: Path, digest: str) -> RackConfig | None:
+    """Load a config from its JSON sidecar if it matches the YAML content.
 
-def _build_channel_registry(
-    instruments: list[InstrumentConfig],
-) -> ChannelRegistry:
-    """Build a channel registry from instrument configurations.
+    Args:
+        sidecar: Path to the sidecar file.
+        digest: SHA-256 hex digest of the current YAML file.
+
+    Returns:
+        The cached configuration, or None if the sidecar is missing, stale,
+        or unreadable.
+    """
+    try:
+        data = json.loads(sidecar.read_bytes())
+        if (
+            data["schema"] != _SIDECAR_SCHEMA
+            or data["parser_sha256"] != _parser_digest()
+            or data["yaml_sha256"] != digest
+        ):
+            return None
+        return _config_from_json(data["config"])
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        logger.debug("Ignoring unusable config sidecar %s: %s", sidecar, exc)
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _parser_digest() -> str:
+    """Hash the source of the modules that turn YAML into a config.
+
+    Recorded in every sidecar, so an upgrade that changes how configs are
+    parsed invalidates the sidecars written by the old code even if
+    ``_SIDECAR_SCHEMA`` was not bumped.
+
+    Returns:
+        SHA-256 hex digest of this module and :mod:`hwtest_rack.channel`.
+    """
+    digest = hashlib.sha256()
+    for module_file in (__file__, _channel_module.__file__):
+        if module_file is not None:
+            digest.update(Path(module_file).read_bytes())
+    return digest.hexdigest()
+
+
+def _sidecar_path(path: Path) -> Path:
+    """Return the JSON sidecar location for a config file.
 
     Args:
-        instruments: List of instrument configurations.
+        path: Resolved path to the YAML configuration file.
 
     Returns:
-        Populated ChannelRegistry.
+        A file in the user cache directory named after a hash of ``path``.
     """
-    registry = ChannelRegistry()
+    cache_home = Path(os.environ.get("XDG_CACHE_HOME") or "~/.cache").expanduser()
+    name = hashlib.sha256(os.fsencode(path)).hexdigest()
+    return cache_home / _SIDECAR_DIR / f"{name}.json"
 
-    for inst in instruments:
-        for ch_config in inst.channels:
-            logical_channel = LogicalChannel(
-                logical_name=ch_config.logical_name,
-                instrument_name=inst.name,
-                channel_id=ch_config.id,
-                channel_type=ch_config.channel_type,
-                metadata=ch_config.metadata,
-            )
-            registry.register(logical_channel)
 
-    return registry
+def _write_sidecar(sidecar: Path, digest: str, config: RackConfig) -> None:
+    """Store a config in its JSON sidecar, best effort.
 
+    Nothing is written if the config does not survive a JSON round trip
+    unchanged (e.g. YAML values with no JSON equivalent, or non-string keys),
+    or if the cache directory is not writable.
+
+    Args:
+        sidecar: Path to the sidecar file.
+        digest: SHA-256 hex digest of the YAML file the config came from.
+        config: The parsed configuration.
+    """
+    payload = _config_to_json(config)
+    try:
+        text = json.dumps(
+            {
+                "schema": _SIDECAR_SCHEMA,
+                "parser_sha256": _parser_digest(),
+                "yaml_sha256": digest,
+                "config": payload,
+            },
+            allow_nan=False,
+        )
+    except (TypeError, ValueError):
+        return
+    if json.loads(text)["config"] != payload:
+        return
+
+    tmp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        sidecar.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, sidecar)
+    except OSError as exc:
+        logger.debug("Could not write config sidecar %s: %s", sidecar, exc)
+        tmp.unlink(missing_ok=True)
 
-def load_config(path: str | Path) -> RackConfig:
-    """Load rack configuration from a YAML file.
+
+def _parse_config(path: Path) -> RackConfig:
+    """Parse a rack configuration YAML file.
+
+    Uses the JSON sidecar when its recorded hash matches the YAML content;
+    otherwise parses the YAML and refreshes the sidecar.
 
     Args:
         path: Path to the YAML configuration file.
@@ -313,16 +637,96 @@ def load_config(path: str | Path) -> RackConfig:
         Parsed rack configuration.
 
     Raises:
-        FileNotFoundError: If the config file doesn't exist.
         ValueError: If the config is invalid or missing required fields.
     """
-    path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"Config file not found: {path}")
+    raw = path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    sidecar = _sidecar_path(path)
+
+    config = _read_sidecar(sidecar, digest)
+    if config is None:
+        config = _build_config(_parse_yaml(raw))
+        _write_sidecar(sidecar, digest, config)
+    return config
+
+
+def _parse_yaml(raw: bytes) -> Any:
+    """Parse YAML with the LibYAML safe loader when PyYAML was built with it.
+
+    PyYAML is imported here rather than at module level so that importing
+    this module, or loading a config from its sidecar, does not pay for it.
+
+    Args:
+        raw: The YAML document.
+
+    Returns:
+        The parsed document.
+    """
+    import yaml  # pylint: disable=import-outside-toplevel
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(raw, Loader=loader)
+
+
+def _build_instrument(name: str, inst_data: Any) -> InstrumentConfig:
+    """Build one instrument configuration from its parsed YAML mapping.
+
+    Args:
+        name: Instrument name (its key under ``instruments``).
+        inst_data: The instrument's parsed YAML value.
+
+    Returns:
+        The instrument configuration.
+
+    Raises:
+        ValueError: If the instrument is invalid or missing required fields.
+    """
+    if not isinstance(inst_data, dict):
+        raise ValueError(f"Instrument '{name}' must be a mapping")
+
+    driver = inst_data.get("driver")
+    if not driver:
+        raise ValueError(f"Instrument '{name}' missing required field: driver")
+
+    identity_data = inst_data.get("identity", {})
+    if not identity_data.get("manufacturer"):
+        raise ValueError(f"Instrument '{name}' missing required field: identity.manufacturer")
+    if not identity_data.get("model"):
+        raise ValueError(f"Instrument '{name}' missing required field: identity.model")
+
+    identity = ExpectedIdentity(
+        manufacturer=_intern(identity_data["manufacturer"]),
+        model=_intern(identity_data["model"]),
+    )
+
+    kwargs = inst_data.get("kwargs", {})
+    if not isinstance(kwargs, dict):
+        raise ValueError(f"Instrument '{name}' kwargs must be a mapping")
+
+    # Parse channel configurations
+    channels = _parse_channels(name, driver, kwargs)
+
+    return InstrumentConfig(
+        name=_intern(name),
+        driver=_intern(driver),
+        identity=identity,
+        kwargs=MappingProxyType(kwargs),
+        channels=channels,
+    )
 
-    with open(path, encoding="utf-8") as f:
-        data = yaml.safe_load(f)
 
+def _build_config(data: Any) -> RackConfig:
+    """Build a rack configuration from parsed YAML data.
+
+    Args:
+        data: The parsed YAML document.
+
+    Returns:
+        Parsed rack configuration.
+
+    Raises:
+        ValueError: If the config is invalid or missing required fields.
+    """
     if not isinstance(data, dict):
         raise ValueError("Config must be a YAML mapping")
 
@@ -332,48 +736,22 @@ def load_config(path: str | Path) -> RackConfig:
     if not rack_id:
         raise ValueError("Missing required field: rack.id")
     description = rack_section.get("description", "")
+    max_init_concurrency = rack_section.get("max_init_concurrency", 8)
+    if (
+        not isinstance(max_init_concurrency, int)
+        or isinstance(max_init_concurrency, bool)
+        or max_init_concurrency < 1
+    ):
+        raise ValueError("rack.max_init_concurrency must be a positive integer")
 
     # Parse instruments section
     instruments_data = data.get("instruments", {})
     if not isinstance(instruments_data, dict):
         raise ValueError("instruments must be a mapping")
 
-    instruments: list[InstrumentConfig] = []
-    for name, inst_data in instruments_data.items():
-        if not isinstance(inst_data, dict):
-            raise ValueError(f"Instrument '{name}' must be a mapping")
-
-        driver = inst_data.get("driver")
-        if not driver:
-            raise ValueError(f"Instrument '{name}' missing required field: driver")
-
-        identity_data = inst_data.get("identity", {})
-        if not identity_data.get("manufacturer"):
-            raise ValueError(f"Instrument '{name}' missing required field: identity.manufacturer")
-        if not identity_data.get("model"):
-            raise ValueError(f"Instrument '{name}' missing required field: identity.model")
-
-        identity = ExpectedIdentity(
-            manufacturer=identity_data["manufacturer"],
-            model=identity_data["model"],
-        )
-
-        kwargs = inst_data.get("kwargs", {})
-        if not isinstance(kwargs, dict):
-            raise ValueError(f"Instrument '{name}' kwargs must be a mapping")
-
-        # Parse channel configurations
-        channels = _parse_channels(name, driver, kwargs)
-
-        instruments.append(
-            InstrumentConfig(
-                name=name,
-                driver=driver,
-                identity=identity,
-                kwargs=kwargs,
-                channels=channels,
-            )
-        )
+    instruments = [
+        _build_instrument(name, inst_data) for name, inst_data in instruments_data.items()
+    ]
 
     # Parse calibration section
     cal_data = data.get("calibration", {})
@@ -390,4 +768,5 @@ def load_config(path: str | Path) -> RackConfig:
         instruments=tuple(instruments),
         calibration=calibration,
         channel_registry=channel_registry,
+        max_init_concurrency=max_init_concurrency,
     )
@@ -35,41 +35,68 @@ Example instance YAML:
 
 from __future__ import annotations
 
+import fnmatch
+import functools
 import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Callable
 
-import yaml
 
-
-def _get_search_paths() -> list[Path]:
+def _get_search_paths() -> tuple[Path, ...]:
     """Get search paths for rack instance configurations.
 
     Returns:
-        List of directories to search, in priority order.
+        Directories to search, in priority order.
+    """
+    return _search_paths_for(os.environ.get("HWTEST_RACK_INSTANCE_PATH"))
+
+
+@functools.lru_cache(maxsize=8)
+def _search_paths_for(env_path: str | None) -> tuple[Path, ...]:
+    """Build the search paths for a given HWTEST_RACK_INSTANCE_PATH value.
+
+    Memoized on the variable's value, so a changed environment is still seen
+    without rebuilding the paths on every lookup.
+
+    Args:
+        env_path: Value of HWTEST_RACK_INSTANCE_PATH, or None if unset.
+
+    Returns:
+        Directories to search, in priority order.
     """
     paths: list[Path] = []
 
     # Environment variable override (highest priority)
-    env_path = os.environ.get("HWTEST_RACK_INSTANCE_PATH")
     if env_path:
         for p in env_path.split(":"):
             if p:
                 paths.append(Path(p))
 
     # User config directory
-    home = Path.home()
-    paths.append(home / ".config" / "hwtest" / "racks")
+    paths.append(_user_config_dir())
 
     # System config directory
     paths.append(Path("/etc/hwtest/racks"))
 
-    return paths
+    return tuple(paths)
 
 
-@dataclass(frozen=True)
+@functools.lru_cache(maxsize=1)
+def _user_config_dir() -> Path:
+    """Get the per-user instance config directory, resolving home once.
+
+    Returns:
+        The ``~/.config/hwtest/racks`` directory.
+    """
+    return Path.home() / ".config" / "hwtest" / "racks"
+
+
+@dataclass(frozen=True, slots=True)
 class RackInstanceInfo:
     """Rack instance identification.
 
@@ -84,7 +111,7 @@ class RackInstanceInfo:
     description: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CalibrationMetadata:
     """Metadata about when and how calibration was performed.
 
@@ -101,7 +128,7 @@ class CalibrationMetadata:
     notes: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class RackInstanceConfig:
     """Configuration for a specific rack instance.
 
@@ -171,7 +198,7 @@ class RackInstanceConfig:
 
         if path is None:
             # Generate path in user config directory
-            config_dir = Path.home() / ".config" / "hwtest" / "racks"
+            config_dir = _user_config_dir()
             config_dir.mkdir(parents=True, exist_ok=True)
             filename = f"{self.instance.rack_class}_{self.instance.serial_number}.yaml"
             path = config_dir / filename
@@ -179,8 +206,15 @@ class RackInstanceConfig:
         # Ensure parent directory exists
         path.parent.mkdir(parents=True, exist_ok=True)
 
+        import yaml  # pylint: disable=import-outside-toplevel
+
+        # LibYAML's C dumper writes the same output several times faster.
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
         with open(path, "w", encoding="utf-8") as f:
-            yaml.dump(self.to_dict(), f, default_flow_style=False, sort_keys=False)
+            yaml.dump(self.to_dict(), f, Dumper=dumper, default_flow_style=False, sort_keys=False)
+        # A rewrite within the filesystem's timestamp granularity can keep the
+        # same mtime and size, so don't rely on the cache key to notice it.
+        _read_instance_yaml.cache_clear()
 
         return path
 
@@ -188,6 +222,9 @@ class RackInstanceConfig:
     def from_yaml(cls, path: str | Path) -> RackInstanceConfig:
         """Load a rack instance config from a YAML file.
 
+        The parsed YAML is cached until the file's modification time, size, or
+        inode changes. Each call still returns a new, independent config.
+
         Args:
             path: Path to the YAML file.
 
@@ -199,10 +236,8 @@ class RackInstanceConfig:
             yaml.YAMLError: If YAML parsing fails.
         """
         path = Path(path)
-
-        with open(path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-
+        st = path.stat()
+        data = _read_instance_yaml(path.resolve(), st.st_mtime_ns, st.st_size, st.st_ino)
         return cls._parse(data, source_path=path)
 
     @classmethod
@@ -218,15 +253,24 @@ class RackInstanceConfig:
         """
         # Parse instance info
         inst_data = data.get("rack_instance", {})
+        rack_class = inst_data.get("rack_class", "unknown")
         instance = RackInstanceInfo(
-            serial_number=str(inst_data.get("serial_number", "unknown")),
-            rack_class=inst_data.get("rack_class", "unknown"),
+            serial_number=sys.intern(str(inst_data.get("serial_number", "unknown"))),
+            rack_class=sys.intern(rack_class) if isinstance(rack_class, str) else rack_class,
             description=inst_data.get("description", ""),
         )
 
         # Parse calibration factors
         cal_data = data.get("calibration", {})
-        calibration = {k: float(v) for k, v in cal_data.items() if isinstance(v, (int, float))}
+        # Exact type checks: YAML numbers are plain int or float, floats need
+        # no conversion, and booleans are not calibration factors.
+        calibration: dict[str, float] = {}
+        for k, v in cal_data.items():
+            value_type = type(v)
+            if value_type is float:
+                calibration[k] = v
+            elif value_type is int:
+                calibration[k] = float(v)
 
         # Parse metadata
         meta_data = data.get("calibration_metadata", {})
@@ -279,6 +323,48 @@ class RackInstanceConfig:
         )
 
 
+@functools.lru_cache(maxsize=32)
+def _read_instance_yaml(  # pylint: disable=unused-argument
+    path: Path, mtime_ns: int, size: int, inode: int
+) -> Any:
+    """Parse an instance YAML file, memoized on its path and file signature.
+
+    The result is shared between callers; :meth:`RackInstanceConfig._parse`
+    only reads it.
+
+    Args:
+        path: Resolved path to the YAML file.
+        mtime_ns: File modification time, part of the cache key.
+        size: File size, part of the cache key.
+        inode: File inode, part of the cache key.
+
+    Returns:
+        The parsed YAML document.
+    """
+    # Binary mode lets LibYAML detect and decode the encoding itself instead
+    # of pulling chunks through a text wrapper.
+    with path.open("rb") as f:
+        return _parse_yaml(f)
+
+
+def _parse_yaml(stream: IO[bytes]) -> Any:
+    """Parse YAML with the LibYAML safe loader when PyYAML was built with it.
+
+    PyYAML is imported here rather than at module level so that importing
+    this module does not pay for it.
+
+    Args:
+        stream: Binary file holding the YAML document.
+
+    Returns:
+        The parsed document.
+    """
+    import yaml  # pylint: disable=import-outside-toplevel
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(stream, Loader=loader)
+
+
 def find_instance_config(
     rack_class: str,
     serial_number: str | None = None,
@@ -295,41 +381,116 @@ def find_instance_config(
     Returns:
         Path to the instance config file, or None if not found.
     """
-    if search_paths is None:
-        search_paths = _get_search_paths()
+    dirs = _get_search_paths() if search_paths is None else [Path(d) for d in search_paths]
 
-    # Build filename patterns to search for
-    patterns: list[str] = []
+    search: Callable[[Path], Path | None]
     if serial_number:
-        patterns.append(f"{rack_class}_{serial_number}.yaml")
-        patterns.append(f"{rack_class}_{serial_number}.yml")
+        file_names = [f"{rack_class}_{serial_number}.yaml", f"{rack_class}_{serial_number}.yml"]
+        search = functools.partial(_find_exact, file_names=file_names)
     else:
         # Match any serial number for this rack class
-        patterns.append(f"{rack_class}_*.yaml")
-        patterns.append(f"{rack_class}_*.yml")
-
-    for search_dir in search_paths:
-        search_dir = Path(search_dir)
-        if not search_dir.is_dir():
-            continue
-
-        # Try exact matches first
-        if serial_number:
-            for pattern in patterns:
-                candidate = search_dir / pattern
-                if candidate.is_file():
-                    return candidate
-        else:
-            # Glob for any matching file
-            for pattern in patterns:
-                matches = list(search_dir.glob(pattern))
-                if matches:
-                    # Return first match (could sort by serial number)
-                    return sorted(matches)[0]
+        search = functools.partial(
+            _find_matching, patterns=_class_patterns(rack_class), rack_class=rack_class
+        )
 
+    if len(dirs) < 2:
+        return search(dirs[0]) if dirs else None
+
+    # Each probe is a few blocking filesystem calls; on network mounts their
+    # latency dominates, so probe all directories at once and keep the
+    # first hit in priority order.
+    with ThreadPoolExecutor(max_workers=len(dirs)) as pool:
+        return next((found for found in pool.map(search, dirs) if found is not None), None)
+
+
+@functools.lru_cache(maxsize=256)
+def _class_patterns(rack_class: str) -> tuple[re.Pattern[str], ...]:
+    """Compile the file name patterns for any serial of a rack class.
+
+    Args:
+        rack_class: Rack class identifier.
+
+    Returns:
+        Compiled patterns in priority order (``.yaml`` before ``.yml``).
+    """
+    return tuple(
+        re.compile(fnmatch.translate(f"{rack_class}_*{suffix}")) for suffix in (".yaml", ".yml")
+    )
+
+
+def _find_exact(search_dir: Path, file_names: list[str]) -> Path | None:
+    """Look for an instance config file by exact name in one directory.
+
+    Args:
+        search_dir: Directory to search.
+        file_names: File names to look for, in priority order.
+
+    Returns:
+        Path to the first existing file, or None if none exists.
+    """
+    for file_name in file_names:
+        candidate = search_dir / file_name
+        if candidate.is_file():
+            return candidate
     return None
 
 
+def _find_matching(
+    search_dir: Path, patterns: tuple[re.Pattern[str], ...], rack_class: str
+) -> Path | None:
+    """Look for an instance config file matching a pattern in one directory.
+
+    Args:
+        search_dir: Directory to search.
+        patterns: Compiled file name patterns, in priority order.
+        rack_class: Rack class being searched for, used to tell apart files
+            of classes that share a name prefix.
+
+    Returns:
+        Path to the first matching file, or None if nothing matches.
+    """
+    # Match file names from a single directory listing; scandir entries know
+    # their type without a stat, and only the returned match becomes a Path.
+    try:
+        with os.scandir(search_dir) as entries:
+            names = [entry.name for entry in entries if entry.is_file()]
+    except OSError:
+        return None
+    for pattern in patterns:
+        # "rack_a_*.yaml" also matches files of a class named "rack_a_b", so
+        # take the first candidate whose header doesn't name another class.
+        for name in sorted(filter(pattern.match, names)):
+            candidate = search_dir / name
+            if _read_instance_header(candidate).get("rack_class", rack_class) == rack_class:
+                return candidate
+    return None
+
+
+def _read_instance_header(path: Path) -> dict[str, Any]:
+    """Read the ``rack_instance`` block of an instance config file.
+
+    The file is parsed through the cached loader, so a candidate that is
+    then loaded with :meth:`RackInstanceConfig.from_yaml` is parsed once.
+
+    Args:
+        path: Path to the instance YAML file.
+
+    Returns:
+        The ``rack_instance`` mapping, or an empty dict if the file can't be
+        read or has none.
+    """
+    import yaml  # pylint: disable=import-outside-toplevel
+
+    try:
+        st = path.stat()
+        data = _read_instance_yaml(path.resolve(), st.st_mtime_ns, st.st_size, st.st_ino)
+    except (OSError, yaml.YAMLError):
+        return {}
+
+    header = data.get("rack_instance") if isinstance(data, dict) else None
+    return header if isinstance(header, dict) else {}
+
+
 def load_instance_config(
     rack_class: str,
     serial_number: str | None = None,
@@ -12,6 +12,7 @@ Example:
 
 from __future__ import annotations
 
+import functools
 import importlib
 from typing import Any, Callable
 
@@ -19,6 +20,9 @@ from typing import Any, Callable
 def load_driver(driver_path: str) -> Callable[..., Any]:
     """Load an instrument driver factory function from a module path.
 
+    Resolved factories are cached, so repeated loads of the same driver skip
+    the import machinery.
+
     Args:
         driver_path: Path in "module:function" format
             (e.g., "hwtest_bkprecision.psu:create_instrument").
@@ -41,6 +45,25 @@ def load_driver(driver_path: str) -> Callable[..., Any]:
     if not module_path or not func_name:
         raise ValueError(f"Invalid driver path '{driver_path}': module and function names required")
 
+    return _load_driver_cached(module_path, func_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_driver_cached(module_path: str, func_name: str) -> Callable[..., Any]:
+    """Import a module and resolve a factory function from it, memoized.
+
+    Args:
+        module_path: Dotted module path.
+        func_name: Name of the factory function in the module.
+
+    Returns:
+        The loaded factory function.
+
+    Raises:
+        ImportError: If the module cannot be imported.
+        AttributeError: If the function doesn't exist in the module.
+        TypeError: If the attribute is not callable.
+    """
     try:
         module = importlib.import_module(module_path)
     except ImportError as exc:
@@ -52,6 +75,6 @@ def load_driver(driver_path: str) -> Callable[..., Any]:
         raise AttributeError(f"Module '{module_path}' has no attribute '{func_name}'") from exc
 
     if not callable(factory):
-        raise TypeError(f"'{driver_path}' is not callable")
+        raise TypeError(f"'{module_path}:{func_name}' is not callable")
 
     return factory
@@ -1,16 +1,17 @@
-"""Pydantic models for REST API responses.
+"""Data models for REST API responses.
 
 This module defines the data models used by the test rack REST API for
-serializing responses. All models use Pydantic for validation and
-automatic JSON serialization.
+serializing responses. The models are plain dataclasses: they are only
+built by the rack from already-typed values, so they skip the per-field
+validation a Pydantic model runs on construction. FastAPI still serializes
+them and documents them in the OpenAPI schema.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from enum import Enum
 
-from pydantic import BaseModel
-
 
 class InstrumentState(str, Enum):
     """State of an instrument in the rack lifecycle.
@@ -35,7 +36,8 @@ class InstrumentState(str, Enum):
     CLOSED = "closed"
 
 
-class IdentityModel(BaseModel):
+@dataclass(slots=True)
+class IdentityModel:
     """Instrument identity information returned from the device.
 
     This model represents the response from an instrument's identity query
@@ -54,7 +56,8 @@ class IdentityModel(BaseModel):
     firmware: str
 
 
-class InstrumentStatus(BaseModel):
+@dataclass(slots=True)
+class InstrumentStatus:
     """Status of a single instrument in the rack.
 
     Attributes:
@@ -76,7 +79,8 @@ class InstrumentStatus(BaseModel):
     error: str | None = None
 
 
-class RackStatus(BaseModel):
+@dataclass(slots=True)
+class RackStatus:
     """Status of the entire test rack.
 
     Attributes:
@@ -92,7 +96,8 @@ class RackStatus(BaseModel):
     instruments: list[InstrumentStatus]
 
 
-class HealthResponse(BaseModel):
+@dataclass(slots=True)
+class HealthResponse:
     """Health check response for monitoring and load balancers.
 
     Attributes:
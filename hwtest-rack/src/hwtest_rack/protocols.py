@@ -3,14 +3,17 @@
 These protocols define the interface for logical channels that wrap physical
 instrument channels. Test code uses these interfaces to interact with channels
 by logical name, independent of the physical instrument implementation.
+
+The protocols are for static type checking only. They are not runtime
+checkable: an ``isinstance()`` check against a protocol this wide would probe
+every method on each call, so check for the specific method needed instead.
 """
 
 from __future__ import annotations
 
-from typing import Protocol, runtime_checkable
+from typing import Protocol
 
 
-@runtime_checkable
 class DcPsuChannel(Protocol):
     """Protocol for a single DC power supply channel (logical device).
 
@@ -121,7 +124,6 @@ class DcPsuChannel(Protocol):
         ...
 
 
-@runtime_checkable
 class MultiChannelPsu(Protocol):
     """Protocol for a multi-channel DC power supply instrument.
 
@@ -161,7 +163,6 @@ class MultiChannelPsu(Protocol):
         ...
 
 
-@runtime_checkable
 class ElectronicLoadChannel(Protocol):
     """Protocol for a single electronic load channel (logical device).
 
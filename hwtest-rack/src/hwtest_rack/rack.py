@@ -21,9 +21,14 @@ Example:
 
 from __future__ import annotations
 
+import functools
 import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
 from dataclasses import dataclass, field
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Callable, Protocol
 
 from hwtest_core.types.common import InstrumentIdentity
 
@@ -40,15 +45,53 @@ from hwtest_rack.protocols import DcPsuChannel
 
 logger = logging.getLogger(__name__)
 
+# Optional instrument methods, detected once per instance by _capabilities().
+_CAN_OPEN = 1 << 0
+_CAN_CLOSE = 1 << 1
+_CAN_GET_IDENTITY = 1 << 2
+_CAN_GET_CHANNEL_BY_NAME = 1 << 3
+_CAN_GET_CHANNEL = 1 << 4
+_CAN_ANALOG_WRITE = 1 << 5
+_CAN_A_OUT_WRITE = 1 << 6
+_CAN_READ_VOLTAGE = 1 << 7
+_CAN_A_IN_READ = 1 << 8
+
+_CAPABILITY_METHODS: tuple[tuple[int, str], ...] = (
+    (_CAN_OPEN, "open"),
+    (_CAN_CLOSE, "close"),
+    (_CAN_GET_IDENTITY, "get_identity"),
+    (_CAN_GET_CHANNEL_BY_NAME, "get_channel_by_name"),
+    (_CAN_GET_CHANNEL, "get_channel"),
+    (_CAN_ANALOG_WRITE, "analog_write"),
+    (_CAN_A_OUT_WRITE, "a_out_write"),
+    (_CAN_READ_VOLTAGE, "read_voltage"),
+    (_CAN_A_IN_READ, "a_in_read"),
+)
+
+
+def _capabilities(instance: Any) -> int:
+    """Detect which optional methods an instrument instance provides.
+
+    Args:
+        instance: Instrument instance created by a driver factory.
+
+    Returns:
+        Bitmask of ``_CAN_*`` flags.
+    """
+    caps = 0
+    for flag, method in _CAPABILITY_METHODS:
+        if callable(getattr(instance, method, None)):
+            caps |= flag
+    return caps
+
 
-@runtime_checkable
 class Instrument(Protocol):
     """Protocol for instruments that support identity queries.
 
-    This protocol is used for runtime type checking to determine if an
-    instrument instance supports identity verification. Instruments that
-    implement this protocol can have their identity verified against the
-    expected configuration.
+    Instruments that implement this protocol can have their identity
+    verified against the expected configuration. The protocol is for static
+    type checking only; at runtime the rack checks for a callable
+    ``get_identity`` attribute instead of using ``isinstance()``.
     """
 
     def get_identity(self) -> InstrumentIdentity:
@@ -61,8 +104,10 @@ class Instrument(Protocol):
         ...
 
 
-@dataclass
-class ManagedInstrument:
+# The attributes beyond the lifecycle state are values computed once at
+# initialization so status building and channel access need no lookups.
+@dataclass(slots=True)
+class ManagedInstrument:  # pylint: disable=too-many-instance-attributes
     """An instrument managed by the rack.
 
     Wraps an instrument instance with lifecycle state tracking and
@@ -74,6 +119,16 @@ class ManagedInstrument:
         instance: The instrument instance created by the driver factory.
         identity: The verified identity returned by get_identity().
         error: Error message if initialization failed or identity mismatched.
+        identity_model: API model of ``identity``, built once when it is set.
+        caps: Bitmask of the optional methods ``instance`` provides.
+        close_fn: Bound close() method of ``instance``, if it has one.
+
+    The fields are written by an initialization worker while other threads
+    may be building a status, without a lock. Writers publish ``state``
+    last, after ``identity``/``identity_model`` and ``error``, and readers
+    read ``state`` first, so a reader that sees READY or ERROR also sees
+    the identity and error that go with it. Single attribute reads and
+    writes are atomic in CPython.
     """
 
     config: InstrumentConfig
@@ -81,10 +136,49 @@ class ManagedInstrument:
     instance: Any = None
     identity: InstrumentIdentity | None = None
     error: str | None = None
+    identity_model: IdentityModel | None = None
+    caps: int = 0
+    close_fn: Callable[[], object] | None = None
+    # Status fields that come straight from the immutable config:
+    # (name, driver, expected manufacturer, expected model).
+    status_prefix: tuple[str, str, str, str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the config-derived status fields."""
+        config = self.config
+        self.status_prefix = (
+            config.name,
+            config.driver,
+            config.identity.manufacturer,
+            config.identity.model,
+        )
 
+    def to_status(self) -> InstrumentStatus:
+        """Build the current status of this instrument.
 
-@dataclass
-class Rack:
+        Returns:
+            Status combining the fixed config fields with the current state.
+        """
+        # Read state before the fields published ahead of it.
+        state = self.state
+        error = self.error
+        identity_model = self.identity_model
+        name, driver, expected_manufacturer, expected_model = self.status_prefix
+        return InstrumentStatus(
+            name=name,
+            driver=driver,
+            state=state,
+            expected_manufacturer=expected_manufacturer,
+            expected_model=expected_model,
+            identity=identity_model,
+            error=error,
+        )
+
+
+# Most attributes are per-rack caches and the locks and counters that keep
+# them consistent across initialization workers.
+@dataclass(slots=True)
+class Rack:  # pylint: disable=too-many-instance-attributes
     """Test rack orchestrator.
 
     Manages loading, initializing, and monitoring instruments.
@@ -109,6 +203,26 @@ class Rack:
     config: RackConfig
     _instruments: dict[str, ManagedInstrument] = field(default_factory=dict, init=False)
     _state: str = field(default="initializing", init=False)
+    _futures: dict[str, Future[None]] = field(default_factory=dict, init=False)
+    # Instruments that finished initialization successfully, until close().
+    _ready: dict[str, ManagedInstrument] = field(default_factory=dict, init=False)
+    _pending: int = field(default=0, init=False)
+    # Bumped by initialize() and close(); initialization workers started
+    # under an older generation were given up on and their results dropped.
+    _generation: int = field(default=0, init=False)
+    # Guards _pending, _generation, and the state and ready set they decide.
+    _pending_lock: threading.Lock = field(default_factory=threading.Lock, init=False)
+    _status_cache: RackStatus | None = field(default=None, init=False)
+    _status_dirty: bool = field(default=True, init=False)
+    _status_lock: threading.Lock = field(default_factory=threading.Lock, init=False)
+    # PSU channels from the registry and their logical names.
+    _psu_names: tuple[tuple[LogicalChannel, ...], tuple[str, ...]] = field(
+        default=((), ()), init=False
+    )
+    # Logical PSU channel name -> call that resolved it, until close().
+    _psu_cache: dict[str, Callable[[], DcPsuChannel | None]] = field(
+        default_factory=dict, init=False
+    )
 
     def __post_init__(self) -> None:
         """Initialize managed instruments from config.
@@ -137,145 +251,328 @@ class Rack:
         """
         return self._state
 
-    def initialize(self) -> None:
+    def initialize(self, wait: bool = True) -> None:
         """Initialize all instruments.
 
         Loads drivers, creates instances, and verifies identities.
-        Sets the rack state based on initialization results.
+        Instruments are brought up concurrently, up to the configured
+        ``max_init_concurrency`` at a time, since opening a connection and
+        querying identity are dominated by I/O wait. Sets the rack state
+        based on initialization results once every instrument is done.
+
+        Args:
+            wait: If True, return once all instruments are initialized. If
+                False, return immediately and let initialization continue in
+                the background; the rack stays "initializing" until it
+                finishes, and accessing an instrument waits for that
+                instrument only.
         """
-        all_ready = True
+        self.config.preload_drivers()
+
+        with self._pending_lock:
+            self._generation += 1
+            generation = self._generation
+            self._state = "initializing"
+            self._pending = len(self._instruments)
+            self._ready.clear()
+            self._futures = {}
+        self._psu_cache.clear()
+        self._mark_dirty()
+
+        if not self._instruments:
+            self._finish_initialize()
+            return
 
-        for name, managed in self._instruments.items():
-            managed.state = InstrumentState.INITIALIZING
+        max_workers = min(len(self._instruments), self.config.max_init_concurrency)
+        pool = ThreadPoolExecutor(max_workers=max_workers)
+        self._futures = {
+            name: pool.submit(self._run_init, name, managed, generation)
+            for name, managed in self._instruments.items()
+        }
+        # Already submitted work still runs after a non-blocking shutdown.
+        pool.shutdown(wait=wait)
 
-            try:
-                # Load the driver factory
-                factory = load_driver(managed.config.driver)
-
-                # Create the instrument instance
-                instance = factory(**managed.config.kwargs)
-                managed.instance = instance
-
-                # Open/start the instrument if needed
-                if hasattr(instance, "open"):
-                    instance.open()
-                elif hasattr(instance, "start"):
-                    # For async instruments, we can't await here
-                    # They should be started separately
-                    pass
-
-                # Verify identity if the instrument supports it
-                if isinstance(instance, Instrument):
-                    identity = instance.get_identity()
-                    managed.identity = identity
-
-                    # Check against expected identity
-                    expected = managed.config.identity
-                    if identity.manufacturer != expected.manufacturer:
-                        managed.state = InstrumentState.ERROR
-                        managed.error = (
-                            f"Manufacturer mismatch: expected '{expected.manufacturer}', "
-                            f"got '{identity.manufacturer}'"
-                        )
-                        all_ready = False
-                        logger.error("Instrument %s: %s", name, managed.error)
-                        continue
-
-                    if identity.model != expected.model:
-                        managed.state = InstrumentState.ERROR
-                        managed.error = (
-                            f"Model mismatch: expected '{expected.model}', "
-                            f"got '{identity.model}'"
-                        )
-                        all_ready = False
-                        logger.error("Instrument %s: %s", name, managed.error)
-                        continue
-
-                managed.state = InstrumentState.READY
+    def _run_init(self, name: str, managed: ManagedInstrument, generation: int) -> None:
+        """Initialize one instrument and finish the rack after the last one.
+
+        The rack state is set inside the task, before its future completes,
+        so anyone who waited on the last future sees the final state.
+
+        Args:
+            name: Instrument name.
+            managed: The instrument to initialize.
+            generation: Rack generation the initialization belongs to.
+        """
+        try:
+            self._init_one(name, managed, generation)
+        finally:
+            self._mark_dirty()
+            with self._pending_lock:
+                # Only initialization the rack still waits for counts
+                if generation == self._generation:
+                    self._pending -= 1
+                    if not self._pending:
+                        self._finish_initialize()
+
+    def _finish_initialize(self) -> None:
+        """Set the rack state from the instruments' initialization results."""
+        all_ready = all(
+            managed.state is InstrumentState.READY for managed in self._instruments.values()
+        )
+        self._state = "ready" if all_ready else "error"
+        self._mark_dirty()
+
+    def _mark_dirty(self) -> None:
+        """Invalidate the cached status after a rack or instrument change.
+
+        Call after the change is made, so a rebuild that races with it is
+        followed by another one.
+        """
+        self._status_dirty = True
+
+    def _wait_for(self, name: str) -> None:
+        """Block until an instrument's initialization, if started, has finished.
+
+        Args:
+            name: Instrument name.
+        """
+        future = self._futures.get(name)
+        if future is not None:
+            future.result()
+
+    def _init_one(self, name: str, managed: ManagedInstrument, generation: int) -> None:
+        """Initialize a single instrument.
+
+        Runs on a worker thread and only modifies ``managed``, setting its
+        state last (see ManagedInstrument), and adds it to the ready set.
+        Failures are recorded on it rather than raised.
+
+        Args:
+            name: Instrument name.
+            managed: The instrument to initialize.
+            generation: Rack generation the initialization belongs to.
+        """
+        managed.error = None
+        managed.state = InstrumentState.INITIALIZING
+        self._mark_dirty()
+
+        try:
+            # Load the driver factory
+            factory = load_driver(managed.config.driver)
+
+            # Create the instrument instance
+            instance = factory(**managed.config.kwargs)
+            caps = _capabilities(instance)
+            managed.instance = instance
+            managed.caps = caps
+            managed.close_fn = instance.close if caps & _CAN_CLOSE else None
+
+            # Open the instrument if needed. Async instruments with start()
+            # can't be awaited here; they should be started separately.
+            if caps & _CAN_OPEN:
+                instance.open()
+
+            # Verify identity if the instrument supports it
+            if caps & _CAN_GET_IDENTITY:
+                identity = instance.get_identity()
+                managed.identity = identity
+                managed.identity_model = IdentityModel(
+                    manufacturer=identity.manufacturer,
+                    model=identity.model,
+                    serial=identity.serial,
+                    firmware=identity.firmware,
+                )
+
+                # Check against expected identity
+                expected = managed.config.identity
+                if identity.manufacturer != expected.manufacturer:
+                    managed.error = (
+                        f"Manufacturer mismatch: expected '{expected.manufacturer}', "
+                        f"got '{identity.manufacturer}'"
+                    )
+                    managed.state = InstrumentState.ERROR
+                    logger.error("Instrument %s: %s", name, managed.error)
+                    return
+
+                if identity.model != expected.model:
+                    managed.error = (
+                        f"Model mismatch: expected '{expected.model}', got '{identity.model}'"
+                    )
+                    managed.state = InstrumentState.ERROR
+                    logger.error("Instrument %s: %s", name, managed.error)
+                    return
+
+            managed.state = InstrumentState.READY
+            with self._pending_lock:
+                # Not once close() or a new initialize() has given up on it
+                if generation == self._generation:
+                    self._ready[name] = managed
+            if logger.isEnabledFor(logging.INFO):
+                identity = managed.identity
+                manufacturer, model, serial = (
+                    (identity.manufacturer, identity.model, identity.serial)
+                    if identity
+                    else ("unknown", "unknown", "unknown")
+                )
                 logger.info(
                     "Instrument %s initialized: %s %s (S/N: %s)",
                     name,
-                    managed.identity.manufacturer if managed.identity else "unknown",
-                    managed.identity.model if managed.identity else "unknown",
-                    managed.identity.serial if managed.identity else "unknown",
+                    manufacturer,
+                    model,
+                    serial,
                 )
 
-            except Exception as exc:  # pylint: disable=broad-exception-caught
-                managed.state = InstrumentState.ERROR
-                managed.error = str(exc)
-                all_ready = False
-                logger.error("Failed to initialize instrument %s: %s", name, exc)
-
-        self._state = "ready" if all_ready else "error"
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            managed.error = str(exc)
+            managed.state = InstrumentState.ERROR
+            logger.error("Failed to initialize instrument %s: %s", name, exc)
 
-    def close(self) -> None:
+    def close(self, timeout: float = 5.0) -> None:
         """Close all instruments.
 
-        Iterates through all instruments and calls their close() method
-        if available. Sets all instruments to CLOSED state and the rack
-        to "closed" state. Errors during close are logged but do not
-        prevent other instruments from being closed.
+        Waits for any initialization still running in the background, then
+        calls each instrument's close() method, if available, concurrently
+        and sets the instruments to CLOSED state and the rack to "closed"
+        state. Errors during close are logged but do not prevent other
+        instruments from being closed.
+
+        The timeout covers both waits. Instruments still initializing when
+        it expires are left behind without being closed, and instruments
+        that have not closed by then are set to ERROR; a close() that
+        finishes later does not change their state. Their worker threads
+        keep running, and since executor threads are joined at interpreter
+        exit, a driver call that never returns still blocks exit.
+
+        Args:
+            timeout: Seconds to wait for initialization and close to finish.
         """
-        for name, managed in self._instruments.items():
-            if managed.instance is not None:
-                try:
-                    if hasattr(managed.instance, "close"):
-                        managed.instance.close()
+        deadline = time.monotonic() + timeout
+        _, init_running = wait_futures(self._futures.values(), timeout=timeout)
+        with self._pending_lock:
+            self._generation += 1
+            self._state = "closed"
+            self._ready.clear()
+        self._psu_cache.clear()
+
+        still_initializing = {
+            name for name, future in self._futures.items() if future in init_running
+        }
+        for name in still_initializing:
+            logger.warning("Instrument %s still initializing at close; not closed", name)
+
+        opened = [
+            (name, managed)
+            for name, managed in self._instruments.items()
+            if managed.instance is not None and name not in still_initializing
+        ]
+        if opened:
+            pool = ThreadPoolExecutor(max_workers=min(len(opened), 16))
+            futures = {
+                pool.submit(self._close_one, name, managed): managed for name, managed in opened
+            }
+            _, not_done = wait_futures(futures, timeout=max(0.0, deadline - time.monotonic()))
+            pool.shutdown(wait=False)
+
+            # Only this thread writes the close results, so a close that
+            # completes after the timeout cannot overwrite the error.
+            for future, managed in futures.items():
+                if future in not_done:
+                    managed.error = f"Close timed out after {timeout} s"
+                    managed.state = InstrumentState.ERROR
+                    logger.warning("Instrument %s: %s", managed.config.name, managed.error)
+                elif future.result():
                     managed.state = InstrumentState.CLOSED
-                except Exception as exc:  # pylint: disable=broad-exception-caught
-                    logger.warning("Error closing instrument %s: %s", name, exc)
 
-        self._state = "closed"
+        self._mark_dirty()
+
+    def _close_one(self, name: str, managed: ManagedInstrument) -> bool:
+        """Close a single instrument.
+
+        Runs on a worker thread and leaves the state change to close().
+        Errors are logged rather than raised.
+
+        Args:
+            name: Instrument name.
+            managed: The instrument to close.
+
+        Returns:
+            True if the instrument closed without error.
+        """
+        try:
+            close_fn = managed.close_fn
+            if close_fn is not None:
+                close_fn()
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.warning("Error closing instrument %s: %s", name, exc)
+            return False
+        return True
 
     def get_instrument(self, name: str) -> Any | None:
         """Get an instrument instance by name.
 
+        If the instrument is still initializing in the background, waits
+        for it to finish first.
+
         Args:
             name: Instrument name.
 
         Returns:
             The instrument instance, or None if not found or not ready.
         """
-        managed = self._instruments.get(name)
-        if managed and managed.state == InstrumentState.READY:
-            return managed.instance
-        return None
+        managed = self._ready_instrument(name)
+        return managed.instance if managed is not None else None
+
+    def _ready_instrument(self, name: str) -> ManagedInstrument | None:
+        """Get a managed instrument by name if it is ready.
+
+        Ready instruments are found with a single lookup. Otherwise waits
+        for a background initialization of the instrument, if any.
+
+        Args:
+            name: Instrument name.
+
+        Returns:
+            The managed instrument, or None if not found or not ready.
+        """
+        managed = self._ready.get(name)
+        if managed is None:
+            self._wait_for(name)
+            managed = self._ready.get(name)
+        return managed
 
     def get_status(self) -> RackStatus:
         """Get the current rack status.
 
+        The status is cached and only rebuilt after the rack or one of its
+        instruments changes state. The returned object is shared between
+        callers and must not be modified.
+
         Returns:
             Status of the rack and all instruments.
         """
-        instruments: list[InstrumentStatus] = []
-
-        for managed in self._instruments.values():
-            identity_model = None
-            if managed.identity:
-                identity_model = IdentityModel(
-                    manufacturer=managed.identity.manufacturer,
-                    model=managed.identity.model,
-                    serial=managed.identity.serial,
-                    firmware=managed.identity.firmware,
-                )
+        status = self._status_cache
+        if status is not None and not self._status_dirty:
+            return status
 
-            instruments.append(
-                InstrumentStatus(
-                    name=managed.config.name,
-                    driver=managed.config.driver,
-                    state=managed.state,
-                    expected_manufacturer=managed.config.identity.manufacturer,
-                    expected_model=managed.config.identity.model,
-                    identity=identity_model,
-                    error=managed.error,
-                )
-            )
+        with self._status_lock:
+            # Clear the flag before building, so a change made during the
+            # build marks the new status dirty again.
+            if self._status_dirty or self._status_cache is None:
+                self._status_dirty = False
+                self._status_cache = self._build_status()
+            return self._status_cache
+
+    def _build_status(self) -> RackStatus:
+        """Build the rack status from the current instrument states.
 
+        Returns:
+            Status of the rack and all instruments.
+        """
         return RackStatus(
             rack_id=self.config.rack_id,
             description=self.config.description,
             state=self._state,
-            instruments=instruments,
+            instruments=[managed.to_status() for managed in self._instruments.values()],
         )
 
     def get_instrument_status(self, name: str) -> InstrumentStatus | None:
@@ -290,29 +587,14 @@ class Rack:
         managed = self._instruments.get(name)
         if not managed:
             return None
-
-        identity_model = None
-        if managed.identity:
-            identity_model = IdentityModel(
-                manufacturer=managed.identity.manufacturer,
-                model=managed.identity.model,
-                serial=managed.identity.serial,
-                firmware=managed.identity.firmware,
-            )
-
-        return InstrumentStatus(
-            name=managed.config.name,
-            driver=managed.config.driver,
-            state=managed.state,
-            expected_manufacturer=managed.config.identity.manufacturer,
-            expected_model=managed.config.identity.model,
-            identity=identity_model,
-            error=managed.error,
-        )
+        return managed.to_status()
 
     def list_instruments(self) -> list[InstrumentStatus]:
         """List all instrument statuses.
 
+        The list is shared with the cached rack status and must not be
+        modified.
+
         Returns:
             List of instrument statuses.
         """
@@ -367,6 +649,31 @@ class Rack:
         The instrument must implement the MultiChannelPsu protocol
         (have a get_channel_by_name method).
 
+        The way a channel was resolved is remembered, so later calls for the
+        same name skip the lookups until the rack is closed.
+
+        Args:
+            logical_name: The logical channel name.
+
+        Returns:
+            DcPsuChannel interface, or None if not found.
+        """
+        resolve = self._psu_cache.get(logical_name)
+        if resolve is not None:
+            try:
+                psu_channel = resolve()
+            except (KeyError, IndexError):
+                psu_channel = None
+            if psu_channel is not None:
+                return psu_channel
+            # The cached way no longer finds the channel; forget it and look
+            # the channel up again, falling back the way a fresh lookup does
+            self._psu_cache.pop(logical_name, None)
+        return self._resolve_psu_channel(logical_name)
+
+    def _resolve_psu_channel(self, logical_name: str) -> DcPsuChannel | None:
+        """Look up a PSU channel and cache how it was found.
+
         Args:
             logical_name: The logical channel name.
 
@@ -386,27 +693,36 @@ class Rack:
             )
             return None
 
-        instrument = self.get_instrument(channel.instrument_name)
-        if instrument is None:
+        managed = self._ready_instrument(channel.instrument_name)
+        if managed is None:
             logger.warning(
                 "Instrument '%s' for channel '%s' not ready",
                 channel.instrument_name,
                 logical_name,
             )
             return None
+        instrument = managed.instance
 
         # Try to get channel by name (MultiChannelPsu protocol)
-        if hasattr(instrument, "get_channel_by_name"):
+        if managed.caps & _CAN_GET_CHANNEL_BY_NAME:
             psu_channel = instrument.get_channel_by_name(logical_name)
             if psu_channel is not None:
+                self._psu_cache[logical_name] = functools.partial(
+                    instrument.get_channel_by_name, logical_name
+                )
                 return psu_channel
 
         # Try to get channel by ID
-        if hasattr(instrument, "get_channel"):
+        if managed.caps & _CAN_GET_CHANNEL:
             try:
-                return instrument.get_channel(channel.channel_id)
+                psu_channel = instrument.get_channel(channel.channel_id)
             except (KeyError, IndexError):
                 pass
+            else:
+                self._psu_cache[logical_name] = functools.partial(
+                    instrument.get_channel, channel.channel_id
+                )
+                return psu_channel
 
         logger.warning(
             "Instrument '%s' does not support channel access",
@@ -427,8 +743,8 @@ class Rack:
             List of LogicalChannel info.
         """
         if channel_type is None:
-            return self.config.channel_registry.list_all()
-        return self.config.channel_registry.get_by_type(channel_type)
+            return list(self.config.channel_registry.list_all())
+        return list(self.config.channel_registry.get_by_type(channel_type))
 
     def list_psu_channels(self) -> list[str]:
         """List all PSU logical channel names.
@@ -437,7 +753,13 @@ class Rack:
             List of logical names for PSU channels.
         """
         channels = self.config.channel_registry.get_by_type(ChannelType.PSU)
-        return [ch.logical_name for ch in channels]
+        # The registry replaces its per-type tuple whenever a channel is
+        # added, so the names stay valid while the tuple is the same object.
+        cached_channels, names = self._psu_names
+        if channels is not cached_channels:
+            names = tuple(ch.logical_name for ch in channels)
+            self._psu_names = (channels, names)
+        return list(names)
 
     # -------------------------------------------------------------------------
     # Analog Channel Operations
@@ -462,20 +784,21 @@ class Rack:
         if channel is None:
             raise ValueError(f"Logical channel '{logical_name}' not found")
 
-        instrument = self.get_instrument(channel.instrument_name)
-        if instrument is None:
+        managed = self._ready_instrument(channel.instrument_name)
+        if managed is None:
             raise ValueError(
                 f"Instrument '{channel.instrument_name}' for channel "
                 f"'{logical_name}' not ready"
             )
+        instrument = managed.instance
 
         # Try analog_write method (MCC 152 style)
-        if hasattr(instrument, "analog_write"):
+        if managed.caps & _CAN_ANALOG_WRITE:
             instrument.analog_write(channel.channel_id, voltage)
             return
 
         # Try a_out_write method (raw daqhats style)
-        if hasattr(instrument, "a_out_write"):
+        if managed.caps & _CAN_A_OUT_WRITE:
             instrument.a_out_write(channel.channel_id, voltage)
             return
 
@@ -504,19 +827,20 @@ class Rack:
         if channel is None:
             raise ValueError(f"Logical channel '{logical_name}' not found")
 
-        instrument = self.get_instrument(channel.instrument_name)
-        if instrument is None:
+        managed = self._ready_instrument(channel.instrument_name)
+        if managed is None:
             raise ValueError(
                 f"Instrument '{channel.instrument_name}' for channel "
                 f"'{logical_name}' not ready"
             )
+        instrument = managed.instance
 
         # Try read_voltage method (MCC 118 style)
-        if hasattr(instrument, "read_voltage"):
+        if managed.caps & _CAN_READ_VOLTAGE:
             return instrument.read_voltage(channel.channel_id)
 
         # Try a_in_read method (raw daqhats style)
-        if hasattr(instrument, "a_in_read"):
+        if managed.caps & _CAN_A_IN_READ:
             return instrument.a_in_read(channel.channel_id)
 
         raise ValueError(
@@ -16,6 +16,10 @@ Example:
     # Start the server
     hwtest-rack configs/rack.yaml --port 8000
 
+    # Install the uvloop extra (pip install "hwtest-rack[uvloop]") and uvicorn
+    # picks up uvloop and httptools automatically, falling back to asyncio
+    # and h11 where they are not available.
+
     # Or programmatically
     from hwtest_rack.server import create_app
     app = create_app("rack.yaml")
@@ -24,14 +28,17 @@ Example:
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
 import sys
 from contextlib import asynccontextmanager
+from html import escape
 from pathlib import Path
 from typing import Any, AsyncGenerator
 
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
+from pydantic import TypeAdapter
 
 from hwtest_rack.config import load_config
 from hwtest_rack.models import HealthResponse, InstrumentStatus, RackStatus
@@ -42,6 +49,140 @@ logger = logging.getLogger(__name__)
 # Global rack instance (set during lifespan)
 _rack: Rack | None = None
 
+# Last rendered dashboard and encoded JSON bodies, with the status object
+# each was built from. The rack hands out the same status object (and
+# instrument list) until something changes.
+# pylint: disable=invalid-name
+_dashboard_cache: tuple[RackStatus, bytes] | None = None
+_status_json_cache: tuple[RackStatus, bytes] | None = None
+_instruments_json_cache: tuple[list[InstrumentStatus], bytes] | None = None
+# pylint: enable=invalid-name
+
+# Serializers built once at import. Routes return pre-encoded JSON through
+# these instead of letting FastAPI validate and encode the response model on
+# every request; the response_model on each route still documents the shape.
+_HEALTH_ADAPTER = TypeAdapter(HealthResponse)
+_RACK_STATUS_ADAPTER = TypeAdapter(RackStatus)
+_INSTRUMENT_ADAPTER = TypeAdapter(InstrumentStatus)
+_INSTRUMENT_LIST_ADAPTER = TypeAdapter(list[InstrumentStatus])
+
+
+# Dashboard state colors, by state value
+_DEFAULT_COLOR = "#6c757d"
+_STATE_COLORS = {
+    "ready": "#28a745",
+    "error": "#dc3545",
+    "pending": "#6c757d",
+    "initializing": "#ffc107",
+    "closed": "#6c757d",
+}
+_RACK_STATE_COLORS = {
+    "ready": "#28a745",
+    "error": "#dc3545",
+    "initializing": "#ffc107",
+    "closed": "#6c757d",
+}
+
+# Static parts of the dashboard page, encoded once. Only the rack ID in the
+# title, the rack info and the instrument rows are rendered per request.
+_DASHBOARD_HEAD = b"""<!DOCTYPE html>
+<html>
+<head>
+    <title>"""
+
+_DASHBOARD_STYLE = b""" - hwtest Rack</title>
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
+            margin: 0;
+            padding: 20px;
+            background: #f5f5f5;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+            padding: 20px;
+        }
+        h1 {
+            margin-top: 0;
+            color: #333;
+        }
+        .rack-info {
+            margin-bottom: 20px;
+            padding: 15px;
+            background: #f8f9fa;
+            border-radius: 4px;
+        }
+        .rack-state {
+            font-size: 1.2em;
+            font-weight: bold;
+        }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+        }
+        th, td {
+            text-align: left;
+            padding: 12px;
+            border-bottom: 1px solid #dee2e6;
+        }
+        th {
+            background: #f8f9fa;
+            font-weight: 600;
+        }
+        code {
+            background: #f1f1f1;
+            padding: 2px 6px;
+            border-radius: 3px;
+            font-size: 0.9em;
+        }
+        .api-links {
+            margin-top: 20px;
+            padding-top: 20px;
+            border-top: 1px solid #dee2e6;
+        }
+        .api-links a {
+            margin-right: 15px;
+            color: #007bff;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>hwtest Rack Dashboard</h1>
+"""
+
+_DASHBOARD_TABLE_HEAD = b"""        <table>
+            <thead>
+                <tr>
+                    <th>Name</th>
+                    <th>Driver</th>
+                    <th>State</th>
+                    <th>Identity</th>
+                </tr>
+            </thead>
+            <tbody>
+"""
+
+_DASHBOARD_TAIL = b"""
+            </tbody>
+        </table>
+
+        <div class="api-links">
+            <strong>API Endpoints:</strong>
+            <a href="/health">/health</a>
+            <a href="/status">/status</a>
+            <a href="/instruments">/instruments</a>
+            <a href="/docs">/docs (OpenAPI)</a>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
 
 def _get_rack() -> Rack:
     """Get the global rack instance.
@@ -79,7 +220,8 @@ def create_app(config_path: str | Path | None = None) -> FastAPI:
         Yields:
             None during application lifetime.
         """
-        global _rack  # pylint: disable=global-statement
+        # pylint: disable-next=global-statement
+        global _rack, _dashboard_cache, _status_json_cache, _instruments_json_cache
 
         cfg_path = app_state.get("config_path")
         if cfg_path:
@@ -97,6 +239,7 @@ def create_app(config_path: str | Path | None = None) -> FastAPI:
             logger.info("Shutting down rack '%s'", _rack.rack_id)
             _rack.close()
             _rack = None
+        _dashboard_cache = _status_json_cache = _instruments_json_cache = None
 
     app = FastAPI(
         title="hwtest Rack API",
@@ -122,198 +265,192 @@ def create_app(config_path: str | Path | None = None) -> FastAPI:
 async def _dashboard() -> HTMLResponse:
     """HTML dashboard showing all instruments.
 
+    The page is only re-rendered when the rack returns a new status, which
+    it does after a rack or instrument state change.
+
     Returns:
         HTMLResponse with a styled dashboard showing rack status and
         all instrument states with their identities and any errors.
     """
+    global _dashboard_cache  # pylint: disable=global-statement
+
     rack = _get_rack()
     status = rack.get_status()
 
-    # Build instrument rows
-    rows = []
+    cached = _dashboard_cache
+    if cached is None or cached[0] is not status:
+        cached = (status, _render_dashboard(status))
+        _dashboard_cache = cached
+    return HTMLResponse(content=cached[1])
+
+
+def _render_dashboard(status: RackStatus) -> bytes:
+    """Render the dashboard page for a rack status.
+
+    Text from the config and from instruments is HTML-escaped.
+
+    Args:
+        status: Status of the rack and all instruments.
+
+    Returns:
+        The encoded HTML page.
+    """
+    rack_state_color = _RACK_STATE_COLORS.get(status.state, _DEFAULT_COLOR)
+    rack_id = escape(status.rack_id)
+
+    info = "".join(
+        [
+            '        <div class="rack-info">\n            <p><strong>Rack ID:</strong> ',
+            rack_id,
+            "</p>\n            <p><strong>Description:</strong> ",
+            escape(status.description) if status.description else "(none)",
+            '</p>\n            <p><strong>State:</strong> <span class="rack-state" style="color: ',
+            rack_state_color,
+            ';">',
+            escape(status.state.upper()),
+            "</span></p>\n        </div>\n\n        <h2>Instruments (",
+            str(len(status.instruments)),
+            ")</h2>\n",
+        ]
+    )
+
+    # Instrument rows, built as one list of small pieces and joined once
+    parts: list[str] = []
+    append = parts.append
     for inst in status.instruments:
-        state_color = {
-            "ready": "#28a745",
-            "error": "#dc3545",
-            "pending": "#6c757d",
-            "initializing": "#ffc107",
-            "closed": "#6c757d",
-        }.get(inst.state.value, "#6c757d")
-
-        identity_str = ""
-        if inst.identity:
-            identity_str = f"{inst.identity.manufacturer} {inst.identity.model}"
-            if inst.identity.serial:
-                identity_str += f" (S/N: {inst.identity.serial})"
+        state = inst.state.value
+        append("<tr><td><strong>")
+        append(escape(inst.name))
+        append("</strong></td><td><code>")
+        append(escape(inst.driver))
+        append('</code></td><td><span style="color: ')
+        append(_STATE_COLORS.get(state, _DEFAULT_COLOR))
+        append('; font-weight: bold;">')
+        append(state.upper())
+        append("</span></td><td>")
+        identity = inst.identity
+        if identity:
+            append(escape(identity.manufacturer))
+            append(" ")
+            append(escape(identity.model))
+            if identity.serial:
+                append(" (S/N: ")
+                append(escape(identity.serial))
+                append(")")
         else:
-            identity_str = f"Expected: {inst.expected_manufacturer} {inst.expected_model}"
-
-        error_row = ""
+            append("Expected: ")
+            append(escape(inst.expected_manufacturer))
+            append(" ")
+            append(escape(inst.expected_model))
+        append("</td></tr>\n")
         if inst.error:
-            error_row = f'<tr><td colspan="4" style="color: #dc3545; padding-left: 2em;">Error: {inst.error}</td></tr>'
-
-        rows.append(f"""
-        <tr>
-            <td><strong>{inst.name}</strong></td>
-            <td><code>{inst.driver}</code></td>
-            <td><span style="color: {state_color}; font-weight: bold;">{inst.state.value.upper()}</span></td>
-            <td>{identity_str}</td>
-        </tr>
-        {error_row}
-        """)
-
-    rack_state_color = {
-        "ready": "#28a745",
-        "error": "#dc3545",
-        "initializing": "#ffc107",
-        "closed": "#6c757d",
-    }.get(status.state, "#6c757d")
-
-    html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>{status.rack_id} - hwtest Rack</title>
-        <style>
-            body {{
-                font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
-                margin: 0;
-                padding: 20px;
-                background: #f5f5f5;
-            }}
-            .container {{
-                max-width: 1200px;
-                margin: 0 auto;
-                background: white;
-                border-radius: 8px;
-                box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                padding: 20px;
-            }}
-            h1 {{
-                margin-top: 0;
-                color: #333;
-            }}
-            .rack-info {{
-                margin-bottom: 20px;
-                padding: 15px;
-                background: #f8f9fa;
-                border-radius: 4px;
-            }}
-            .rack-state {{
-                font-size: 1.2em;
-                font-weight: bold;
-                color: {rack_state_color};
-            }}
-            table {{
-                width: 100%;
-                border-collapse: collapse;
-            }}
-            th, td {{
-                text-align: left;
-                padding: 12px;
-                border-bottom: 1px solid #dee2e6;
-            }}
-            th {{
-                background: #f8f9fa;
-                font-weight: 600;
-            }}
-            code {{
-                background: #f1f1f1;
-                padding: 2px 6px;
-                border-radius: 3px;
-                font-size: 0.9em;
-            }}
-            .api-links {{
-                margin-top: 20px;
-                padding-top: 20px;
-                border-top: 1px solid #dee2e6;
-            }}
-            .api-links a {{
-                margin-right: 15px;
-                color: #007bff;
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <h1>hwtest Rack Dashboard</h1>
-            <div class="rack-info">
-                <p><strong>Rack ID:</strong> {status.rack_id}</p>
-                <p><strong>Description:</strong> {status.description or "(none)"}</p>
-                <p><strong>State:</strong> <span class="rack-state">{status.state.upper()}</span></p>
-            </div>
-
-            <h2>Instruments ({len(status.instruments)})</h2>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Name</th>
-                        <th>Driver</th>
-                        <th>State</th>
-                        <th>Identity</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {"".join(rows) if rows else "<tr><td colspan='4'>No instruments configured</td></tr>"}
-                </tbody>
-            </table>
-
-            <div class="api-links">
-                <strong>API Endpoints:</strong>
-                <a href="/health">/health</a>
-                <a href="/status">/status</a>
-                <a href="/instruments">/instruments</a>
-                <a href="/docs">/docs (OpenAPI)</a>
-            </div>
-        </div>
-    </body>
-    </html>
+            append('<tr><td colspan="4" style="color: #dc3545; padding-left: 2em;">Error: ')
+            append(escape(inst.error))
+            append("</td></tr>\n")
+    if not status.instruments:
+        append("<tr><td colspan='4'>No instruments configured</td></tr>\n")
+
+    return b"".join(
+        [
+            _DASHBOARD_HEAD,
+            rack_id.encode(),
+            _DASHBOARD_STYLE,
+            info.encode(),
+            _DASHBOARD_TABLE_HEAD,
+            "".join(parts).encode(),
+            _DASHBOARD_TAIL,
+        ]
+    )
+
+
+def _json_response(content: bytes) -> Response:
+    """Wrap pre-encoded JSON in a response.
+
+    Args:
+        content: JSON-encoded response body.
+
+    Returns:
+        Response with the JSON media type.
     """
-    return HTMLResponse(content=html)
+    return Response(content=content, media_type="application/json")
 
 
-async def _health() -> HealthResponse:
+async def _health() -> Response:
     """Health check endpoint.
 
     Returns:
-        HealthResponse with status "ok" if rack is ready, otherwise
+        JSON HealthResponse with status "ok" if rack is ready, otherwise
         the current rack state.
     """
     rack = _get_rack()
-    return HealthResponse(
-        status="ok" if rack.state == "ready" else rack.state,
-        rack_id=rack.rack_id,
-    )
+    state = rack.state
+    return _json_response(_health_json("ok" if state == "ready" else state, rack.rack_id))
+
 
+@functools.lru_cache(maxsize=16)
+def _health_json(status: str, rack_id: str) -> bytes:
+    """Encode a health response.
+
+    There are only a handful of rack states, so each body is encoded once.
+
+    Args:
+        status: Health status value.
+        rack_id: Rack identifier.
 
-async def _status() -> RackStatus:
+    Returns:
+        JSON-encoded HealthResponse.
+    """
+    return _HEALTH_ADAPTER.dump_json(HealthResponse(status=status, rack_id=rack_id))
+
+
+async def _status() -> Response:
     """Get full rack status.
 
+    The JSON body is reused until the rack returns a new status.
+
     Returns:
-        RackStatus containing rack info and all instrument statuses.
+        JSON RackStatus containing rack info and all instrument statuses.
     """
+    global _status_json_cache  # pylint: disable=global-statement
+
     rack = _get_rack()
-    return rack.get_status()
+    status = rack.get_status()
+
+    cached = _status_json_cache
+    if cached is None or cached[0] is not status:
+        cached = (status, _RACK_STATUS_ADAPTER.dump_json(status))
+        _status_json_cache = cached
+    return _json_response(cached[1])
 
 
-async def _list_instruments() -> list[InstrumentStatus]:
+async def _list_instruments() -> Response:
     """List all instruments.
 
+    The JSON body is reused until the rack returns a new instrument list.
+
     Returns:
-        List of InstrumentStatus for all configured instruments.
+        JSON list of InstrumentStatus for all configured instruments.
     """
+    global _instruments_json_cache  # pylint: disable=global-statement
+
     rack = _get_rack()
-    return rack.list_instruments()
+    instruments = rack.list_instruments()
+
+    cached = _instruments_json_cache
+    if cached is None or cached[0] is not instruments:
+        cached = (instruments, _INSTRUMENT_LIST_ADAPTER.dump_json(instruments))
+        _instruments_json_cache = cached
+    return _json_response(cached[1])
 
 
-async def _get_instrument(name: str) -> InstrumentStatus:
+async def _get_instrument(name: str) -> Response:
     """Get a specific instrument's status.
 
     Args:
         name: The instrument name to look up.
 
     Returns:
-        InstrumentStatus for the requested instrument.
+        JSON InstrumentStatus for the requested instrument.
 
     Raises:
         HTTPException: 404 if instrument name not found.
@@ -322,14 +459,15 @@ async def _get_instrument(name: str) -> InstrumentStatus:
     status = rack.get_instrument_status(name)
     if status is None:
         raise HTTPException(status_code=404, detail=f"Instrument '{name}' not found")
-    return status
+    return _json_response(_INSTRUMENT_ADAPTER.dump_json(status))
 
 
 def main() -> None:
     """Command-line entry point for the rack server.
 
     Parses command-line arguments, configures logging, and starts the
-    uvicorn server with the specified configuration file.
+    uvicorn server with the specified configuration file. uvicorn uses
+    uvloop and httptools when they are installed (the ``uvloop`` extra).
     """
     parser = argparse.ArgumentParser(description="Start the hwtest rack server")
     parser.add_argument(
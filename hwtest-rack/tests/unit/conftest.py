@@ -0,0 +1,18 @@
+"""Shared fixtures for hwtest-rack unit tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def config_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the config sidecar cache at a per-test directory.
+
+    Keeps tests from writing into the real user cache directory.
+    """
+    cache_home = tmp_path / "xdg-cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home / "hwtest-rack"
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator
+
 import pytest
 
 from hwtest_core.types.common import DataType, SourceId
@@ -23,6 +26,7 @@ class TestAliasMapping:
         assert mapping.logical_name == "main_battery"
         assert mapping.field_filter is None
         assert mapping.field_mapping is None
+        assert mapping.filter_set is None
 
     def test_create_with_field_filter(self) -> None:
         """Test creating an AliasMapping with field filter."""
@@ -32,6 +36,7 @@ class TestAliasMapping:
             field_filter=["voltage", "current"],
         )
         assert mapping.field_filter == ["voltage", "current"]
+        assert mapping.filter_set == frozenset({"voltage", "current"})
 
     def test_create_with_field_mapping(self) -> None:
         """Test creating an AliasMapping with field mapping."""
@@ -382,6 +387,69 @@ class TestStreamAliaserSchemaBuilding:
 class TestStreamAliaserDataTransform:
     """Tests for data transformation logic."""
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("field_filter", "field_mapping"),
+        [
+            (None, None),
+            (None, {"voltage": "v"}),
+            (["voltage", "current"], None),
+        ],
+    )
+    async def test_apply_physical_schema_identity(
+        self, field_filter: list[str] | None, field_mapping: dict[str, str] | None
+    ) -> None:
+        """Test aliases that keep every field in order are marked identity."""
+        aliaser = StreamAliaser(nats_config=None)
+        await aliaser.start()
+
+        physical_schema = StreamSchema(
+            source_id=SourceId("dc_psu_slot_3"),
+            fields=(
+                StreamField("voltage", DataType.F64, "V"),
+                StreamField("current", DataType.F64, "A"),
+            ),
+        )
+
+        await aliaser.add_alias(
+            "dc_psu_slot_3",
+            "main_battery",
+            field_filter=field_filter,
+            field_mapping=field_mapping,
+        )
+        aliaser._apply_physical_schema(physical_schema, aliaser._aliases["main_battery"])
+
+        assert aliaser._aliases["main_battery"].is_identity
+
+        await aliaser.stop()
+
+    @pytest.mark.asyncio
+    async def test_apply_physical_schema_caches_field_indices(self) -> None:
+        """Test that field indices are computed once from the physical schema."""
+        aliaser = StreamAliaser(nats_config=None)
+        await aliaser.start()
+
+        physical_schema = StreamSchema(
+            source_id=SourceId("dc_psu_slot_3"),
+            fields=(
+                StreamField("voltage", DataType.F64, "V"),
+                StreamField("current", DataType.F64, "A"),
+                StreamField("power", DataType.F64, "W"),
+            ),
+        )
+
+        await aliaser.add_alias("dc_psu_slot_3", "main_battery", field_filter=["power", "voltage"])
+        alias = aliaser._aliases["main_battery"]
+        logical_schema = aliaser._apply_physical_schema(physical_schema, alias)
+
+        alias = aliaser._aliases["main_battery"]
+        assert alias.logical_schema == logical_schema
+        # Indices follow physical field order, not filter order
+        assert alias.field_indices == (0, 2)
+        assert not alias.is_identity
+
+        await aliaser.stop()
+
     @pytest.mark.asyncio
     async def test_transform_data_no_filter(self) -> None:
         """Test transforming data without filter passes all samples."""
@@ -403,9 +471,7 @@ class TestStreamAliaserDataTransform:
 
         # Manually set up the alias with schema
         await aliaser.add_alias(mapping.physical_source, mapping.logical_name)
-        aliaser._aliases[mapping.logical_name].logical_schema = aliaser._build_logical_schema(
-            physical_schema, mapping
-        )
+        aliaser._apply_physical_schema(physical_schema, aliaser._aliases[mapping.logical_name])
 
         physical_data = StreamData(
             schema_id=physical_schema.schema_id,
@@ -414,12 +480,16 @@ class TestStreamAliaserDataTransform:
             samples=((12.0, 1.5), (12.1, 1.6)),
         )
 
-        logical_data = aliaser._transform_data(physical_data, physical_schema, mapping)
+        alias = aliaser._aliases[mapping.logical_name]
+        assert alias.transform is not None
+        logical_data = alias.transform(physical_data)
 
         assert logical_data is not None
         assert logical_data.timestamp_ns == 1000000000
         assert logical_data.period_ns == 1000000
         assert logical_data.samples == ((12.0, 1.5), (12.1, 1.6))
+        assert logical_data.samples is physical_data.samples
+        assert logical_data.schema_id == alias.logical_schema.schema_id
 
         await aliaser.stop()
 
@@ -449,9 +519,7 @@ class TestStreamAliaserDataTransform:
             mapping.logical_name,
             field_filter=mapping.field_filter,
         )
-        aliaser._aliases[mapping.logical_name].logical_schema = aliaser._build_logical_schema(
-            physical_schema, mapping
-        )
+        aliaser._apply_physical_schema(physical_schema, aliaser._aliases[mapping.logical_name])
 
         physical_data = StreamData(
             schema_id=physical_schema.schema_id,
@@ -460,7 +528,9 @@ class TestStreamAliaserDataTransform:
             samples=((12.0, 1.5, 18.0), (12.1, 1.6, 19.36)),
         )
 
-        logical_data = aliaser._transform_data(physical_data, physical_schema, mapping)
+        alias = aliaser._aliases[mapping.logical_name]
+        assert alias.transform is not None
+        logical_data = alias.transform(physical_data)
 
         assert logical_data is not None
         # Should only have voltage and current (indices 0 and 1)
@@ -468,6 +538,21 @@ class TestStreamAliaserDataTransform:
 
         await aliaser.stop()
 
+    @pytest.mark.parametrize(
+        ("field_indices", "expected"),
+        [
+            ((1,), (1.5,)),
+            ((0, 2), (12.0, 18.0)),
+            ((2, 0), (18.0, 12.0)),
+        ],
+    )
+    def test_make_field_selector(
+        self, field_indices: tuple[int, ...], expected: tuple[float, ...]
+    ) -> None:
+        """Test the field selector always returns a tuple of the chosen columns."""
+        selector = StreamAliaser._make_field_selector(field_indices)
+        assert selector((12.0, 1.5, 18.0)) == expected
+
     @pytest.mark.asyncio
     async def test_transform_data_filter_no_match_returns_none(self) -> None:
         """Test transforming data with filter that matches no fields."""
@@ -493,9 +578,7 @@ class TestStreamAliaserDataTransform:
             mapping.logical_name,
             field_filter=mapping.field_filter,
         )
-        aliaser._aliases[mapping.logical_name].logical_schema = aliaser._build_logical_schema(
-            physical_schema, mapping
-        )
+        aliaser._apply_physical_schema(physical_schema, aliaser._aliases[mapping.logical_name])
 
         physical_data = StreamData(
             schema_id=physical_schema.schema_id,
@@ -504,9 +587,153 @@ class TestStreamAliaserDataTransform:
             samples=((12.0, 1.5),),
         )
 
-        logical_data = aliaser._transform_data(physical_data, physical_schema, mapping)
+        alias = aliaser._aliases[mapping.logical_name]
+        assert alias.transform is not None
+        logical_data = alias.transform(physical_data)
 
         # Should return None when no fields match
         assert logical_data is None
 
         await aliaser.stop()
+
+
+class _FakeSubscriber:
+    """Subscriber stand-in yielding preset data, optionally then blocking."""
+
+    def __init__(self, items: list[StreamData], block: bool = False) -> None:
+        self._items = items
+        self._block = block
+
+    async def data(self) -> AsyncIterator[StreamData]:
+        for item in self._items:
+            yield item
+        if self._block:
+            await asyncio.Event().wait()
+
+
+class _FakePublisher:
+    """Publisher stand-in recording published batches."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[StreamData]] = []
+        self.published = asyncio.Event()
+
+    async def publish_many(self, batch: list[StreamData]) -> None:
+        self.batches.append(list(batch))
+        self.published.set()
+
+
+class _FailingPublisher:
+    """Publisher stand-in whose publish_many always fails."""
+
+    async def publish_many(self, batch: list[StreamData]) -> None:
+        raise ConnectionError("NATS connection lost")
+
+
+class TestStreamAliaserRepublish:
+    """Tests for batched republishing."""
+
+    @pytest.fixture
+    def physical_schema(self) -> StreamSchema:
+        """Create a physical schema."""
+        return StreamSchema(
+            source_id=SourceId("dc_psu_slot_3"),
+            fields=(
+                StreamField("voltage", DataType.F64, "V"),
+                StreamField("current", DataType.F64, "A"),
+            ),
+        )
+
+    def _make_data(self, schema: StreamSchema, count: int) -> list[StreamData]:
+        return [
+            StreamData(
+                schema_id=schema.schema_id,
+                timestamp_ns=1000000000 + i * 1000000,
+                period_ns=1000000,
+                samples=((12.0 + i, 1.5),),
+            )
+            for i in range(count)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_republish_batches_by_size(self, physical_schema: StreamSchema) -> None:
+        """Test that full batches are flushed and the remainder at stream end."""
+        aliaser = StreamAliaser(nats_config=None)
+        await aliaser.start()
+        await aliaser.add_alias("dc_psu_slot_3", "main_battery", batch_max=2)
+        alias = aliaser._aliases["main_battery"]
+        logical_schema = aliaser._apply_physical_schema(physical_schema, alias)
+
+        publisher = _FakePublisher()
+        items = self._make_data(physical_schema, 5)
+        await aliaser._republish(_FakeSubscriber(items), publisher, alias)
+
+        assert [len(b) for b in publisher.batches] == [2, 2, 1]
+        flat = [d for b in publisher.batches for d in b]
+        assert all(d.schema_id == logical_schema.schema_id for d in flat)
+        assert [d.timestamp_ns for d in flat] == [d.timestamp_ns for d in items]
+
+        await aliaser.stop()
+
+    @pytest.mark.asyncio
+    async def test_republish_backpressure(self, physical_schema: StreamSchema) -> None:
+        """Test that a full queue makes the reader wait without dropping data."""
+        aliaser = StreamAliaser(nats_config=None, queue_maxsize=1)
+        await aliaser.start()
+        await aliaser.add_alias("dc_psu_slot_3", "main_battery", batch_max=1)
+        alias = aliaser._aliases["main_battery"]
+        aliaser._apply_physical_schema(physical_schema, alias)
+
+        publisher = _FakePublisher()
+        items = self._make_data(physical_schema, 5)
+        await aliaser._republish(_FakeSubscriber(items), publisher, alias)
+
+        flat = [d for b in publisher.batches for d in b]
+        assert [d.timestamp_ns for d in flat] == [d.timestamp_ns for d in items]
+        assert aliaser.queue_full_count > 0
+
+        await aliaser.stop()
+
+    @pytest.mark.asyncio
+    async def test_republish_flushes_on_timeout(self, physical_schema: StreamSchema) -> None:
+        """Test that a partial batch is flushed once the batch delay expires."""
+        aliaser = StreamAliaser(nats_config=None)
+        await aliaser.start()
+        await aliaser.add_alias("dc_psu_slot_3", "main_battery", batch_max=64, batch_max_us=1000)
+        alias = aliaser._aliases["main_battery"]
+        aliaser._apply_physical_schema(physical_schema, alias)
+
+        publisher = _FakePublisher()
+        subscriber = _FakeSubscriber(self._make_data(physical_schema, 1), block=True)
+        task = asyncio.create_task(aliaser._republish(subscriber, publisher, alias))
+
+        await asyncio.wait_for(publisher.published.wait(), timeout=1.0)
+        assert [len(b) for b in publisher.batches] == [1]
+
+        writer = alias.writer_task
+        assert writer is not None and not writer.done()
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert writer.cancelled()
+        await aliaser.stop()
+
+    @pytest.mark.asyncio
+    async def test_republish_writer_failure_stops_reader(
+        self, physical_schema: StreamSchema
+    ) -> None:
+        """Test that a failing writer cancels the reader and re-raises."""
+        aliaser = StreamAliaser(nats_config=None, queue_maxsize=1)
+        await aliaser.start()
+        await aliaser.add_alias("dc_psu_slot_3", "main_battery", batch_max=1)
+        alias = aliaser._aliases["main_battery"]
+        aliaser._apply_physical_schema(physical_schema, alias)
+
+        subscriber = _FakeSubscriber(self._make_data(physical_schema, 5), block=True)
+        with pytest.raises(ConnectionError, match="NATS connection lost"):
+            await asyncio.wait_for(
+                aliaser._republish(subscriber, _FailingPublisher(), alias), timeout=1.0
+            )
+
+        await aliaser.stop()
@@ -0,0 +1,109 @@
+"""Unit tests for rack calibration helpers."""
+
+from __future__ import annotations
+
+import dataclasses
+import sys
+
+import pytest
+
+from hwtest_rack.calibrate import (
+    CalibrationPoint,
+    CalibrationResult,
+    _fit_scale_factor,
+    _point_scale,
+    calibrate_mcc118,
+    calibrate_with_external_reference,
+)
+
+
+def _point(reference: float, measured: float) -> CalibrationPoint:
+    """Create a calibration point with its per-point scale factor."""
+    return CalibrationPoint(
+        reference_voltage=reference,
+        measured_voltage=measured,
+        scale_factor=reference / measured,
+    )
+
+
+class TestFitScaleFactor:
+    """Tests for the least-squares scale factor fit."""
+
+    def test_exact_scale(self) -> None:
+        """Test points on a line through the origin recover its slope."""
+        assert _fit_scale_factor([1.0, 2.5, 4.0], [0.5, 1.25, 2.0]) == pytest.approx(2.0)
+
+    def test_weights_points_equally(self) -> None:
+        """Test the fit differs from the mean of per-point ratios."""
+        expected = (0.9 * 1.0 + 2.0 * 4.0) / (0.9 * 0.9 + 2.0 * 2.0)
+        assert _fit_scale_factor([1.0, 4.0], [0.9, 2.0]) == pytest.approx(expected)
+
+    def test_no_points(self) -> None:
+        """Test an empty point list falls back to unity scale."""
+        assert _fit_scale_factor([], []) == 1.0
+
+    def test_near_zero_readings(self) -> None:
+        """Test near-zero readings fall back to unity scale."""
+        assert _fit_scale_factor([2.5], [0.0001]) == 1.0
+
+
+class TestPointScale:
+    """Tests for the per-point scale factor."""
+
+    @pytest.mark.parametrize(
+        ("reference", "measured", "expected"),
+        [(2.5, 1.25, 2.0), (2.5, 0.001, 1.0), (2.5, 0.0, 1.0)],
+    )
+    def test_point_scale(self, reference: float, measured: float, expected: float) -> None:
+        """Test the ratio and the near-zero fallback."""
+        assert _point_scale(reference, measured) == pytest.approx(expected)
+
+
+class TestCalibrationResult:
+    """Tests for the calibration result."""
+
+    def test_notes(self) -> None:
+        """Test notes list the reference voltages and are computed once."""
+        result = CalibrationResult(
+            scale_factor=2.0,
+            points=(_point(1.0, 0.5), _point(2.5, 1.25)),
+            reference_instrument="mcc152",
+            timestamp="2024-01-01T00:00:00+00:00",
+        )
+        assert result.notes == "Calibrated using 1.0V, 2.5V reference points"
+        assert result.notes is result.notes
+
+    def test_notes_without_points(self) -> None:
+        """Test notes for a result with no points."""
+        result = CalibrationResult(1.0, (), "external", "2024-01-01T00:00:00+00:00")
+        assert result.notes == "No calibration points"
+
+    def test_frozen(self) -> None:
+        """Test the result cannot be modified after construction."""
+        result = CalibrationResult(1.0, (), "external", "2024-01-01T00:00:00+00:00")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.scale_factor = 2.0  # type: ignore[misc]
+
+
+class TestCalibrateWithoutDaqhats:
+    """Tests for the failure path when daqhats is unavailable."""
+
+    @pytest.fixture(autouse=True)
+    def _no_daqhats(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Make ``import daqhats`` raise ImportError."""
+        monkeypatch.setitem(sys.modules, "daqhats", None)
+
+    def test_calibrate_mcc118(self) -> None:
+        """Test MCC 152 referenced calibration reports the missing library."""
+        result = calibrate_mcc118()
+        assert not result.success
+        assert result.scale_factor == 1.0
+        assert result.reference_instrument == "mcc152"
+        assert result.error == "daqhats library not installed"
+
+    def test_calibrate_with_external_reference(self) -> None:
+        """Test external reference calibration reports the missing library."""
+        result = calibrate_with_external_reference()
+        assert not result.success
+        assert result.reference_instrument == "external"
+        assert result.points == ()
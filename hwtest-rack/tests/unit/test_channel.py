@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import dataclasses
+import pickle
+import sys
+
 import pytest
 
 from hwtest_rack.channel import ChannelRegistry, ChannelType, LogicalChannel
@@ -81,6 +85,26 @@ class TestLogicalChannel:
         # Different logical_name should have different hash
         assert hash(ch1) != hash(ch3)
 
+    def test_cached_hash_not_a_field(self) -> None:
+        """Test that the cached hash stays out of the public fields."""
+        channel = LogicalChannel("main_battery", "psu_1", 1, ChannelType.PSU, {"max_v": 14.5})
+        assert list(dataclasses.asdict(channel)) == [
+            "logical_name",
+            "instrument_name",
+            "channel_id",
+            "channel_type",
+            "metadata",
+        ]
+        assert len(dataclasses.astuple(channel)) == 5
+        assert not hasattr(channel, "__dict__")
+
+    def test_pickle_round_trip(self) -> None:
+        """Test that a channel survives pickling with a recomputed hash."""
+        channel = LogicalChannel("main_battery", "psu_1", 1, ChannelType.PSU, {"max_v": 14.5})
+        restored = pickle.loads(pickle.dumps(channel))
+        assert restored == channel
+        assert hash(restored) == hash("main_battery")
+
 
 class TestChannelRegistry:
     """Tests for ChannelRegistry."""
@@ -89,7 +113,7 @@ class TestChannelRegistry:
         """Test empty registry."""
         registry = ChannelRegistry()
         assert len(registry) == 0
-        assert registry.list_all() == []
+        assert registry.list_all() == ()
 
     def test_register_single_channel(self) -> None:
         """Test registering a single channel."""
@@ -106,6 +130,19 @@ class TestChannelRegistry:
         assert "main_battery" in registry
         assert registry.get("main_battery") == channel
 
+    def test_register_interns_names(self) -> None:
+        """Test that registered names are stored as interned strings."""
+        registry = ChannelRegistry()
+        # Build the names at runtime so they are not compile-time constants
+        logical_name = "".join(["main_", "battery"])
+        instrument_name = "".join(["psu_", "1"])
+        registry.register(LogicalChannel(logical_name, instrument_name, 1, ChannelType.PSU))
+
+        (key,) = registry._channels
+        assert key is sys.intern("main_battery")
+        (instrument_key,) = registry._by_instrument
+        assert instrument_key is sys.intern("psu_1")
+
     def test_register_multiple_channels(self) -> None:
         """Test registering multiple channels."""
         registry = ChannelRegistry()
@@ -133,6 +170,40 @@ class TestChannelRegistry:
         with pytest.raises(ValueError, match="already registered"):
             registry.register(ch2)
 
+    def test_register_all(self) -> None:
+        """Test bulk registration builds the same indexes as register."""
+        ch1 = LogicalChannel("main_battery", "psu_1", 1, ChannelType.PSU)
+        ch2 = LogicalChannel("cpu_power", "psu_1", 2, ChannelType.PSU)
+        ch3 = LogicalChannel("dut_voltage", "daq_1", 0, ChannelType.DAQ_ANALOG)
+
+        registry = ChannelRegistry()
+        registry.register(ch1)
+        registry.register_all([ch2, ch3])
+
+        assert len(registry) == 3
+        assert registry.get_by_instrument("psu_1") == (ch1, ch2)
+        assert registry.get_by_type(ChannelType.DAQ_ANALOG) == (ch3,)
+
+    @pytest.mark.parametrize("preregistered", [False, True])
+    def test_register_all_duplicate_registers_nothing(self, preregistered: bool) -> None:
+        """Test that a duplicate name aborts bulk registration entirely."""
+        ch1 = LogicalChannel("main_battery", "psu_1", 1, ChannelType.PSU)
+        ch2 = LogicalChannel("cpu_power", "psu_1", 2, ChannelType.PSU)
+        dup = LogicalChannel("main_battery", "psu_2", 1, ChannelType.PSU)
+
+        registry = ChannelRegistry()
+        if preregistered:
+            registry.register(ch1)
+            batch = [ch2, dup]
+        else:
+            batch = [ch1, ch2, dup]
+
+        with pytest.raises(ValueError) as exc_info:
+            registry.register_all(batch)
+        assert "already registered" in str(exc_info.value)
+        assert len(registry) == (1 if preregistered else 0)
+        assert "cpu_power" not in registry
+
     def test_get_nonexistent_returns_none(self) -> None:
         """Test that getting nonexistent channel returns None."""
         registry = ChannelRegistry()
@@ -176,7 +247,7 @@ class TestChannelRegistry:
     def test_get_by_instrument_nonexistent(self) -> None:
         """Test getting channels for nonexistent instrument."""
         registry = ChannelRegistry()
-        assert registry.get_by_instrument("nonexistent") == []
+        assert registry.get_by_instrument("nonexistent") == ()
 
     def test_get_by_type(self) -> None:
         """Test getting all channels of a specific type."""
@@ -211,7 +282,26 @@ class TestChannelRegistry:
         ch1 = LogicalChannel("main_battery", "psu_1", 1, ChannelType.PSU)
         registry.register(ch1)
 
-        assert registry.get_by_type(ChannelType.LOAD) == []
+        assert registry.get_by_type(ChannelType.LOAD) == ()
+
+    def test_get_by_type_shared_tuple(self) -> None:
+        """Test that repeated lookups share one immutable tuple."""
+        registry = ChannelRegistry()
+        ch1 = LogicalChannel("main_battery", "psu_1", 1, ChannelType.PSU)
+        registry.register(ch1)
+
+        psu_channels = registry.get_by_type(ChannelType.PSU)
+        assert psu_channels == (ch1,)
+        assert registry.get_by_type(ChannelType.PSU) is psu_channels
+
+        # Registering another type leaves the PSU tuple alone
+        registry.register(LogicalChannel("dut_load", "load_1", 1, ChannelType.LOAD))
+        assert registry.get_by_type(ChannelType.PSU) is psu_channels
+
+        ch2 = LogicalChannel("cpu_power", "psu_1", 2, ChannelType.PSU)
+        registry.register(ch2)
+        assert registry.get_by_type(ChannelType.PSU) == (ch1, ch2)
+        assert psu_channels == (ch1,)
 
     def test_list_all(self) -> None:
         """Test listing all channels."""
@@ -224,9 +314,22 @@ class TestChannelRegistry:
         registry.register(ch2)
 
         all_channels = registry.list_all()
-        assert len(all_channels) == 2
-        assert ch1 in all_channels
-        assert ch2 in all_channels
+        assert all_channels == (ch1, ch2)
+        assert registry.list_all() is all_channels
+
+    def test_list_all_refreshed_after_register(self) -> None:
+        """Test that registering a channel invalidates the cached list."""
+        registry = ChannelRegistry()
+        ch1 = LogicalChannel("main_battery", "psu_1", 1, ChannelType.PSU)
+        ch2 = LogicalChannel("cpu_power", "psu_1", 2, ChannelType.PSU)
+        ch3 = LogicalChannel("dut_voltage", "daq_1", 0, ChannelType.DAQ_ANALOG)
+
+        registry.register(ch1)
+        assert registry.list_all() == (ch1,)
+        registry.register(ch2)
+        assert registry.list_all() == (ch1, ch2)
+        registry.register_all([ch3])
+        assert registry.list_all() == (ch1, ch2, ch3)
 
     def test_contains(self) -> None:
         """Test 'in' operator."""
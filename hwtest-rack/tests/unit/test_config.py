@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
+import sys
 import tempfile
 from pathlib import Path
+from types import MappingProxyType
+from unittest.mock import patch
 
 import pytest
 
+from hwtest_rack.channel import ChannelType, LogicalChannel
 from hwtest_rack.config import (
     ExpectedIdentity,
     InstrumentConfig,
     RackConfig,
+    _build_config,
+    _infer_channel_type,
+    _parse_channels,
+    _parse_config,
+    _sidecar_path,
+    clear_config_cache,
     load_config,
 )
 
@@ -66,6 +76,74 @@ class TestRackConfig:
         assert config.description == "Test rack"
         assert len(config.instruments) == 1
 
+    def test_preload_drivers(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+        drivers = ["colorsys:rgb_to_hsv", "colorsys:hsv_to_rgb", "nonexistent_module_xyz:f"]
+        config = RackConfig(
+            rack_id="preload",
+            description="",
+            instruments=tuple(
+                InstrumentConfig(f"inst{i}", driver, ExpectedIdentity("Acme", "Widget"))
+                for i, driver in enumerate(drivers)
+            ),
+        )
+
+        config.preload_drivers()
+        assert "colorsys" in sys.modules
+        assert "nonexistent_module_xyz" not in sys.modules
+
+
+class TestInferChannelType:
+    @pytest.mark.parametrize(
+        ("driver", "channel_data", "expected"),
+        [
+            ("hwtest_bkprecision.psu:create_instrument", {}, ChannelType.PSU),
+            ("hwtest_acme.PowerSupply:create", {}, ChannelType.PSU),
+            ("hwtest_bkprecision.load:create_instrument", {}, ChannelType.LOAD),
+            ("hwtest_mcc.mcc118:create_instrument", {}, ChannelType.DAQ_ANALOG),
+            ("hwtest_mcc.mcc152:create_instrument", {"direction": "out"}, ChannelType.DAQ_DIGITAL),
+            ("hwtest_mcc.mcc152:create_instrument", {}, ChannelType.DAQ_ANALOG),
+            ("hwtest_other.widget:create", {}, ChannelType.DAQ_ANALOG),
+            ("hwtest_bkprecision.psu:create_instrument", {"type": "LOAD"}, ChannelType.LOAD),
+            ("hwtest_bkprecision.psu:create_instrument", {"type": "bogus"}, ChannelType.PSU),
+        ],
+    )
+    def test_infer(self, driver: str, channel_data: dict[str, str], expected: ChannelType) -> None:
+        assert _infer_channel_type(driver, channel_data) is expected
+
+
+class TestParseChannels:
+    def test_standard_channels(self) -> None:
+        kwargs = {
+            "channels": [
+                {"id": 1, "logical_name": "main_battery", "type": "psu", "max_voltage": 14.5},
+                {"id": 2, "name": "cpu_power"},
+                {"id": 3},
+                "not-a-mapping",
+            ]
+        }
+        channels = _parse_channels("psu01", "hwtest_bkprecision.psu:create_instrument", kwargs)
+
+        assert [(c.id, c.logical_name) for c in channels] == [
+            (1, "main_battery"),
+            (2, "cpu_power"),
+        ]
+        assert channels[0].channel_type is ChannelType.PSU
+        assert channels[0].metadata == {"max_voltage": 14.5}
+
+    def test_mcc152_channels(self) -> None:
+        kwargs = {
+            "dio_channels": [{"id": 0, "logical_name": "relay", "type": "x", "direction": "out"}],
+            "analog_channels": [{"id": 1, "logical_name": "ref_out"}],
+        }
+        channels = _parse_channels("dio01", "hwtest_mcc.mcc152:create_instrument", kwargs)
+
+        assert [(c.logical_name, c.channel_type) for c in channels] == [
+            ("relay", ChannelType.DAQ_DIGITAL),
+            ("ref_out", ChannelType.DAQ_ANALOG),
+        ]
+        assert channels[0].metadata == {"type": "x", "direction": "out"}
+
 
 class TestLoadConfig:
     def test_load_valid_config(self) -> None:
@@ -111,6 +189,9 @@ instruments:
         assert daq.identity.manufacturer == "Measurement Computing"
         assert daq.kwargs["address"] == 0
 
+        with pytest.raises(TypeError):
+            psu.kwargs["visa_address"] = "other"  # type: ignore[index]
+
     def test_load_minimal_config(self) -> None:
         yaml_content = """
 rack:
@@ -127,6 +208,21 @@ instruments: {}
         assert config.rack_id == "minimal-rack"
         assert config.description == ""
         assert len(config.instruments) == 0
+        assert config.max_init_concurrency == 8
+
+    @pytest.mark.parametrize("value", ["2", "0", "-1", "true", '"4"'])
+    def test_max_init_concurrency(self, tmp_path: Path, value: str) -> None:
+        config_path = tmp_path / "rack.yaml"
+        config_path.write_text(
+            f"rack:\n  id: test\n  max_init_concurrency: {value}\ninstruments: {{}}\n",
+            encoding="utf-8",
+        )
+
+        if value == "2":
+            assert load_config(config_path).max_init_concurrency == 2
+        else:
+            with pytest.raises(ValueError, match="max_init_concurrency"):
+                load_config(config_path)
 
     def test_file_not_found(self) -> None:
         with pytest.raises(FileNotFoundError):
@@ -225,3 +321,180 @@ instruments:
 
             with pytest.raises(ValueError, match="instruments must be a mapping"):
                 load_config(f.name)
+
+    def test_repeated_strings_interned(self, tmp_path: Path) -> None:
+        config_path = tmp_path / "rack.yaml"
+        config_path.write_text(
+            """
+rack:
+  id: "interned"
+instruments:
+  psu01:
+    driver: "hwtest_bkprecision.psu:create_instrument"
+    identity: {manufacturer: "B&K Precision", model: "9115"}
+  psu02:
+    driver: "hwtest_bkprecision.psu:create_instrument"
+    identity: {manufacturer: "B&K Precision", model: "9115"}
+""",
+            encoding="utf-8",
+        )
+
+        first, second = load_config(config_path).instruments
+        assert first.driver is second.driver
+        assert first.identity.manufacturer is second.identity.manufacturer
+        assert first.identity.model is second.identity.model
+
+    def test_cached_until_file_changes(self, tmp_path: Path) -> None:
+        config_path = tmp_path / "rack.yaml"
+        config_path.write_text('rack:\n  id: "cached"\ninstruments: {}\n', encoding="utf-8")
+
+        with patch("hwtest_rack.config._parse_config", wraps=_parse_config) as parse:
+            first = load_config(config_path)
+            assert load_config(str(config_path)) == first
+            assert parse.call_count == 1
+
+            config_path.write_text(
+                'rack:\n  id: "changed-rack"\ninstruments: {}\n', encoding="utf-8"
+            )
+            second = load_config(config_path)
+            assert parse.call_count == 2
+        assert second.rack_id == "changed-rack"
+
+    def test_clear_config_cache(self, tmp_path: Path) -> None:
+        config_path = tmp_path / "rack.yaml"
+        config_path.write_text('rack:\n  id: "cached"\ninstruments: {}\n', encoding="utf-8")
+
+        with patch("hwtest_rack.config._parse_config", wraps=_parse_config) as parse:
+            load_config(config_path)
+            clear_config_cache()
+            load_config(config_path)
+            assert parse.call_count == 2
+
+    def test_cached_config_not_shared(self, tmp_path: Path) -> None:
+        config_path = tmp_path / "rack.yaml"
+        config_path.write_text(_SIDECAR_YAML, encoding="utf-8")
+
+        first = load_config(config_path)
+        first.channel_registry.register(LogicalChannel("aux", "psu01", 2, ChannelType.PSU))
+        first.instruments[0].kwargs["channels"][0]["logical_name"] = "edited"
+        first.instruments[0].channels[0].metadata["max_voltage"] = 99.0
+        first.calibration.factors["uut_adc_scale_factor"] = 2.0
+
+        second = load_config(config_path)
+        assert second is not first
+        assert "aux" not in second.channel_registry
+        assert second.instruments[0].kwargs["channels"][0]["logical_name"] == "main_battery"
+        assert second.instruments[0].channels[0].metadata["max_voltage"] == 14.5
+        assert second.calibration.get("uut_adc_scale_factor") == 1.25
+
+
+_SIDECAR_YAML = """
+rack:
+  id: "sidecar-rack"
+  description: "Sidecar test"
+
+instruments:
+  psu01:
+    driver: "hwtest_bkprecision.psu:create_instrument"
+    identity:
+      manufacturer: "B&K Precision"
+      model: "9115"
+    kwargs:
+      visa_address: "TCPIP::192.168.1.100::5025::SOCKET"
+      channels:
+        - id: 1
+          logical_name: "main_battery"
+          max_voltage: 14.5
+
+calibration:
+  uut_adc_scale_factor: 1.25
+"""
+
+
+class TestConfigSidecar:
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self) -> None:
+        clear_config_cache()
+
+    def test_sidecar_round_trip(self, tmp_path: Path, config_cache_dir: Path) -> None:
+        config_path = tmp_path / "rack.yaml"
+        config_path.write_text(_SIDECAR_YAML, encoding="utf-8")
+
+        parsed = load_config(config_path)
+        assert list(config_cache_dir.iterdir()) == [_sidecar_path(config_path.resolve())]
+
+        clear_config_cache()
+        cached = load_config(config_path)
+        assert cached is not parsed
+        assert cached.instruments == parsed.instruments
+        assert isinstance(cached.instruments[0].kwargs, MappingProxyType)
+        assert cached.calibration == parsed.calibration
+        assert cached.channel_registry.resolve("main_battery") == ("psu01", 1)
+        assert cached.max_init_concurrency == parsed.max_init_concurrency
+
+    def test_stale_sidecar_ignored(self, tmp_path: Path) -> None:
+        config_path = tmp_path / "rack.yaml"
+        config_path.write_text(_SIDECAR_YAML, encoding="utf-8")
+        load_config(config_path)
+
+        config_path.write_text(
+            _SIDECAR_YAML.replace("sidecar-rack", "edited-rack"), encoding="utf-8"
+        )
+        clear_config_cache()
+        assert load_config(config_path).rack_id == "edited-rack"
+
+    def test_sidecar_from_other_parser_ignored(self, tmp_path: Path) -> None:
+        config_path = tmp_path / "rack.yaml"
+        config_path.write_text(_SIDECAR_YAML, encoding="utf-8")
+        with patch("hwtest_rack.config._parser_digest", return_value="0" * 64):
+            load_config(config_path)
+
+        clear_config_cache()
+        with patch("hwtest_rack.config._build_config", wraps=_build_config) as build:
+            assert load_config(config_path).rack_id == "sidecar-rack"
+        build.assert_called_once()
+
+    def test_large_config(self, tmp_path: Path) -> None:
+        instruments = "".join(f"""
+  psu{i:03d}:
+    driver: "hwtest_bkprecision.psu:create_instrument"
+    identity:
+      manufacturer: "B&K Precision"
+      model: "9115"
+    kwargs:
+      channels:
+        - id: 1
+          logical_name: "rail_{i:03d}"
+""" for i in range(40))
+        config_path = tmp_path / "rack.yaml"
+        config_path.write_text(f'rack:\n  id: "big-rack"\ninstruments:{instruments}')
+
+        config = load_config(config_path)
+        assert len(config.instruments) == 40
+        assert config.channel_registry.resolve("rail_039") == ("psu039", 1)
+
+    def test_sidecar_skipped_for_non_json_data(
+        self, tmp_path: Path, config_cache_dir: Path
+    ) -> None:
+        config_path = tmp_path / "rack.yaml"
+        config_path.write_text(
+            _SIDECAR_YAML.replace("max_voltage: 14.5", "limits: {1: 14.5}"), encoding="utf-8"
+        )
+
+        config = load_config(config_path)
+        assert config.instruments[0].channels[0].metadata["limits"] == {1: 14.5}
+        assert not _sidecar_path(config_path.resolve()).exists()
+        assert list(tmp_path.iterdir()) == [config_path]
+
+    def test_sidecar_not_written_next_to_config(
+        self, tmp_path: Path, config_cache_dir: Path
+    ) -> None:
+        config_dir = tmp_path / "configs"
+        config_dir.mkdir()
+        config_path = config_dir / "rack.yaml"
+        config_path.write_text(_SIDECAR_YAML, encoding="utf-8")
+
+        load_config(config_path)
+
+        assert list(config_dir.iterdir()) == [config_path]
+        assert _sidecar_path(config_path.resolve()).parent == config_cache_dir
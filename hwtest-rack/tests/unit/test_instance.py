@@ -0,0 +1,187 @@
+"""Unit tests for rack instance configuration."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from hwtest_rack.instance import (
+    RackInstanceConfig,
+    _class_patterns,
+    _get_search_paths,
+    _read_instance_header,
+    find_instance_config,
+)
+
+
+class TestRackInstanceConfig:
+    def test_slots(self) -> None:
+        config = RackInstanceConfig.create_new("001", "pi5_mcc_intg_a")
+        for obj in (config, config.instance, config.metadata):
+            assert not hasattr(obj, "__dict__")
+
+    def test_save_and_load(self, tmp_path: Path) -> None:
+        config = RackInstanceConfig.create_new("001", "pi5_mcc_intg_a", "Bench A")
+        path = config.save(tmp_path / "pi5_mcc_intg_a_001.yaml")
+
+        loaded = RackInstanceConfig.from_yaml(path)
+        assert loaded.instance == config.instance
+        assert loaded.calibration == config.calibration
+        assert loaded.metadata == config.metadata
+        assert loaded.source_path == path
+
+    def test_save_keeps_key_order(self, tmp_path: Path) -> None:
+        config = RackInstanceConfig.create_new("001", "pi5_mcc_intg_a")
+        path = config.save(tmp_path / "instance.yaml")
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        top_level = [line for line in lines if line and not line.startswith(" ")]
+        assert top_level == ["rack_instance:", "calibration:", "calibration_metadata:"]
+
+    def test_load_returns_independent_configs(self, tmp_path: Path) -> None:
+        path = RackInstanceConfig.create_new("001", "pi5_mcc_intg_a").save(tmp_path / "a.yaml")
+
+        first = RackInstanceConfig.from_yaml(path)
+        first.calibration["mcc118_scale_factor"] = 2.0
+        second = RackInstanceConfig.from_yaml(path)
+        assert second.calibration["mcc118_scale_factor"] == 1.0
+        assert second is not first
+
+    def test_load_after_save(self, tmp_path: Path) -> None:
+        config = RackInstanceConfig.create_new("001", "pi5_mcc_intg_a")
+        path = config.save(tmp_path / "a.yaml")
+        assert RackInstanceConfig.from_yaml(path).calibration["mcc118_scale_factor"] == 1.0
+
+        config.calibration["mcc118_scale_factor"] = 1.5
+        config.save(path)
+        assert RackInstanceConfig.from_yaml(path).calibration["mcc118_scale_factor"] == 1.5
+
+    def test_load_missing_file(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            RackInstanceConfig.from_yaml(tmp_path / "missing.yaml")
+
+    def test_load_non_ascii(self, tmp_path: Path) -> None:
+        config = RackInstanceConfig.create_new("001", "pi5_mcc_intg_a", "Prüfstand µ")
+        path = config.save(tmp_path / "a.yaml")
+
+        assert RackInstanceConfig.from_yaml(path).instance.description == "Prüfstand µ"
+
+    def test_parse_calibration(self) -> None:
+        data = {"calibration": {"a": 2, "b": 1.5, "c": "x", "d": True, "e": None}}
+        config = RackInstanceConfig._parse(data, source_path=None)
+
+        assert config.calibration == {"a": 2.0, "b": 1.5}
+        assert type(config.calibration["a"]) is float
+
+
+class TestLazyImports:
+    def test_import_does_not_load_yaml(self) -> None:
+        code = "import sys, hwtest_rack; sys.exit('yaml' in sys.modules)"
+        assert subprocess.run([sys.executable, "-c", code], check=False).returncode == 0
+
+
+class TestFindInstanceConfig:
+    @staticmethod
+    def _touch(path: Path) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("rack_instance: {}\n", encoding="utf-8")
+        return path
+
+    def test_exact_match(self, tmp_path: Path) -> None:
+        expected = self._touch(tmp_path / "rack_a_002.yml")
+        self._touch(tmp_path / "rack_a_001.yaml")
+
+        assert find_instance_config("rack_a", "002", [tmp_path]) == expected
+
+    def test_glob_returns_first_sorted(self, tmp_path: Path) -> None:
+        self._touch(tmp_path / "rack_a_002.yaml")
+        expected = self._touch(tmp_path / "rack_a_001.yaml")
+        self._touch(tmp_path / "rack_b_000.yaml")
+
+        assert find_instance_config("rack_a", search_paths=[tmp_path]) == expected
+
+    def test_search_path_priority(self, tmp_path: Path) -> None:
+        first, second = tmp_path / "first", tmp_path / "second"
+        self._touch(second / "rack_a_001.yaml")
+        expected = self._touch(first / "rack_a_009.yaml")
+
+        search_paths: list[str | Path] = [tmp_path / "missing", first, str(second)]
+        assert find_instance_config("rack_a", search_paths=search_paths) == expected
+        assert find_instance_config("rack_a", "001", search_paths) == second / "rack_a_001.yaml"
+
+    def test_not_found(self, tmp_path: Path) -> None:
+        assert find_instance_config("rack_a", search_paths=[tmp_path]) is None
+        assert find_instance_config("rack_a", "001", [tmp_path / "missing"]) is None
+        assert find_instance_config("rack_a", search_paths=[]) is None
+
+    def test_glob_skips_directories(self, tmp_path: Path) -> None:
+        (tmp_path / "rack_a_000.yaml").mkdir()
+        expected = self._touch(tmp_path / "rack_a_001.yaml")
+
+        assert find_instance_config("rack_a", search_paths=[tmp_path]) == expected
+
+    def test_search_path_is_a_file(self, tmp_path: Path) -> None:
+        path = self._touch(tmp_path / "rack_a_001.yaml")
+
+        assert find_instance_config("rack_a", search_paths=[path]) is None
+        assert find_instance_config("rack_a", "001", [path]) is None
+
+    def test_env_search_paths(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        first, second = tmp_path / "first", tmp_path / "second"
+        expected = self._touch(second / "rack_a_001.yaml")
+
+        monkeypatch.setenv("HWTEST_RACK_INSTANCE_PATH", f"{first}::{second}")
+        assert _get_search_paths()[:2] == (first, second)
+        assert find_instance_config("rack_a") == expected
+
+        monkeypatch.setenv("HWTEST_RACK_INSTANCE_PATH", str(first))
+        assert _get_search_paths()[0] == first
+        assert find_instance_config("rack_a", "001") is None
+
+    def test_glob_skips_other_class_with_shared_prefix(self, tmp_path: Path) -> None:
+        other = RackInstanceConfig.create_new("000", "rack_a_b")
+        other.save(tmp_path / "rack_a_b_000.yaml")
+        expected = RackInstanceConfig.create_new("001", "rack_a").save(tmp_path / "rack_a_001.yaml")
+
+        assert find_instance_config("rack_a", search_paths=[tmp_path]) == expected
+        assert find_instance_config("rack_a_b", search_paths=[tmp_path]) == (
+            tmp_path / "rack_a_b_000.yaml"
+        )
+
+    def test_glob_checks_header_of_single_match(self, tmp_path: Path) -> None:
+        RackInstanceConfig.create_new("000", "rack_a_b").save(tmp_path / "rack_a_b_000.yaml")
+
+        assert find_instance_config("rack_a", search_paths=[tmp_path]) is None
+
+    def test_class_patterns(self) -> None:
+        patterns = _class_patterns("rack_a")
+        assert patterns is _class_patterns("rack_a")
+        assert [bool(p.match("rack_a_001.yaml")) for p in patterns] == [True, False]
+        assert [bool(p.match("rack_a_001.yml")) for p in patterns] == [False, True]
+        assert not any(p.match("rack_a_001.yaml.bak") for p in patterns)
+
+
+class TestReadInstanceHeader:
+    def test_header_block(self, tmp_path: Path) -> None:
+        path = RackInstanceConfig.create_new("001", "rack_a").save(tmp_path / "a.yaml")
+
+        header = _read_instance_header(path)
+        assert header == {"serial_number": "001", "rack_class": "rack_a", "description": ""}
+
+    def test_header_after_other_keys(self, tmp_path: Path) -> None:
+        path = tmp_path / "a.yaml"
+        lines = ["calibration:"] + [f"  factor_{i}: 1.0" for i in range(40)]
+        lines += ["rack_instance:", "  rack_class: rack_a"]
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        assert _read_instance_header(path) == {"rack_class": "rack_a"}
+
+    def test_malformed_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "a.yaml"
+        path.write_text("rack_instance: [unclosed\n", encoding="utf-8")
+
+        assert _read_instance_header(path) == {}
+        assert _read_instance_header(tmp_path / "missing.yaml") == {}
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import sys
+import types
+
 import pytest
 
 from hwtest_rack.loader import load_driver
@@ -42,3 +45,15 @@ class TestLoadDriver:
     def test_not_callable(self) -> None:
         with pytest.raises(TypeError, match="not callable"):
             load_driver("os:name")  # os.name is a string, not callable
+
+    def test_repeat_load_is_cached(self) -> None:
+        assert load_driver("os.path:join") is load_driver("os.path:join")
+
+    def test_failed_load_is_not_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        with pytest.raises(ImportError):
+            load_driver("hwtest_rack_late_module:factory")
+
+        module = types.ModuleType("hwtest_rack_late_module")
+        module.factory = len  # type: ignore[attr-defined]
+        monkeypatch.setitem(sys.modules, "hwtest_rack_late_module", module)
+        assert load_driver("hwtest_rack_late_module:factory") is len
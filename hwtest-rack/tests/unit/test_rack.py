@@ -0,0 +1,488 @@
+"""Unit tests for rack orchestration."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from hwtest_core.types.common import InstrumentIdentity
+
+from hwtest_rack.channel import ChannelType, LogicalChannel
+from hwtest_rack.config import ExpectedIdentity, InstrumentConfig, RackConfig
+from hwtest_rack.models import InstrumentState
+from hwtest_rack.rack import _CAN_CLOSE, _CAN_GET_IDENTITY, _CAN_OPEN, Rack, _capabilities
+
+
+class FakeInstrument:
+    """Instrument whose open() blocks for a while, like a network handshake.
+
+    Instruments sharing a barrier can only get through open() and close()
+    together, which proves that those calls overlap.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        open_delay: float = 0.0,
+        fail: bool = False,
+        close_delay: float = 0.0,
+        barrier: threading.Barrier | None = None,
+        release: threading.Event | None = None,
+        close_release: threading.Event | None = None,
+    ) -> None:
+        self.model = model
+        self.open_delay = open_delay
+        self.close_delay = close_delay
+        self.fail = fail
+        self.barrier = barrier
+        self.release = release
+        self.close_release = close_release
+        self.closed = threading.Event()
+
+    def open(self) -> None:
+        if self.barrier is not None:
+            self.barrier.wait(timeout=5.0)
+        if self.release is not None:
+            self.release.wait(timeout=5.0)
+        time.sleep(self.open_delay)
+        if self.fail:
+            raise ConnectionError(f"{self.model} did not respond")
+
+    def get_identity(self) -> InstrumentIdentity:
+        return InstrumentIdentity(
+            manufacturer="Acme", model=self.model, serial="SN1", firmware="1.0"
+        )
+
+    def close(self) -> None:
+        if self.barrier is not None:
+            self.barrier.wait(timeout=5.0)
+        if self.close_release is not None:
+            self.close_release.wait(timeout=5.0)
+        time.sleep(self.close_delay)
+        self.closed.set()
+
+
+class FakePsu(FakeInstrument):
+    """Instrument whose channels are only reachable by channel ID."""
+
+    channel_ids = frozenset({1})
+
+    def get_channel(self, channel_id: int) -> tuple[str, int]:
+        if channel_id not in self.channel_ids:
+            raise KeyError(channel_id)
+        return (self.model, channel_id)
+
+
+class NamedPsu(FakePsu):
+    """Instrument that also finds channels by logical name."""
+
+    channel_names = frozenset({"main"})
+
+    def get_channel_by_name(self, name: str) -> tuple[str, str] | None:
+        return (self.model, name) if name in self.channel_names else None
+
+
+def _fake_factory(**kwargs: Any) -> FakeInstrument:
+    return FakeInstrument(**kwargs)
+
+
+def _make_rack(*instruments: tuple[str, dict[str, Any]], max_init_concurrency: int = 8) -> Rack:
+    """Create a rack of fake instruments from (name, factory kwargs) pairs."""
+    config = RackConfig(
+        rack_id="test-rack",
+        description="Test",
+        instruments=tuple(
+            InstrumentConfig(
+                name=name,
+                driver="fake.module:create_instrument",
+                identity=ExpectedIdentity("Acme", kwargs["model"]),
+                kwargs=kwargs,
+            )
+            for name, kwargs in instruments
+        ),
+        max_init_concurrency=max_init_concurrency,
+    )
+    return Rack(config)
+
+
+def _initialize(rack: Rack) -> None:
+    """Initialize a rack with the fake driver factory."""
+    with patch("hwtest_rack.rack.load_driver", return_value=_fake_factory):
+        rack.initialize()
+
+
+class TestInitialize:
+    def test_slots(self) -> None:
+        rack = _make_rack(("inst0", {"model": "M"}))
+        for obj in (rack, rack._instruments["inst0"]):
+            assert not hasattr(obj, "__dict__")
+
+    def test_instruments_initialized_concurrently(self) -> None:
+        # Each open() waits for all four, so they only succeed if they overlap
+        barrier = threading.Barrier(4)
+        rack = _make_rack(*((f"inst{i}", {"model": f"M{i}", "barrier": barrier}) for i in range(4)))
+
+        _initialize(rack)
+
+        assert rack.state == "ready"
+        for status in rack.list_instruments():
+            assert status.state is InstrumentState.READY
+
+    def test_concurrency_limit(self) -> None:
+        # Opens meet in pairs, and the counter shows no third one joins them
+        barrier = threading.Barrier(2)
+        lock = threading.Lock()
+        active = peak = 0
+
+        class CountingInstrument(FakeInstrument):
+            def open(self) -> None:
+                nonlocal active, peak
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                try:
+                    super().open()
+                finally:
+                    with lock:
+                        active -= 1
+
+        rack = _make_rack(
+            *((f"inst{i}", {"model": f"M{i}", "barrier": barrier}) for i in range(4)),
+            max_init_concurrency=2,
+        )
+        with patch("hwtest_rack.rack.load_driver", return_value=CountingInstrument):
+            rack.initialize()
+
+        assert rack.state == "ready"
+        assert peak == 2
+
+    def test_one_failure_marks_rack_error(self) -> None:
+        rack = _make_rack(
+            ("good", {"model": "G"}),
+            ("bad", {"model": "B", "fail": True}),
+        )
+
+        _initialize(rack)
+
+        assert rack.state == "error"
+        assert rack.get_instrument("good") is not None
+        assert rack.get_instrument("bad") is None
+        bad = rack.get_instrument_status("bad")
+        assert bad is not None
+        assert bad.state is InstrumentState.ERROR
+        assert bad.error == "B did not respond"
+        assert list(rack._ready) == ["good"]
+
+        rack.close()
+        assert rack.get_instrument("good") is None
+
+    def test_status_keeps_declared_order(self) -> None:
+        names = [f"inst{i}" for i in range(6)]
+        rack = _make_rack(
+            *((name, {"model": name, "open_delay": 0.01 * (6 - i)}) for i, name in enumerate(names))
+        )
+
+        _initialize(rack)
+
+        assert [status.name for status in rack.list_instruments()] == names
+
+    def test_empty_rack(self) -> None:
+        rack = _make_rack()
+
+        _initialize(rack)
+
+        assert rack.state == "ready"
+        assert not rack.list_instruments()
+
+    def test_initialize_without_waiting(self) -> None:
+        release = threading.Event()
+        rack = _make_rack(
+            ("fast", {"model": "F"}),
+            ("slow", {"model": "S", "release": release}),
+        )
+
+        with patch("hwtest_rack.rack.load_driver", return_value=_fake_factory):
+            # The slow open() is still blocked, so initialize() returned early
+            rack.initialize(wait=False)
+            assert rack.state == "initializing"
+            assert rack.get_instrument("fast") is not None
+            slow_status = rack.get_instrument_status("slow")
+            assert slow_status is not None
+            assert slow_status.state is not InstrumentState.READY
+
+            release.set()
+            slow = rack.get_instrument("slow")
+            assert slow is not None
+
+        rack.close()
+        assert rack.state == "closed"
+        assert slow.closed.is_set()
+
+    def test_state_set_when_background_init_finishes(self) -> None:
+        rack = _make_rack(("inst0", {"model": "M", "open_delay": 0.1}))
+
+        with patch("hwtest_rack.rack.load_driver", return_value=_fake_factory):
+            rack.initialize(wait=False)
+            assert rack.state == "initializing"
+            rack.get_instrument("inst0")
+
+        assert rack.state == "ready"
+
+    def test_initialized_log(self, caplog: pytest.LogCaptureFixture) -> None:
+        rack = _make_rack(("inst0", {"model": "M"}))
+
+        with caplog.at_level(logging.INFO, logger="hwtest_rack.rack"):
+            _initialize(rack)
+
+        assert "Instrument inst0 initialized: Acme M (S/N: SN1)" in caplog.messages
+
+
+class TestClose:
+    def test_instruments_closed_concurrently(self) -> None:
+        # Each close() waits for all four, so they only succeed if they overlap
+        barrier = threading.Barrier(4)
+        rack = _make_rack(*((f"inst{i}", {"model": f"M{i}", "barrier": barrier}) for i in range(4)))
+        _initialize(rack)
+
+        rack.close()
+
+        assert rack.state == "closed"
+        for status in rack.list_instruments():
+            assert status.state is InstrumentState.CLOSED
+
+    def test_close_timeout_marks_error(self) -> None:
+        close_release = threading.Event()
+        rack = _make_rack(
+            ("fast", {"model": "F"}),
+            ("hung", {"model": "H", "close_release": close_release}),
+        )
+        _initialize(rack)
+        hung_instance = rack.get_instrument("hung")
+        assert isinstance(hung_instance, FakeInstrument)
+
+        rack.close(timeout=0.1)
+
+        assert rack.state == "closed"
+        fast = rack.get_instrument_status("fast")
+        hung = rack.get_instrument_status("hung")
+        assert fast is not None and hung is not None
+        assert fast.state is InstrumentState.CLOSED
+        assert hung.state is InstrumentState.ERROR
+        assert hung.error == "Close timed out after 0.1 s"
+
+        # A close that finishes after the timeout leaves the error in place
+        close_release.set()
+        assert hung_instance.closed.wait(timeout=5.0)
+        rack._mark_dirty()
+        hung = rack.get_instrument_status("hung")
+        assert hung is not None
+        assert hung.state is InstrumentState.ERROR
+
+    def test_close_timeout_while_initializing(self) -> None:
+        release = threading.Event()
+        rack = _make_rack(("slow", {"model": "S", "release": release}))
+
+        with patch("hwtest_rack.rack.load_driver", return_value=_fake_factory):
+            rack.initialize(wait=False)
+            rack.close(timeout=0.1)
+            assert rack.state == "closed"
+
+            # Initialization finishing late does not reopen the rack
+            release.set()
+            rack._futures["slow"].result(timeout=5.0)
+
+        assert rack.state == "closed"
+        assert rack.get_instrument("slow") is None
+
+    def test_reinitialize_after_close(self) -> None:
+        rack = TestPsuChannel._psu_rack()
+        first = rack.get_instrument("psu")
+        assert rack.get_psu_channel("main") == ("P", 1)
+        rack.close()
+        assert rack.state == "closed"
+
+        with patch("hwtest_rack.rack.load_driver", return_value=FakePsu):
+            rack.initialize()
+
+        assert rack.state == "ready"
+        second = rack.get_instrument("psu")
+        assert second is not None and second is not first
+        assert rack.get_psu_channel("main") == ("P", 1)
+        status = rack.get_instrument_status("psu")
+        assert status is not None
+        assert status.state is InstrumentState.READY
+
+    def test_reinitialize_after_abandoned_init(self) -> None:
+        release = threading.Event()
+        rack = _make_rack(("slow", {"model": "S", "release": release}))
+
+        with patch("hwtest_rack.rack.load_driver", return_value=_fake_factory):
+            rack.initialize(wait=False)
+            abandoned = rack._futures["slow"]
+            rack.close(timeout=0.1)
+
+            release.set()
+            rack.initialize()
+            abandoned.result(timeout=5.0)
+
+        # The abandoned worker's result is dropped, not counted twice
+        assert rack.state == "ready"
+        assert rack._pending == 0
+        assert rack.get_instrument("slow") is not None
+
+    def test_uninitialized_rack(self) -> None:
+        rack = _make_rack(("inst0", {"model": "M"}))
+
+        rack.close()
+
+        assert rack.state == "closed"
+        status = rack.get_instrument_status("inst0")
+        assert status is not None
+        assert status.state is InstrumentState.PENDING
+
+
+class TestStatus:
+    def test_status_cached_until_change(self) -> None:
+        rack = _make_rack(("inst0", {"model": "M"}))
+
+        pending = rack.get_status()
+        assert rack.get_status() is pending
+        assert pending.instruments[0].state is InstrumentState.PENDING
+
+        _initialize(rack)
+        ready = rack.get_status()
+        assert ready is not pending
+        assert ready.state == "ready"
+        assert ready.instruments[0].state is InstrumentState.READY
+        assert rack.get_status() is ready
+
+        rack.close()
+        closed = rack.get_status()
+        assert closed.state == "closed"
+        assert closed.instruments[0].state is InstrumentState.CLOSED
+
+    def test_status_prefix_from_config(self) -> None:
+        rack = _make_rack(("inst0", {"model": "M"}))
+
+        status = rack.get_instrument_status("inst0")
+        assert status is not None
+        assert (
+            status.name,
+            status.driver,
+            status.expected_manufacturer,
+            status.expected_model,
+        ) == ("inst0", "fake.module:create_instrument", "Acme", "M")
+        assert status.identity is None
+
+    def test_identity_model_built_once(self) -> None:
+        rack = _make_rack(("inst0", {"model": "M"}))
+        _initialize(rack)
+
+        first = rack.get_instrument_status("inst0")
+        second = rack.get_instrument_status("inst0")
+        assert first is not None and second is not None
+        assert first.identity is second.identity
+        assert first.identity is not None
+        assert first.identity.serial == "SN1"
+
+
+class TestCapabilities:
+    def test_detected_once_at_init(self) -> None:
+        rack = _make_rack(("inst0", {"model": "M"}))
+        _initialize(rack)
+
+        managed = rack._instruments["inst0"]
+        assert managed.caps == _CAN_OPEN | _CAN_GET_IDENTITY | _CAN_CLOSE
+        assert managed.close_fn == managed.instance.close
+
+    def test_non_callable_attribute_ignored(self) -> None:
+        class NoIdentity(FakeInstrument):
+            get_identity = None  # type: ignore[assignment]
+
+        assert not _capabilities(NoIdentity("M")) & _CAN_GET_IDENTITY
+
+    def test_bare_instrument(self) -> None:
+        assert _capabilities(object()) == 0
+
+        rack = _make_rack(("inst0", {"model": "M"}))
+        with patch("hwtest_rack.rack.load_driver", return_value=lambda **kwargs: object()):
+            rack.initialize()
+
+        assert rack.state == "ready"
+        assert rack.get_instrument("inst0") is not None
+        rack.close()
+        assert rack.state == "closed"
+
+
+class TestPsuChannel:
+    @staticmethod
+    def _psu_rack(driver: type[FakePsu] = FakePsu) -> Rack:
+        rack = _make_rack(("psu", {"model": "P"}))
+        registry = rack.config.channel_registry
+        registry.register(LogicalChannel("main", "psu", 1, ChannelType.PSU))
+        registry.register(LogicalChannel("spare", "psu", 2, ChannelType.PSU))
+        with patch("hwtest_rack.rack.load_driver", return_value=driver):
+            rack.initialize()
+        return rack
+
+    def test_resolution_cached_until_close(self) -> None:
+        rack = self._psu_rack()
+
+        assert rack.get_psu_channel("main") == ("P", 1)
+        assert "main" in rack._psu_cache
+        with patch.object(rack.config.channel_registry, "get") as registry_get:
+            assert rack.get_psu_channel("main") == ("P", 1)
+        registry_get.assert_not_called()
+
+        rack.close()
+        assert not rack._psu_cache
+        assert rack.get_psu_channel("main") is None
+
+    def test_cached_channel_out_of_range(self, caplog: pytest.LogCaptureFixture) -> None:
+        rack = self._psu_rack()
+        assert rack.get_psu_channel("main") == ("P", 1)
+        psu = rack.get_instrument("psu")
+        assert isinstance(psu, FakePsu)
+
+        psu.channel_ids = frozenset()
+        with caplog.at_level(logging.WARNING, logger="hwtest_rack.rack"):
+            assert rack.get_psu_channel("main") is None
+
+        assert "main" not in rack._psu_cache
+        assert "Instrument 'psu' does not support channel access" in caplog.messages
+
+    def test_cached_name_lookup_falls_back_to_id(self) -> None:
+        rack = self._psu_rack(NamedPsu)
+        assert rack.get_psu_channel("main") == ("P", "main")
+        psu = rack.get_instrument("psu")
+        assert isinstance(psu, NamedPsu)
+
+        # Same result as an uncached lookup once the name is unknown
+        psu.channel_names = frozenset()
+        assert rack.get_psu_channel("main") == ("P", 1)
+        rack._psu_cache.clear()
+        assert rack.get_psu_channel("main") == ("P", 1)
+
+    def test_failed_resolution_not_cached(self) -> None:
+        rack = self._psu_rack()
+
+        assert rack.get_psu_channel("spare") is None
+        assert rack.get_psu_channel("missing") is None
+        assert not rack._psu_cache
+
+    def test_list_psu_channels(self) -> None:
+        rack = self._psu_rack()
+
+        assert rack.list_psu_channels() == ["main", "spare"]
+        names = rack._psu_names[1]
+        assert rack.list_psu_channels() == ["main", "spare"]
+        assert rack._psu_names[1] is names
+
+        rack.config.channel_registry.register(LogicalChannel("aux", "psu", 3, ChannelType.PSU))
+        rack.config.channel_registry.register(LogicalChannel("load", "psu", 4, ChannelType.LOAD))
+        assert rack.list_psu_channels() == ["main", "spare", "aux"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 import tempfile
 from unittest.mock import MagicMock, patch
 
@@ -12,7 +13,7 @@ from hwtest_core.types.common import InstrumentIdentity
 
 from hwtest_rack import server
 from hwtest_rack.config import ExpectedIdentity, InstrumentConfig, RackConfig
-from hwtest_rack.models import InstrumentState
+from hwtest_rack.models import InstrumentState, InstrumentStatus, RackStatus
 from hwtest_rack.rack import Rack
 from hwtest_rack.server import create_app
 
@@ -83,6 +84,19 @@ class TestHealthEndpoint:
         data = response.json()
         assert data["status"] == "error"
 
+    def test_health_body_encoded_once(self, client: TestClient, mock_rack: MagicMock) -> None:
+        server._health_json.cache_clear()
+        mock_rack.state = "initializing"
+        with patch.object(server, "_rack", mock_rack):
+            for _ in range(3):
+                assert client.get("/health").json() == {
+                    "status": "initializing",
+                    "rack_id": "test-rack",
+                }
+
+        info = server._health_json.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
 
 class TestStatusEndpoint:
     def test_status(self, client: TestClient, mock_rack: MagicMock) -> None:
@@ -97,6 +111,30 @@ class TestStatusEndpoint:
         assert len(data["instruments"]) == 1
         assert data["instruments"][0]["name"] == "psu01"
 
+    def test_status_json_encoding(self, client: TestClient, mock_rack: MagicMock) -> None:
+        with patch.object(server, "_rack", mock_rack):
+            response = client.get("/status")
+
+        assert response.headers["content-type"] == "application/json"
+        instrument = response.json()["instruments"][0]
+        assert instrument["state"] == "ready"
+        assert instrument["error"] is None
+        assert instrument["identity"]["firmware"] == "1.0"
+
+    def test_status_json_reused_until_status_changes(
+        self, client: TestClient, mock_rack: MagicMock
+    ) -> None:
+        with patch.object(server, "_rack", mock_rack):
+            first = client.get("/status").content
+            assert client.get("/status").content == first
+            cached = server._status_json_cache
+            assert cached is not None
+            assert cached[0] is mock_rack.get_status.return_value
+
+            status = mock_rack.get_status.return_value
+            mock_rack.get_status.return_value = dataclasses.replace(status, state="error")
+            assert client.get("/status").json()["state"] == "error"
+
 
 class TestInstrumentsEndpoint:
     def test_list_instruments(self, client: TestClient, mock_rack: MagicMock) -> None:
@@ -140,6 +178,61 @@ class TestDashboard:
         assert "psu01" in response.text
         assert "B&amp;K Precision" in response.text or "B&K Precision" in response.text
 
+    def test_dashboard_page_structure(self, client: TestClient, mock_rack: MagicMock) -> None:
+        with patch.object(server, "_rack", mock_rack):
+            response = client.get("/")
+
+        text = response.text
+        assert text.startswith("<!DOCTYPE html>")
+        assert "<title>test-rack - hwtest Rack</title>" in text
+        assert '<span class="rack-state" style="color: #28a745;">READY</span>' in text
+        assert "<h2>Instruments (1)</h2>" in text
+        assert text.index("<th>Identity</th>") < text.index("psu01") < text.index("/docs")
+        assert text.rstrip().endswith("</html>")
+
+    def test_dashboard_rendered_once_per_status(
+        self, client: TestClient, mock_rack: MagicMock
+    ) -> None:
+        spy = patch.object(server, "_render_dashboard", wraps=server._render_dashboard)
+        with patch.object(server, "_rack", mock_rack), spy as render:
+            first = client.get("/").text
+            assert client.get("/").text == first
+            assert render.call_count == 1
+
+            status = mock_rack.get_status.return_value
+            mock_rack.get_status.return_value = dataclasses.replace(status, state="error")
+            assert "ERROR" in client.get("/").text
+            assert render.call_count == 2
+
+    def test_dashboard_escapes_text(self) -> None:
+        instrument = InstrumentStatus(
+            name="psu<1>",
+            driver="drv:create",
+            state=InstrumentState.ERROR,
+            expected_manufacturer="A&B",
+            expected_model="M",
+            identity=None,
+            error="<script>alert(1)</script>",
+        )
+        status = RackStatus(rack_id="r&d", description="", state="error", instruments=[instrument])
+
+        text = server._render_dashboard(status).decode()
+
+        assert "<title>r&amp;d - hwtest Rack</title>" in text
+        assert "<strong>psu&lt;1&gt;</strong>" in text
+        assert "Expected: A&amp;B M" in text
+        assert "Error: &lt;script&gt;alert(1)&lt;/script&gt;" in text
+        assert "<script>" not in text
+        assert "(none)" in text
+
+    def test_dashboard_no_instruments(self) -> None:
+        status = RackStatus(rack_id="r", description="d", state="ready", instruments=[])
+
+        text = server._render_dashboard(status).decode()
+
+        assert "<h2>Instruments (0)</h2>" in text
+        assert "No instruments configured" in text
+
 
 class MockInstrument:
     """Mock instrument that satisfies the Instrument protocol."""
@@ -236,3 +329,13 @@ class TestRackIntegration:
         assert status is not None
         assert status.state == InstrumentState.ERROR
         assert "mismatch" in (status.error or "").lower()
+
+
+class TestOpenApi:
+    def test_response_models_in_schema(self, client: TestClient) -> None:
+        response = client.get("/openapi.json")
+
+        assert response.status_code == 200
+        schemas = response.json()["components"]["schemas"]
+        for name in ("HealthResponse", "IdentityModel", "InstrumentStatus", "RackStatus"):
+            assert name in schemas